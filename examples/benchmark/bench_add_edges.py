@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Compare edge loading rates of add_edges_from and add_edges_from_columns.
+
+Usage: bench_add_edges.py [number_of_edges]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import random
+import sys
+import time
+
+import networkx as nx
+
+def rate(m, load):
+    start=time.time()
+    load()
+    return m/(time.time()-start)
+
+if __name__ == '__main__':
+    try:
+        m=int(sys.argv[1])
+    except IndexError:
+        m=1000000
+    n=m/10
+    us=[random.randint(0,n) for i in xrange(m)]
+    vs=[random.randint(0,n) for i in xrange(m)]
+    ws=[random.random() for i in xrange(m)]
+    print "%d edges on %d nodes (edges/second)"%(m,n)
+    print "%-10s %-10s %14s %14s %8s"%("class","weights","add_edges_from",
+                                      "columns","speedup")
+    for cls in (nx.Graph, nx.DiGraph):
+        for weighted in (False, True):
+            if weighted:
+                old=lambda: cls().add_weighted_edges_from(zip(us,vs,ws))
+                new=lambda: cls().add_edges_from_columns(us,vs,ws)
+            else:
+                old=lambda: cls().add_edges_from(zip(us,vs))
+                new=lambda: cls().add_edges_from_columns(us,vs)
+            r_old=rate(m,old)
+            r_new=rate(m,new)
+            print "%-10s %-10s %14.0f %14.0f %7.2fx"%(cls.__name__,
+                weighted,r_old,r_new,r_new/r_old)
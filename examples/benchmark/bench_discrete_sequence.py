@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Compare sampling from a discrete distribution with a cumulative
+distribution and bisect (the former discrete_sequence) against
+AliasSampler, in pure Python and with NumPy.
+
+Usage: bench_discrete_sequence.py [number_of_samples]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import bisect
+import random
+import sys
+import time
+
+from networkx.utils import AliasSampler, cumulative_distribution
+
+def bisect_sequence(n, distribution):
+    cdf=cumulative_distribution(distribution)
+    return [bisect.bisect_left(cdf,random.random())-1 for i in xrange(n)]
+
+def rate(n, f, *args):
+    start=time.time()
+    f(*args)
+    return n/(time.time()-start)
+
+if __name__ == '__main__':
+    try:
+        n=int(sys.argv[1])
+    except IndexError:
+        n=1000000
+    print "%d samples (samples/second)"%n
+    print "%-8s %12s %12s %12s"%("values","bisect","alias","alias numpy")
+    for k in (10,1000,100000):
+        # a power law degree histogram
+        distribution=[1.0/(i+1)**2.5 for i in xrange(k)]
+        sampler=AliasSampler(distribution)
+        try:
+            import numpy
+            numpy_rate="%12.0f"%rate(n,sampler.sample_array,n)
+        except ImportError:
+            numpy_rate="%12s"%"-"
+        print "%-8d %12.0f %12.0f %s"%\
+              (k,rate(n,bisect_sequence,n,distribution),
+               rate(n,sampler.sample,n),numpy_rate)
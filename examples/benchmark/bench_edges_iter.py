@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Compare Graph.edges_iter with the former implementation that kept a
+dict of visited nodes.
+
+Usage: bench_edges_iter.py [number_of_edges]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import random
+import sys
+import time
+
+import networkx as nx
+
+def seen_edges_iter(G, data=False):
+    """The edges_iter of NetworkX 1.0."""
+    seen={}
+    if data:
+        for n,nbrs in G.adj.iteritems():
+            for nbr,data in nbrs.iteritems():
+                if nbr not in seen:
+                    yield (n,nbr,data)
+            seen[n]=1
+    else:
+        for n,nbrs in G.adj.iteritems():
+            for nbr in nbrs:
+                if nbr not in seen:
+                    yield (n,nbr)
+            seen[n] = 1
+
+def rate(edges):
+    start=time.time()
+    m=0
+    for e in edges:
+        m+=1
+    return m/(time.time()-start)
+
+if __name__ == '__main__':
+    try:
+        m=int(sys.argv[1])
+    except IndexError:
+        m=1000000
+    n=m/5
+    print "%d edges on %d nodes (edges/second)"%(m,n)
+    print "%-8s %-6s %12s %12s %8s"%("nodes","data","seen dict",
+                                    "edges_iter","speedup")
+    for label,node in (("int",int),("str",lambda i: "node%010d"%i),
+                       ("tuple",lambda i: (i//1000,i%1000))):
+        G=nx.Graph()
+        G.add_edges_from_columns([node(random.randrange(n)) for i in xrange(m)],
+                                 [node(random.randrange(n)) for i in xrange(m)])
+        for data in (False,True):
+            r_old=rate(seen_edges_iter(G,data))
+            r_new=rate(G.edges_iter(data=data))
+            print "%-8s %-6s %12.0f %12.0f %7.2fx"%(label,data,
+                                                   r_old,r_new,r_new/r_old)
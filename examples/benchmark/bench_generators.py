@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Time the random graph generators against a naive O(n^2) G(n,p) loop
+into Graph.add_edge.
+
+Usage: bench_generators.py [number_of_nodes] [average_degree]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import random
+import sys
+import time
+
+import networkx as nx
+from networkx.utils import powerlaw_sequence
+
+def naive_gnp_random_graph(n, p):
+    G=nx.Graph()
+    G.add_nodes_from(xrange(n))
+    for u in xrange(n):
+        for v in xrange(u):
+            if random.random()<p:
+                G.add_edge(u,v)
+    return G
+
+def timed(name, f, *args, **kwds):
+    start=time.time()
+    result=f(*args,**kwds)
+    elapsed=time.time()-start
+    if hasattr(result,'number_of_edges'):
+        m=result.number_of_edges()
+    else:
+        m=len(result[0])
+    print "%-36s %12d %10.2f"%(name,m,elapsed)
+
+if __name__ == '__main__':
+    try:
+        n=int(sys.argv[1])
+    except IndexError:
+        n=1000000
+    try:
+        k=float(sys.argv[2])
+    except IndexError:
+        k=10.0
+    p=k/(n-1)
+    print "%d nodes, average degree %g"%(n,k)
+    print "%-36s %12s %10s"%("generator","edges","seconds")
+    small=min(n,3000)
+    timed("naive G(n,p), %d nodes"%small,naive_gnp_random_graph,
+          small,k/(small-1))
+    timed("fast_gnp_random_graph, %d nodes"%small,nx.fast_gnp_random_graph,
+          small,k/(small-1),seed=1)
+    timed("gnp_random_edge_columns",nx.gnp_random_edge_columns,n,p,seed=1)
+    timed("fast_gnp_random_graph",nx.fast_gnp_random_graph,n,p,seed=1)
+    timed("fast_gnp_random_graph directed",nx.fast_gnp_random_graph,n,p,
+          seed=1,directed=True)
+    w=[x*k/2 for x in powerlaw_sequence(n,2.5,seed=1)]
+    timed("expected_degree_graph",nx.expected_degree_graph,w,seed=1)
+    seq=nx.create_degree_sequence(n,exponent=2.5,seed=1)
+    timed("configuration_model_edge_columns",
+          nx.configuration_model_edge_columns,seq,seed=1)
+    timed("configuration_model",nx.configuration_model,seq,seed=1)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+Measure the time of "import networkx" in a fresh interpreter.
+
+The drawing and readwrite modules and the release data are loaded on
+first use.  The "eager" row imports networkx and then touches them,
+which is what every import cost before they were made lazy.
+
+Usage: bench_import.py [repetitions]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import subprocess
+import sys
+import time
+
+statements=[("python only","pass"),
+            ("import networkx","import networkx"),
+            ("eager","import networkx; networkx.__version__; "
+                     "networkx.write_dot; networkx.read_gpickle; "
+                     "networkx.read_gbin; networkx.read_csrmap; "
+                     "networkx.read_edgelist; "
+                     "networkx.degree_array(networkx.Graph())"),
+            ]
+
+def run(statement, repeat):
+    """Return the best wall clock time of a fresh interpreter."""
+    best=None
+    for i in xrange(repeat):
+        start=time.time()
+        subprocess.call([sys.executable,'-c',statement])
+        t=time.time()-start
+        if best is None or t<best:
+            best=t
+    return best
+
+if __name__ == '__main__':
+    try:
+        repeat=int(sys.argv[1])
+    except IndexError:
+        repeat=20
+    print "best of %d runs (milliseconds)"%repeat
+    base=run("pass",repeat)
+    print "%-18s %8s %8s"%("statement","total","import")
+    for label,statement in statements:
+        t=run(statement,repeat)
+        print "%-18s %8.1f %8.1f"%(label,1000*t,1000*(t-base))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Time minimum spanning forests of random weighted graphs, comparing
+minimum_spanning_edges with a textbook Kruskal over
+networkx.utils.UnionFind and with minimum_spanning_edges_from on the
+presorted edge stream.
+
+Usage: bench_mst.py [number_of_edges]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import random
+import sys
+import time
+
+import networkx as nx
+from networkx.utils import UnionFind
+
+def textbook_kruskal(G):
+    uf=UnionFind()
+    edges=sorted(G.edges_iter(data=True),key=lambda e: e[2].get('weight',1))
+    for u,v,d in edges:
+        if uf[u]!=uf[v]:
+            uf.union(u,v)
+            yield (u,v,d)
+
+def timing(f, *args, **kwds):
+    start=time.time()
+    for e in f(*args,**kwds):
+        pass
+    return time.time()-start
+
+if __name__ == '__main__':
+    try:
+        m=int(sys.argv[1])
+    except IndexError:
+        m=1000000
+    print "%-8s %10s %12s %12s %12s"%\
+          ("nodes","edges","textbook","kruskal","presorted")
+    for n in (m//100,m//10,m):
+        G=nx.Graph()
+        G.add_edges_from_columns([random.randrange(n) for i in xrange(m)],
+                                 [random.randrange(n) for i in xrange(m)],
+                                 weights=[random.random() for i in xrange(m)])
+        stream=sorted(((u,v,d['weight']) for u,v,d in G.edges_iter(data=True)),
+                      key=lambda e: e[2])
+        print "%-8d %10d %12.2f %12.2f %12.2f"%\
+              (len(G),G.number_of_edges(),timing(textbook_kruskal,G),
+               timing(nx.minimum_spanning_edges,G),
+               timing(nx.minimum_spanning_edges_from,stream,len(G)))
+    print "(seconds; presorted excludes the sort)"
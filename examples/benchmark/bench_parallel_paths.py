@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+Time shortest path lengths from many sources with different numbers of
+worker processes.
+
+Usage: bench_parallel_paths.py [number_of_nodes] [number_of_sources]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import multiprocessing
+import random
+import sys
+import time
+
+import networkx as nx
+
+def rate(k, G, sources, **kwds):
+    start=time.time()
+    for source,dist in nx.parallel_shortest_path_length(G,sources,**kwds):
+        pass
+    return k/(time.time()-start)
+
+if __name__ == '__main__':
+    try:
+        n=int(sys.argv[1])
+    except IndexError:
+        n=20000
+    try:
+        k=int(sys.argv[2])
+    except IndexError:
+        k=200
+    G=nx.Graph()
+    m=5*n
+    G.add_edges_from_columns([random.randrange(n) for i in xrange(m)],
+                             [random.randrange(n) for i in xrange(m)],
+                             weights=[random.random() for i in xrange(m)])
+    sources=random.sample(G.nodes(),min(k,len(G)))
+    k=len(sources)
+    print "%d nodes, %d edges, %d sources, %d CPUs (sources/second)"%\
+          (len(G),G.number_of_edges(),k,multiprocessing.cpu_count())
+    print "%-12s %12s %12s"%("processes","BFS","Dijkstra")
+    processes=1
+    while processes<=multiprocessing.cpu_count():
+        print "%-12d %12.1f %12.1f"%\
+              (processes,rate(k,G,sources,processes=processes),
+               rate(k,G,sources,weight='weight',processes=processes))
+        processes*=2
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+Time drawing a power law sequence with parallel_sequence() for
+different numbers of worker processes, and check that the sequence is
+the same for all of them.
+
+Usage: bench_parallel_sequence.py [length]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import multiprocessing
+import sys
+import time
+
+from networkx.utils import parallel_sequence, powerlaw_sequence
+
+if __name__ == '__main__':
+    try:
+        n=int(sys.argv[1])
+    except IndexError:
+        n=4000000
+    print "%d samples, %d CPUs (samples/second)"%(n,multiprocessing.cpu_count())
+    print "%-12s %12s %12s"%("processes","rate","same")
+    first=None
+    processes=1
+    while processes<=max(2,multiprocessing.cpu_count()):
+        start=time.time()
+        seq=parallel_sequence(powerlaw_sequence,n,seed=12345,args=(2.5,),
+                              processes=processes)
+        elapsed=time.time()-start
+        if first is None:
+            first=seq
+        print "%-12d %12.0f %12s"%(processes,n/elapsed,seq==first)
+        processes*=2
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Compare read_edgelist with a plain loop over Graph.add_edge, and with
+different numbers of worker processes.
+
+Usage: bench_read_edgelist.py [number_of_edges]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+import networkx as nx
+from networkx.readwrite import read_edgelist, write_edgelist
+
+def loop_read(path):
+    """The single-threaded reader the edge list functions replace."""
+    G=nx.Graph()
+    for line in open(path):
+        line=line.split('#')[0]
+        s=line.split()
+        if len(s)>=2:
+            G.add_edge(int(s[0]),int(s[1]))
+    return G
+
+def rate(m, f, *args, **kwds):
+    start=time.time()
+    f(*args,**kwds)
+    return m/(time.time()-start)
+
+if __name__ == '__main__':
+    try:
+        m=int(sys.argv[1])
+    except IndexError:
+        m=1000000
+    n=m/5
+    G=nx.Graph()
+    G.add_edges_from_columns([random.randrange(n) for i in xrange(m)],
+                             [random.randrange(n) for i in xrange(m)])
+    m=G.number_of_edges()
+    fd,path=tempfile.mkstemp(suffix='.edgelist')
+    os.close(fd)
+    try:
+        write_edgelist(G,path)
+        print "%d edges on %d nodes, %d CPUs (edges/second)"%\
+              (m,n,multiprocessing.cpu_count())
+        print "%-24s %12s"%("reader","rate")
+        print "%-24s %12.0f"%("add_edge loop",rate(m,loop_read,path))
+        processes=1
+        while processes<=multiprocessing.cpu_count():
+            print "%-24s %12.0f"%("read_edgelist %d proc"%processes,
+                                  rate(m,read_edgelist,path,nodetype=int,
+                                       processes=processes))
+            processes*=2
+    finally:
+        os.remove(path)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Measure the traversal functions in edges scanned per second, and
+compare BFS with a plain collections.deque implementation.
+
+Usage: bench_traversal.py [number_of_edges]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import random
+import sys
+import time
+from collections import deque
+
+import networkx as nx
+
+def deque_bfs(G, source):
+    """A textbook BFS over G.adj."""
+    dist={source:0}
+    queue=deque([source])
+    while queue:
+        v=queue.popleft()
+        for w in G.adj[v]:
+            if w not in dist:
+                dist[w]=dist[v]+1
+                queue.append(w)
+    return dist
+
+def best(f, *args, **kwds):
+    times=[]
+    for i in range(3):
+        start=time.time()
+        f(*args,**kwds)
+        times.append(time.time()-start)
+    return min(times)
+
+if __name__ == '__main__':
+    try:
+        m=int(sys.argv[1])
+    except IndexError:
+        m=1000000
+    n=m/5
+    G=nx.Graph()
+    G.add_edges_from_columns(range(n),range(1,n)+[0]) # a cycle keeps G connected
+    G.add_edges_from_columns([random.randrange(n) for i in xrange(m-n)],
+                             [random.randrange(n) for i in xrange(m-n)],
+                             weights=[random.random() for i in xrange(m-n)])
+    scanned=2*G.number_of_edges() # each edge is seen from both ends
+    source=0
+    print "%d edges on %d nodes (edges scanned/second)"%(G.number_of_edges(),n)
+    rows=[("deque BFS",best(deque_bfs,G,source)),
+          ("shortest_path_length",
+           best(nx.single_source_shortest_path_length,G,source)),
+          ("shortest_path",best(nx.single_source_shortest_path,G,source)),
+          ("dijkstra_path_length",
+           best(nx.single_source_dijkstra_path_length,G,source))]
+    for label,t in rows:
+        print "%-22s %12.0f"%(label,scanned/t)
+    pairs=[(random.randrange(n),random.randrange(n)) for i in range(100)]
+    start=time.time()
+    for s,t in pairs:
+        nx.bidirectional_shortest_path(G,s,t)
+    print "bidirectional_shortest_path: %.2f ms per pair"%\
+          (1000*(time.time()-start)/len(pairs))
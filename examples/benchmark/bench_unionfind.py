@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Compare UnionFind with ArrayUnionFind on a random stream of edges.
+
+Usage: bench_unionfind.py [number_of_edges]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import random
+import sys
+import time
+
+from networkx.utils import UnionFind, ArrayUnionFind
+
+def dict_union(edges):
+    uf=UnionFind()
+    for u,v in edges:
+        uf.union(u,v)
+    return uf
+
+def array_union(edges):
+    uf=ArrayUnionFind()
+    uf.union_edges(edges)
+    return uf
+
+def rate(m, f, edges):
+    start=time.time()
+    f(edges)
+    return m/(time.time()-start)
+
+if __name__ == '__main__':
+    try:
+        m=int(sys.argv[1])
+    except IndexError:
+        m=1000000
+    print "%d edges (edges/second)"%m
+    print "%-8s %10s %12s %14s %8s"%("nodes","n","UnionFind",
+                                    "ArrayUnionFind","speedup")
+    for label,node in (("int",int),("str",lambda i: "node%010d"%i)):
+        for n in (m/10,m,10*m):
+            edges=[(node(random.randrange(n)),node(random.randrange(n)))
+                   for i in xrange(m)]
+            r_old=rate(m,dict_union,edges)
+            r_new=rate(m,array_union,edges)
+            print "%-8s %10d %12.0f %14.0f %7.2fx"%(label,n,r_old,r_new,
+                                                    r_new/r_old)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Compare the streaming write_dot with rendering to_pydot(G) in memory,
+if pydot is installed.
+
+Usage: bench_write_dot.py [number_of_edges]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+import os
+import sys
+import tempfile
+import time
+
+import networkx as nx
+
+def pydot_write(G, path):
+    """The pydot based writer write_dot replaces."""
+    from networkx.drawing.nx_pydot import to_pydot
+    fh=open(path,'w')
+    fh.write(to_pydot(G).to_string())
+    fh.close()
+
+def rate(m, f, *args, **kwds):
+    start=time.time()
+    f(*args,**kwds)
+    return m/(time.time()-start)
+
+if __name__ == '__main__':
+    try:
+        m=int(sys.argv[1])
+    except IndexError:
+        m=1000000
+    n=m/5
+    G=nx.fast_gnp_random_graph(n,2.0*m/(n*(n-1.0)),seed=1)
+    for u,v,d in G.edges_iter(data=True):
+        d['weight']=u%7
+    m=G.number_of_edges()
+    fd,path=tempfile.mkstemp(suffix='.dot')
+    os.close(fd)
+    try:
+        print "%d edges on %d nodes (edges/second)"%(m,n)
+        print "%-24s %12s"%("writer","rate")
+        print "%-24s %12.0f"%("write_dot",rate(m,nx.write_dot,G,path))
+        try:
+            import pydot
+        except ImportError:
+            print "pydot not installed"
+        else:
+            print "%-24s %12.0f"%("to_pydot().to_string()",
+                                  rate(m,pydot_write,G,path))
+    finally:
+        os.remove(path)
@@ -36,38 +36,77 @@ if sys.version_info[:2] < (2, 4):
 
 del sys
 
-# Release data
-import release 
-
-if release.revision is None:
-    # we probably not running in an svn directory   
-    try:
-        # use release data stored at installatation time.
-        import version
-        __version__ = version.__version__
-        __revision__ = version.__revision__
-        __date__ = version.__date__
-    except ImportError:
-        # version.py was not created or no longer exists
-        __version__ = release.version
-        __revision__ = release.revision
-        __date__ = release.date
-else:
-    # use dynamic values, even if version.py exists
-    __version__ = release.version
-    __revision__ = release.revision
-    __date__ = release.date
-
-__author__   = '%s <%s>\n%s <%s>\n%s <%s>' % \
-              ( release.authors['Hagberg'] + release.authors['Schult'] + \
-                release.authors['Swart'] )
-__license__  = release.license
+# Release data (__version__ etc.) and the drawing and readwrite
+# functions are loaded on first access, see _release_data() and
+# networkx.utils.LazyModule.
+
+def _release_data():
+    """Return the release attributes of the package.
+
+    Looking up the revision probes the file system, so this is only
+    done when one of the attributes is used.
+    """
+    import release
+    data={}
+    if release.revision is None:
+        # we probably not running in an svn directory
+        try:
+            # use release data stored at installatation time.
+            import version
+            data['__version__'] = version.__version__
+            data['__revision__'] = version.__revision__
+            data['__date__'] = version.__date__
+        except ImportError:
+            # version.py was not created or no longer exists
+            data['__version__'] = release.version
+            data['__revision__'] = release.revision
+            data['__date__'] = release.date
+    else:
+        # use dynamic values, even if version.py exists
+        data['__version__'] = release.version
+        data['__revision__'] = release.revision
+        data['__date__'] = release.date
+    data['__author__'] = '%s <%s>\n%s <%s>\n%s <%s>' % \
+                         ( release.authors['Hagberg'] + \
+                           release.authors['Schult'] + \
+                           release.authors['Swart'] )
+    data['__license__'] = release.license
+    data['release'] = release
+    return data
+
+# the result of _release_data(), filled on first use
+_release_cache={}
+
+def _release_attr(name):
+    def load():
+        if not _release_cache:
+            _release_cache.update(_release_data())
+        return _release_cache[name]
+    return load
 
 from exception import  *
 
 from classes import *
-from drawing import *
+from algorithms import *
+from generators import *
+from relabel import *
 
 import classes
+import algorithms
+import generators
 import drawing
+import readwrite
+
+import sys as _sys
+from utils import LazyModule as _LazyModule
+
+_attrs={}
+for _name in ('__version__','__revision__','__date__','__author__',
+              '__license__','release'):
+    _attrs[_name]=_release_attr(_name)
+for _name in drawing.__all__:
+    _attrs[_name]='networkx.drawing'
+for _name in readwrite.__all__:
+    _attrs[_name]='networkx.readwrite'
 
+_sys.modules[__name__]=_LazyModule(_sys.modules[__name__],_attrs)
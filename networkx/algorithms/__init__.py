@@ -0,0 +1,8 @@
+"""
+Graph algorithms.
+"""
+from components import *
+from traversal import *
+from parallel import *
+from core import *
+from mst import *
@@ -0,0 +1,400 @@
+"""
+Connected components.
+
+The components of a Graph, and the weakly connected components of a
+DiGraph, are found by breadth-first search over the adjacency dicts.
+The search is iterative and the list of nodes of each component is
+also its search queue, so no recursion limit applies and nothing is
+allocated per node beyond the entry in that list and in the set of
+seen nodes.
+
+connected_components_from_edges() finds components of a stream of
+edges with a union-find structure without building a graph.
+
+Components are returned as lists of nodes, largest first; component
+labels are positions in that order.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['connected_components', 'number_connected_components',
+           'is_connected', 'node_connected_component',
+           'connected_component_labels', 'connected_component_sizes',
+           'largest_connected_component',
+           'weakly_connected_components',
+           'number_weakly_connected_components', 'is_weakly_connected',
+           'weakly_connected_component_labels',
+           'largest_weakly_connected_component',
+           'connected_components_from_edges', 'ConnectivityIndex']
+
+from networkx.exception import NetworkXError
+from networkx.utils import ArrayUnionFind
+
+def _undirected(G, name, alternative):
+    if G.is_directed():
+        raise NetworkXError(\
+            "%s() is not defined for directed graphs, use %s()."\
+            %(name,alternative))
+
+def _directed(G, name, alternative):
+    if not G.is_directed():
+        raise NetworkXError(\
+            "%s() is not defined for undirected graphs, use %s()."\
+            %(name,alternative))
+
+def _component(adjs, source, seen):
+    """Return the list of nodes reachable from source in the union of
+    the adjacency dicts adjs, adding them to the set seen.
+    """
+    component=[source]
+    seen.add(source)
+    i=0
+    if len(adjs)==1:
+        adj=adjs[0]
+        while i<len(component):
+            for nbr in adj[component[i]]:
+                if nbr not in seen:
+                    seen.add(nbr)
+                    component.append(nbr)
+            i+=1
+    else:
+        while i<len(component):
+            n=component[i]
+            for adj in adjs:
+                for nbr in adj[n]:
+                    if nbr not in seen:
+                        seen.add(nbr)
+                        component.append(nbr)
+            i+=1
+    return component
+
+def _components(adjs):
+    """Return the components of the union of adjs, largest first."""
+    seen=set()
+    components=[]
+    for source in adjs[0]:
+        if source not in seen:
+            components.append(_component(adjs,source,seen))
+    components.sort(key=len,reverse=True)
+    return components
+
+def _labels(components):
+    labels={}
+    for i,component in enumerate(components):
+        for n in component:
+            labels[n]=i
+    return labels
+
+def connected_components(G):
+    """Return the connected components of the undirected graph G.
+
+    The components are lists of nodes, sorted by size with the
+    largest first.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_path([0,1,2])
+    >>> G.add_edge(3,4)
+    >>> [sorted(c) for c in nx.connected_components(G)]
+    [[0, 1, 2], [3, 4]]
+    """
+    _undirected(G,'connected_components',
+                'weakly_connected_components')
+    return _components((G.adj,))
+
+def number_connected_components(G):
+    """Return the number of connected components of G."""
+    return len(connected_components(G))
+
+def is_connected(G):
+    """Return True if the undirected graph G is connected.
+
+    The null graph (no nodes) raises NetworkXError.
+    """
+    _undirected(G,'is_connected','is_weakly_connected')
+    if len(G)==0:
+        raise NetworkXError(\
+            "Connectivity is undefined for the null graph.")
+    return len(_component((G.adj,),iter(G.adj).next(),set()))==len(G)
+
+def node_connected_component(G, n):
+    """Return the list of nodes in the connected component of n."""
+    _undirected(G,'node_connected_component',
+                'weakly_connected_components')
+    if n not in G:
+        raise NetworkXError("The node %s is not in the graph."%(n,))
+    return _component((G.adj,),n,set())
+
+def connected_component_labels(G):
+    """Return a dict mapping each node of G to its component number.
+
+    Components are numbered from 0 by decreasing size, as in
+    connected_components().
+    """
+    return _labels(connected_components(G))
+
+def connected_component_sizes(G):
+    """Return the sizes of the connected components, largest first."""
+    return map(len,connected_components(G))
+
+def largest_connected_component(G, view=False):
+    """Return the subgraph induced by the largest connected component.
+
+    If view is True a read-only view is returned instead of a copy,
+    see G.subgraph().
+    """
+    components=connected_components(G)
+    if components:
+        nodes=components[0]
+    else:
+        nodes=[]
+    return G.subgraph(nodes,view=view)
+
+def weakly_connected_components(G):
+    """Return the weakly connected components of the directed graph G.
+
+    The components are lists of nodes, sorted by size with the
+    largest first.
+    """
+    _directed(G,'weakly_connected_components','connected_components')
+    return _components((G.succ,G.pred))
+
+def number_weakly_connected_components(G):
+    """Return the number of weakly connected components of G."""
+    return len(weakly_connected_components(G))
+
+def is_weakly_connected(G):
+    """Return True if the directed graph G is weakly connected.
+
+    The null graph (no nodes) raises NetworkXError.
+    """
+    _directed(G,'is_weakly_connected','is_connected')
+    if len(G)==0:
+        raise NetworkXError(\
+            "Connectivity is undefined for the null graph.")
+    return len(_component((G.succ,G.pred),iter(G.succ).next(),set()))\
+           ==len(G)
+
+def weakly_connected_component_labels(G):
+    """Return a dict mapping each node of G to its weak component number.
+
+    Components are numbered from 0 by decreasing size, as in
+    weakly_connected_components().
+    """
+    return _labels(weakly_connected_components(G))
+
+def largest_weakly_connected_component(G, view=False):
+    """Return the subgraph induced by the largest weak component.
+
+    If view is True a read-only view is returned instead of a copy,
+    see G.subgraph().
+    """
+    components=weakly_connected_components(G)
+    if components:
+        nodes=components[0]
+    else:
+        nodes=[]
+    return G.subgraph(nodes,view=view)
+
+def connected_components_from_edges(edges, nodes=None):
+    """Return the connected components of a stream of edges.
+
+    The edges (u,v) are merged in a union-find structure, so the graph
+    is never built; memory is linear in the number of nodes.  Nodes
+    given in nodes but in no edge form components of their own.
+    Components are returned as by connected_components(); edge
+    direction is ignored.
+
+    >>> import networkx as nx
+    >>> [sorted(c) for c in nx.connected_components_from_edges([(0,1),(2,3),(1,4)])]
+    [[0, 1, 4], [2, 3]]
+    """
+    uf=ArrayUnionFind(nodes)
+    uf.union_edges(edges)
+    components=uf.components()
+    components.sort(key=len,reverse=True)
+    return components
+
+
+class ConnectivityIndex(object):
+    """Connected components of a graph, maintained under changes.
+
+    ConnectivityIndex(G) computes the components of G (weakly
+    connected components if G is directed) and attaches itself to G,
+    whose methods that add or remove nodes and edges then keep it up
+    to date:
+
+    - Adding an edge between two components relabels the nodes of the
+      smaller one, so each node is relabeled O(log n) times over any
+      sequence of insertions.
+    - Removing an edge or a node may split a component.  The component
+      is only marked; it is searched again (and split if needed) when
+      a query next touches it.
+
+    connected() and component_of() then take near constant time.
+    Call close() to detach the index from G.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_path([0,1,2])
+    >>> C=nx.ConnectivityIndex(G)
+    >>> C.connected(0,2)
+    True
+    >>> G.remove_edge(1,2)
+    >>> C.connected(0,2)
+    False
+    """
+    def __init__(self, G):
+        self.graph=G
+        self._build()
+        G._connectivity=self
+
+    def close(self):
+        """Detach the index from its graph."""
+        if self.graph._connectivity is self:
+            del self.graph._connectivity
+
+    def _adjs(self):
+        G=self.graph
+        if G.is_directed():
+            return (G.succ,G.pred)
+        return (G.adj,)
+
+    def _build(self):
+        self._label={}    # node -> component id
+        self._members={}  # component id -> set of nodes
+        self._dirty=set() # ids of components that may have split
+        self._next=0
+        for component in _components(self._adjs()):
+            self._new_component(component)
+
+    def _new_component(self, nodes):
+        cid=self._next
+        self._next+=1
+        self._members[cid]=set(nodes)
+        label=self._label
+        for n in nodes:
+            label[n]=cid
+        return cid
+
+    def _repair(self, cid):
+        """Split component cid into its actual components."""
+        nodes=self._members[cid]
+        self._dirty.discard(cid)
+        adjs=self._adjs()
+        seen=set()
+        components=[]
+        for n in nodes:
+            if n not in seen:
+                components.append(_component(adjs,n,seen))
+        if len(components)==1:
+            return
+        # the largest part keeps the id, the others are relabeled
+        components.sort(key=len,reverse=True)
+        self._members[cid]=set(components[0])
+        for component in components[1:]:
+            self._new_component(component)
+
+    def _find(self, n):
+        try:
+            cid=self._label[n]
+        except (KeyError,TypeError):
+            raise NetworkXError("The node %s is not in the graph."%(n,))
+        if cid in self._dirty:
+            self._repair(cid)
+            cid=self._label[n]
+        return cid
+
+    def component_of(self, n):
+        """Return the id of the component containing node n.
+
+        Ids are ints.  Two nodes are connected if and only if they have
+        the same id; an id may change when the graph changes.
+        """
+        return self._find(n)
+
+    def connected(self, u, v):
+        """Return True if there is a path between u and v."""
+        return self._find(u)==self._find(v)
+
+    def component(self, n):
+        """Return the set of nodes in the component of node n."""
+        return set(self._members[self._find(n)])
+
+    def number_of_components(self):
+        """Return the number of components."""
+        for cid in list(self._dirty):
+            self._repair(cid)
+        return len(self._members)
+
+    # hooks called by the graph classes after each change
+
+    def _add_node(self, n):
+        if n not in self._label:
+            self._new_component((n,))
+
+    def _add_nodes(self, nodes):
+        label=self._label
+        for n in nodes:
+            if n not in label:
+                self._new_component((n,))
+
+    def _add_edge(self, u, v):
+        self._add_node(u)
+        self._add_node(v)
+        cu=self._label[u]
+        cv=self._label[v]
+        if cu==cv:
+            return
+        members=self._members
+        if len(members[cu])<len(members[cv]):
+            cu,cv=cv,cu
+        # merge the smaller component cv into cu
+        small=members.pop(cv)
+        label=self._label
+        for n in small:
+            label[n]=cu
+        members[cu].update(small)
+        if cv in self._dirty:
+            self._dirty.discard(cv)
+            self._dirty.add(cu)
+
+    def _add_edges(self, edges):
+        for e in edges:
+            self._add_edge(e[0],e[1])
+
+    def _remove_edge(self, u, v):
+        if u!=v:
+            self._dirty.add(self._label[u])
+
+    def _remove_edges(self, edges):
+        label=self._label
+        dirty=self._dirty
+        for e in edges:
+            u=e[0]
+            if u!=e[1] and u in label:
+                dirty.add(label[u])
+
+    def _remove_node(self, n):
+        cid=self._label.pop(n,None)
+        if cid is None:
+            return
+        members=self._members[cid]
+        members.discard(n)
+        if members:
+            self._dirty.add(cid)
+        else:
+            del self._members[cid]
+            self._dirty.discard(cid)
+
+    def _remove_nodes(self, nodes):
+        for n in nodes:
+            self._remove_node(n)
+
+    def _clear(self):
+        self._build()
@@ -0,0 +1,120 @@
+"""
+Cores of graphs.
+
+The k-core of a graph is its largest subgraph in which every node has
+degree at least k, and the core number of a node is the largest k
+such that it belongs to the k-core.  core_number() computes the core
+numbers of all nodes in O(V+E) time with the algorithm of Batagelj
+and Zaversnik: the nodes are kept in a list sorted by their current
+degree, with the start of each degree block recorded, and removing a
+node moves each of its neighbors of larger degree one block down in
+constant time.
+
+For a DiGraph the degree of a node is the sum of its in- and
+out-degree.  Core numbers are not defined for graphs with self-loops.
+
+Reference: V. Batagelj and M. Zaversnik, An O(m) Algorithm for Cores
+Decomposition of Networks, 2003, http://arxiv.org/abs/cs.DS/0310049
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['core_number', 'k_core']
+
+from networkx.exception import NetworkXError
+
+def core_number(G):
+    """Return a dict of the core number of each node of G.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_cycle([0,1,2])
+    >>> G.add_edge(2,3)
+    >>> sorted(nx.core_number(G).items())
+    [(0, 2), (1, 2), (2, 2), (3, 1)]
+    """
+    if G.number_of_selfloops()>0:
+        raise NetworkXError(\
+            "core_number() is not defined for graphs with self-loops.")
+    if G.is_directed():
+        adjs=(G.succ,G.pred)
+        degree=dict((n,len(nbrs)+len(G.pred[n]))
+                    for n,nbrs in G.succ.iteritems())
+    else:
+        adjs=(G.adj,)
+        degree=dict((n,len(nbrs)) for n,nbrs in G.adj.iteritems())
+    if not degree:
+        return {}
+    # sort the nodes by degree with a counting sort, bins[d] is the
+    # position of the first node of degree d
+    maxdegree=max(degree.itervalues())
+    bins=[0]*(maxdegree+1)
+    for d in degree.itervalues():
+        bins[d]+=1
+    start=0
+    for d in xrange(maxdegree+1):
+        start,bins[d]=start+bins[d],start
+    nodes=[None]*len(degree)
+    pos={}
+    for n,d in degree.iteritems():
+        nodes[bins[d]]=n
+        pos[n]=bins[d]
+        bins[d]+=1
+    for d in xrange(maxdegree,0,-1):
+        bins[d]=bins[d-1]
+    bins[0]=0
+    # take the nodes in order of degree; the degree of a node when it
+    # is taken is its core number
+    core=degree
+    for v in nodes:
+        cv=core[v]
+        for adj in adjs:
+            for u in adj[v]:
+                cu=core[u]
+                if cu>cv:
+                    # swap u with the first node of its block and move
+                    # the block start past it
+                    pu=pos[u]
+                    pw=bins[cu]
+                    w=nodes[pw]
+                    if pu!=pw:
+                        nodes[pu]=w
+                        pos[w]=pu
+                        nodes[pw]=u
+                        pos[u]=pw
+                    bins[cu]+=1
+                    core[u]=cu-1
+    return core
+
+def k_core(G, k=None, core=None, view=False):
+    """Return the k-core of G.
+
+    Parameters
+    ----------
+    G : Graph or DiGraph
+    k : int, optional
+       Default the largest k for which the k-core is not empty.
+    core : dict, optional
+       Core numbers of G from core_number(), to avoid computing them
+       again.
+    view : bool
+       If True return a read-only view of G (see subgraph()) instead
+       of a new graph.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_cycle([0,1,2])
+    >>> G.add_edge(2,3)
+    >>> sorted(nx.k_core(G).nodes())
+    [0, 1, 2]
+    """
+    if core is None:
+        core=core_number(G)
+    if k is None:
+        k=max(core.itervalues()) if core else 0
+    return G.subgraph([n for n,c in core.iteritems() if c>=k],view=view)
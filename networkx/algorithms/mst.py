@@ -0,0 +1,129 @@
+"""
+Minimum spanning forests.
+
+Kruskal's algorithm: the edges are taken in order of increasing weight
+and an edge is kept if it joins two trees of the forest built so far,
+which an ArrayUnionFind tells in nearly constant time.  Edges are
+yielded as they are kept, and the scan stops once a spanning tree of
+all nodes (V-1 edges) is found.
+
+minimum_spanning_edges_from() works on a stream of edges already
+sorted by weight, e.g. read from an externally sorted file, so the
+graph never has to be built.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['minimum_spanning_edges', 'minimum_spanning_tree',
+           'minimum_spanning_edges_from']
+
+from networkx.exception import NetworkXError
+from networkx.utils import ArrayUnionFind
+
+def _sorted_edges(G, weight):
+    """Return the edges (u,v,data) of G sorted by weight."""
+    edges=list(G.edges_iter(data=True))
+    weights=[d.get(weight,1) for u,v,d in edges]
+    try:
+        import numpy
+        w=numpy.array(weights)
+        if w.dtype.kind not in 'iuf':
+            raise TypeError
+        order=numpy.argsort(w,kind='mergesort').tolist()
+    except (ImportError,TypeError,ValueError):
+        order=sorted(xrange(len(edges)),key=weights.__getitem__)
+    return [edges[i] for i in order]
+
+def _kruskal(edges, n):
+    """Yield the edges of edges (sorted by weight) that join two trees,
+    stopping after n of them if n is not None."""
+    if n is not None and n<=0:
+        return
+    count=0
+    for e in ArrayUnionFind().union_edges_iter(edges):
+        yield e
+        count+=1
+        if count==n:
+            break
+
+def minimum_spanning_edges(G, weight='weight', data=True):
+    """Yield the edges of a minimum spanning forest of G.
+
+    Parameters
+    ----------
+    G : Graph
+    weight : string
+       Edge attribute holding the weight, default 1.
+    data : bool
+       If True yield (u,v,data) tuples, otherwise (u,v).
+
+    The edges are yielded in order of increasing weight.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_weighted_edges_from([(0,1,3),(1,2,1),(0,2,2),(3,4,1)])
+    >>> sorted(nx.minimum_spanning_edges(G,data=False))
+    [(0, 2), (1, 2), (3, 4)]
+    """
+    if G.is_directed():
+        raise NetworkXError(\
+            "minimum_spanning_edges() is not defined for directed graphs.")
+    edges=_kruskal(_sorted_edges(G,weight),len(G)-1)
+    if data:
+        return edges
+    return ((e[0],e[1]) for e in edges)
+
+def minimum_spanning_tree(G, weight='weight'):
+    """Return a minimum spanning forest of G as a Graph.
+
+    The forest has all nodes of G, with their attributes, and the edges
+    of minimum_spanning_edges() with copies of their data.
+    """
+    T=G.__class__()
+    T.name="Minimum spanning forest of (%s)"%(G.name)
+    T.graph=G.graph.copy()
+    for n,d in G.nodes_iter(data=True):
+        T.add_node(n,d)
+    T.add_edges_from(minimum_spanning_edges(G,weight,data=True))
+    return T
+
+def minimum_spanning_edges_from(edges, number_of_nodes=None):
+    """Yield the edges of a minimum spanning forest of a stream of edges.
+
+    Parameters
+    ----------
+    edges : iterable
+       Tuples (u,v,w,...) with the weight w third, in order of
+       increasing weight.  NetworkXError is raised if the order is
+       wrong.
+    number_of_nodes : int, optional
+       If given, stop once number_of_nodes-1 edges, a spanning tree,
+       are found.
+
+    The tuples of the forest are yielded as they are found.
+
+    >>> import networkx as nx
+    >>> list(nx.minimum_spanning_edges_from([(0,1,1),(1,2,2),(0,2,3)]))
+    [(0, 1, 1), (1, 2, 2)]
+    """
+    if number_of_nodes is None:
+        n=None
+    else:
+        n=number_of_nodes-1
+    return _kruskal(_checked(edges),n)
+
+def _checked(edges):
+    """Yield edges, checking that their weights do not decrease."""
+    last=None
+    for e in edges:
+        w=e[2]
+        if last is not None and w<last:
+            raise NetworkXError(\
+                "Edges are not sorted by weight: %s after %s."%(w,last))
+        last=w
+        yield e
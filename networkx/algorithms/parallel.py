@@ -0,0 +1,156 @@
+"""
+Shortest paths from many sources in a process pool.
+
+The sources are split into chunks that worker processes search
+independently with the functions of networkx.algorithms.traversal;
+results are yielded as the chunks finish.
+
+The graph is sent to each worker once, not with every task.  Where
+processes are created by fork (Unix) the workers inherit it from the
+parent without any copying until pages are written.  Elsewhere each
+worker receives a compact copy holding only the adjacency structure
+(and the weight attribute if one is used) when it starts.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['parallel_shortest_path_length', 'parallel_shortest_path']
+
+import os
+import sys
+
+from networkx.algorithms.traversal import \
+     single_source_shortest_path_length, single_source_shortest_path, \
+     single_source_dijkstra_path_length, single_source_dijkstra
+
+# graph searched by the worker processes, set by the parent before
+# forking or by _init_worker()
+_graph=None
+
+def _init_worker(G):
+    global _graph
+    _graph=G
+
+def _search(task):
+    """Run the search for a chunk of sources in a worker process."""
+    paths,sources,cutoff,weight=task
+    return [(source,_single_source(_graph,source,paths,cutoff,weight))
+            for source in sources]
+
+def _single_source(G, source, paths, cutoff, weight):
+    if weight is None:
+        if paths:
+            return single_source_shortest_path(G,source,cutoff=cutoff)
+        return single_source_shortest_path_length(G,source,cutoff=cutoff)
+    if paths:
+        return single_source_dijkstra(G,source,cutoff=cutoff,
+                                      weight=weight)[1]
+    return single_source_dijkstra_path_length(G,source,cutoff=cutoff,
+                                              weight=weight)
+
+def _compact(G, weight):
+    """Return a copy of G with only the adjacency structure (and the
+    weight attribute) for sending to a worker process."""
+    H=G.__class__()
+    empty={}  # shared by all edges, pickled once
+    adj={}
+    for u,nbrs in G.adj.iteritems():
+        if weight is None:
+            adj[u]=dict.fromkeys(nbrs,empty)
+        else:
+            adj[u]=dict((v,{weight:d.get(weight,1)})
+                        for v,d in nbrs.iteritems())
+    H.adj=adj
+    H.edge=adj
+    if G.is_directed():
+        H.succ=adj
+    return H
+
+def _run(G, sources, paths, cutoff, weight, processes, chunksize):
+    """Yield (source, result) pairs for the sources."""
+    global _graph
+    if sources is None:
+        sources=G.nodes()
+    else:
+        sources=list(sources)
+    if processes is None:
+        try:
+            import multiprocessing
+            processes=multiprocessing.cpu_count()
+        except (ImportError,NotImplementedError):
+            processes=1
+    if processes<=1 or len(sources)<=1:
+        for source in sources:
+            yield (source,_single_source(G,source,paths,cutoff,weight))
+        return
+    if chunksize is None:
+        # a few chunks per process balances the load
+        chunksize=max(1,len(sources)//(4*processes))
+    tasks=[(paths,sources[i:i+chunksize],cutoff,weight)
+           for i in xrange(0,len(sources),chunksize)]
+    import multiprocessing
+    if hasattr(os,'fork') and sys.platform!='win32':
+        # the workers inherit the graph when the pool forks them
+        _graph=G
+        try:
+            pool=multiprocessing.Pool(processes)
+        finally:
+            _graph=None
+    else:
+        pool=multiprocessing.Pool(processes,_init_worker,
+                                  (_compact(G,weight),))
+    try:
+        for results in pool.imap_unordered(_search,tasks):
+            for result in results:
+                yield result
+        pool.close()
+    finally:
+        pool.terminate()
+
+def parallel_shortest_path_length(G, sources=None, cutoff=None, weight=None,
+                                  processes=None, chunksize=None):
+    """Return an iterator of (source, {node: distance}) pairs.
+
+    Parameters
+    ----------
+    G : Graph or DiGraph
+       G must not change while the iterator is used.
+    sources : iterable of nodes, optional
+       Default all nodes of G.
+    cutoff : number, optional
+       Only find nodes at distance at most cutoff.
+    weight : string, optional
+       If None (default) distances are numbers of edges (breadth-first
+       search), otherwise weighted distances with the weights read from
+       this edge attribute (Dijkstra's algorithm).
+    processes : int, optional
+       Number of worker processes, default the number of CPUs.  With
+       processes=1 the searches run in this process.
+    chunksize : int, optional
+       Number of sources per task.
+
+    The pairs are yielded in the order the tasks finish, not in the
+    order of sources.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_path([0,1,2])
+    >>> d=dict(nx.parallel_shortest_path_length(G,processes=2))
+    >>> d[0][2]
+    2
+    """
+    return _run(G,sources,False,cutoff,weight,processes,chunksize)
+
+def parallel_shortest_path(G, sources=None, cutoff=None, weight=None,
+                           processes=None, chunksize=None):
+    """Return an iterator of (source, {node: path}) pairs.
+
+    Paths are lists of nodes.  See parallel_shortest_path_length() for
+    the arguments.
+    """
+    return _run(G,sources,True,cutoff,weight,processes,chunksize)
@@ -0,0 +1,276 @@
+"""
+Breadth-first search and shortest paths.
+
+Unweighted distances are found by breadth-first search, level by
+level over the adjacency dicts (successors for a DiGraph).
+Point-to-point paths use a bidirectional search that grows the
+smaller of the two frontiers, forward over successors and backward
+over predecessors.  Weighted distances are found by Dijkstra's
+algorithm with a binary heap, reading edge weights from the 'weight'
+attribute (default 1).
+
+All searches are iterative.  The single-source searches stop early at
+a cutoff distance or once every node of a set of targets is reached.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['single_source_shortest_path_length',
+           'single_source_shortest_path',
+           'bidirectional_shortest_path',
+           'single_source_dijkstra_path_length',
+           'single_source_dijkstra',
+           'dijkstra_path', 'dijkstra_path_length']
+
+from heapq import heappush, heappop
+from networkx.exception import NetworkXError
+
+def _check_source(G, source):
+    if source not in G:
+        raise NetworkXError("The node %s is not in the graph."%(source,))
+
+def _targets(targets):
+    """Return the set of targets, or None."""
+    if targets is None:
+        return None
+    return set(targets)
+
+def _bfs_levels(G, source, cutoff, targets, tree=None):
+    """Return {node: distance} for the nodes found by BFS from source.
+
+    If tree is a list, (node, predecessor) pairs are appended to it in
+    the order the nodes are found.
+    """
+    _check_source(G,source)
+    adj=G.adj
+    dist={source:0}
+    remaining=_targets(targets)
+    if remaining is not None:
+        remaining.discard(source)
+        if not remaining:
+            return dist
+    level=0
+    nextlevel=[source]
+    while nextlevel:
+        if cutoff is not None and level>=cutoff:
+            break
+        thislevel=nextlevel
+        nextlevel=[]
+        level+=1
+        for v in thislevel:
+            for w in adj[v]:
+                if w not in dist:
+                    dist[w]=level
+                    nextlevel.append(w)
+                    if tree is not None:
+                        tree.append((w,v))
+                    if remaining is not None and w in remaining:
+                        remaining.discard(w)
+                        if not remaining:
+                            return dist
+    return dist
+
+def single_source_shortest_path_length(G, source, cutoff=None, targets=None):
+    """Return a dict of the number of edges of shortest paths from source.
+
+    Parameters
+    ----------
+    G : Graph or DiGraph
+       For a DiGraph paths follow the edge directions.
+    source : node
+    cutoff : int, optional
+       Only find nodes at distance at most cutoff.
+    targets : iterable of nodes, optional
+       Stop as soon as all of these nodes are found; the result then
+       holds the nodes found so far.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_path([0,1,2,3])
+    >>> sorted(nx.single_source_shortest_path_length(G,0,cutoff=2).items())
+    [(0, 0), (1, 1), (2, 2)]
+    """
+    return _bfs_levels(G,source,cutoff,targets)
+
+def _paths(source, tree):
+    """Return the paths from source along the (node, predecessor)
+    pairs of tree, where each predecessor appears before its nodes."""
+    paths={source:[source]}
+    for v,u in tree:
+        paths[v]=paths[u]+[v]
+    return paths
+
+def single_source_shortest_path(G, source, cutoff=None, targets=None):
+    """Return a dict of shortest paths (lists of nodes) from source.
+
+    See single_source_shortest_path_length() for the arguments.
+    """
+    tree=[]
+    _bfs_levels(G,source,cutoff,targets,tree)
+    return _paths(source,tree)
+
+def bidirectional_shortest_path(G, source, target):
+    """Return a shortest path (list of nodes) from source to target.
+
+    Searches forward from source and backward from target, always
+    expanding the smaller frontier, so only a small part of the graph
+    is usually visited.  Raises NetworkXError if there is no path.
+    """
+    _check_source(G,source)
+    _check_source(G,target)
+    if source==target:
+        return [source]
+    if G.is_directed():
+        Gsucc=G.succ
+        Gpred=G.pred
+    else:
+        Gsucc=Gpred=G.adj
+    pred={source:None}  # forward tree
+    succ={target:None}  # backward tree
+    forward=[source]
+    reverse=[target]
+    meet=None
+    while forward and reverse and meet is None:
+        if len(forward)<=len(reverse):
+            thislevel=forward
+            forward=[]
+            for v in thislevel:
+                for w in Gsucc[v]:
+                    if w not in pred:
+                        pred[w]=v
+                        if w in succ:
+                            meet=w
+                            break
+                        forward.append(w)
+                if meet is not None:
+                    break
+        else:
+            thislevel=reverse
+            reverse=[]
+            for v in thislevel:
+                for w in Gpred[v]:
+                    if w not in succ:
+                        succ[w]=v
+                        if w in pred:
+                            meet=w
+                            break
+                        reverse.append(w)
+                if meet is not None:
+                    break
+    if meet is None:
+        raise NetworkXError("No path between %s and %s."%(source,target))
+    path=[]
+    w=meet
+    while w is not None:
+        path.append(w)
+        w=pred[w]
+    path.reverse()
+    w=succ[meet]
+    while w is not None:
+        path.append(w)
+        w=succ[w]
+    return path
+
+def _dijkstra(G, source, cutoff, targets, weight, pred=None):
+    """Return ({node: distance}, [nodes in order of distance]).
+
+    If pred is a dict it is filled with the predecessor of each node
+    on a shortest path.
+    """
+    _check_source(G,source)
+    adj=G.adj
+    dist={}       # final distances
+    seen={source:0}
+    order=[]
+    remaining=_targets(targets)
+    heap=[(0,0,source)]
+    count=1       # tie breaker, nodes need not be comparable
+    while heap:
+        d,c,v=heappop(heap)
+        if v in dist:
+            continue  # already reached by a shorter path
+        dist[v]=d
+        order.append(v)
+        if remaining is not None:
+            remaining.discard(v)
+            if not remaining:
+                break
+        for w,data in adj[v].iteritems():
+            vw=d+data.get(weight,1)
+            if vw<d:
+                raise NetworkXError(\
+                    "Negative weight on edge %s-%s."%(v,w))
+            if cutoff is not None and vw>cutoff:
+                continue
+            if w not in seen or vw<seen[w]:
+                seen[w]=vw
+                heappush(heap,(vw,count,w))
+                count+=1
+                if pred is not None:
+                    pred[w]=v
+    return dist,order
+
+def single_source_dijkstra_path_length(G, source, cutoff=None,
+                                       targets=None, weight='weight'):
+    """Return a dict of weighted shortest path lengths from source.
+
+    Parameters
+    ----------
+    G : Graph or DiGraph
+    source : node
+    cutoff : number, optional
+       Only find nodes at distance at most cutoff.
+    targets : iterable of nodes, optional
+       Stop as soon as the distances of all these nodes are known; the
+       result then holds the nodes settled so far.
+    weight : string
+       Edge attribute holding the (non-negative) weight, default 1.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_edge(0,1,weight=3)
+    >>> G.add_path([0,2,1])
+    >>> nx.single_source_dijkstra_path_length(G,0)[1]
+    2
+    """
+    return _dijkstra(G,source,cutoff,targets,weight)[0]
+
+def single_source_dijkstra(G, source, cutoff=None, targets=None,
+                           weight='weight'):
+    """Return (distances, paths) of weighted shortest paths from source.
+
+    Both are dicts keyed by node; paths are lists of nodes.  See
+    single_source_dijkstra_path_length() for the arguments.
+    """
+    pred={}
+    dist,order=_dijkstra(G,source,cutoff,targets,weight,pred)
+    return dist,_paths(source,[(v,pred[v]) for v in order[1:]])
+
+def dijkstra_path(G, source, target, weight='weight'):
+    """Return a weighted shortest path from source to target.
+
+    Raises NetworkXError if there is no path.
+    """
+    dist,paths=single_source_dijkstra(G,source,targets=[target],
+                                      weight=weight)
+    try:
+        return paths[target]
+    except KeyError:
+        raise NetworkXError("No path between %s and %s."%(source,target))
+
+def dijkstra_path_length(G, source, target, weight='weight'):
+    """Return the weighted length of a shortest path from source to target.
+
+    Raises NetworkXError if there is no path.
+    """
+    dist=single_source_dijkstra_path_length(G,source,targets=[target],
+                                            weight=weight)
+    try:
+        return dist[target]
+    except KeyError:
+        raise NetworkXError("No path between %s and %s."%(source,target))
@@ -1,3 +1,6 @@
 from graph import Graph
 from digraph import DiGraph
+from csrgraph import CSRGraph, CSRDiGraph, to_csr
+from columnar import ColumnarGraph, ColumnarDiGraph
 from function import *
+from views import SubGraphView, SubDiGraphView
@@ -0,0 +1,316 @@
+"""
+Graphs that keep node and edge attributes in typed columns.
+
+A Graph gives every node and edge its own attribute dict, about 280
+bytes even if it only holds a float weight.  ColumnarGraph and
+ColumnarDiGraph store the attributes declared in a schema in arrays,
+one per attribute, indexed by an id that each node and edge gets when
+it is added.  The entries of G.node and G.adj are small mapping
+proxies (ColumnarAttrDict, 64 bytes) that read and write these
+columns, so get_edge_data(), add_edge(u,v,weight=...),
+degree(weighted=True), edges_iter(data=True) and the algorithms work
+unchanged.
+
+Values of schema attributes are converted to the type of their column;
+with the default edge schema {'weight':'d'} weights are floats.
+Attributes not in the schema are kept in an ordinary dict for the
+node or edge that has them.
+
+>>> import networkx as nx
+>>> G=nx.ColumnarGraph()
+>>> G.add_edge(1,2,weight=3)
+>>> G.get_edge_data(1,2)
+{'weight': 3.0}
+>>> G.degree(1,weighted=True)
+3.0
+
+Ids are not reused, removing nodes and edges leaves their slots in the
+columns until the graph is cleared.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['ColumnarGraph', 'ColumnarDiGraph', 'AttributeColumns',
+           'ColumnarAttrDict']
+
+from array import array
+from copy import deepcopy
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.exception import NetworkXError
+
+class AttributeColumns(object):
+    """Typed columns for the attributes of a schema.
+
+    schema is a dict mapping attribute names to numeric array
+    typecodes, e.g. {'weight':'d', 'capacity':'l'}.  columns[name] is
+    the array of values of attribute name and present[name] an array
+    of flags that are 1 where the value is set.
+    """
+    def __init__(self, schema=None):
+        if schema is None:
+            schema={}
+        self.schema=dict(schema)
+        self.columns={}
+        self.present={}
+        for name,typecode in self.schema.iteritems():
+            if typecode not in 'bBhHiIlLfd':
+                raise NetworkXError(\
+                    "Attribute %s: %s is not a numeric array typecode."\
+                    %(name,typecode))
+            self.columns[name]=array(typecode)
+            self.present[name]=array('B')
+        self.extra={}  # id -> dict of the attributes not in the schema
+        self.size=0
+
+    def new(self, data=()):
+        """Return a ColumnarAttrDict for a new id, filled from data."""
+        i=self.size
+        self.size+=1
+        present=self.present
+        for name,column in self.columns.iteritems():
+            column.append(0)
+            present[name].append(0)
+        d=ColumnarAttrDict(self,i)
+        if data:
+            d.update(data)
+        return d
+
+
+class ColumnarAttrDict(object):
+    """The attributes of one node or edge in AttributeColumns, as a
+    mapping."""
+    __slots__=('_store','_id')
+
+    def __init__(self, store, i):
+        self._store=store
+        self._id=i
+
+    def __getitem__(self, key):
+        store=self._store
+        column=store.columns.get(key)
+        if column is not None:
+            if store.present[key][self._id]:
+                return column[self._id]
+        else:
+            extra=store.extra.get(self._id)
+            if extra is not None and key in extra:
+                return extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        store=self._store
+        column=store.columns.get(key)
+        if column is not None:
+            if store.present[key][self._id]:
+                return column[self._id]
+            return default
+        extra=store.extra.get(self._id)
+        if extra is None:
+            return default
+        return extra.get(key,default)
+
+    def __setitem__(self, key, value):
+        store=self._store
+        column=store.columns.get(key)
+        if column is not None:
+            column[self._id]=value
+            store.present[key][self._id]=1
+        else:
+            store.extra.setdefault(self._id,{})[key]=value
+
+    def __delitem__(self, key):
+        store=self._store
+        if key in store.columns:
+            present=store.present[key]
+            if not present[self._id]:
+                raise KeyError(key)
+            present[self._id]=0
+        else:
+            extra=store.extra.get(self._id)
+            if extra is None:
+                raise KeyError(key)
+            del extra[key]
+            if not extra:
+                del store.extra[self._id]
+
+    def __contains__(self, key):
+        store=self._store
+        if key in store.columns:
+            return bool(store.present[key][self._id])
+        extra=store.extra.get(self._id)
+        return extra is not None and key in extra
+
+    has_key=__contains__
+
+    def keys(self):
+        store=self._store
+        i=self._id
+        keys=[name for name,present in store.present.iteritems()
+              if present[i]]
+        extra=store.extra.get(i)
+        if extra is not None:
+            keys.extend(extra)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    iterkeys=__iter__
+
+    def __len__(self):
+        return len(self.keys())
+
+    def iteritems(self):
+        for key in self.keys():
+            yield (key,self[key])
+
+    def items(self):
+        return list(self.iteritems())
+
+    def itervalues(self):
+        for key in self.keys():
+            yield self[key]
+
+    def values(self):
+        return list(self.itervalues())
+
+    def update(self, other=(), **kwds):
+        if hasattr(other,'keys'):
+            for key in other.keys():
+                self[key]=other[key]
+        else:
+            for key,value in other:
+                self[key]=value
+        for key,value in kwds.iteritems():
+            self[key]=value
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key]=default
+            return self[key]
+
+    def pop(self, key, *default):
+        try:
+            value=self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[key]
+        return value
+
+    def clear(self):
+        for key in self.keys():
+            del self[key]
+
+    def copy(self):
+        """Return a copy with a new id in the same columns."""
+        return self._store.new(self)
+
+    __copy__=copy
+
+    def __deepcopy__(self, memo):
+        # a proxy in the copy of the columns if they are being copied
+        # too (see ColumnarGraph.copy()), otherwise a dict
+        store=memo.get(id(self._store))
+        if store is None:
+            return deepcopy(dict(self.iteritems()),memo)
+        return ColumnarAttrDict(store,self._id)
+
+    def __reduce__(self):
+        return (ColumnarAttrDict,(self._store,self._id))
+
+    def __eq__(self, other):
+        if isinstance(other,ColumnarAttrDict):
+            other=dict(other.iteritems())
+        return dict(self.iteritems())==other
+
+    def __ne__(self, other):
+        return not self==other
+
+    __hash__=None
+
+    def __repr__(self):
+        return repr(dict(self.iteritems()))
+
+
+class _ColumnarMixin(object):
+    """Methods shared by ColumnarGraph and ColumnarDiGraph."""
+    def __init__(self, data=None, name='', node_schema=None,
+                 edge_schema=None, **attr):
+        if edge_schema is None:
+            edge_schema={'weight':'d'}
+        self.node_store=AttributeColumns(node_schema)
+        self.edge_store=AttributeColumns(edge_schema)
+        super(_ColumnarMixin,self).__init__(data,name,**attr)
+
+    def node_attr_dict_factory(self, data=()):
+        return self.node_store.new(data)
+
+    def edge_attr_dict_factory(self, data=()):
+        return self.edge_store.new(data)
+
+    def _adopt(self, H):
+        """Let H create its attributes in the columns of self."""
+        H.node_store=self.node_store
+        H.edge_store=self.edge_store
+        return H
+
+    def clear(self):
+        super(_ColumnarMixin,self).clear()
+        self.node_store=AttributeColumns(self.node_store.schema)
+        self.edge_store=AttributeColumns(self.edge_store.schema)
+
+    def copy(self, copy_on_write=False):
+        if copy_on_write:
+            return self._shared_copy()
+        # copy the columns first so that the proxies are copied as
+        # proxies into them
+        memo={}
+        deepcopy(self.node_store,memo)
+        deepcopy(self.edge_store,memo)
+        return deepcopy(self,memo)
+
+    def _shared_copy(self):
+        return self._adopt(super(_ColumnarMixin,self)._shared_copy())
+
+    def subgraph(self, nbunch, *args, **kwds):
+        H=super(_ColumnarMixin,self).subgraph(nbunch,*args,**kwds)
+        if isinstance(H,_ColumnarMixin):
+            self._adopt(H)
+        return H
+
+
+class ColumnarGraph(_ColumnarMixin, Graph):
+    """An undirected graph with node and edge attributes in typed
+    columns.
+
+    Parameters
+    ----------
+    node_schema : dict, optional
+       Node attribute names and array typecodes, default none.
+    edge_schema : dict, optional
+       Edge attribute names and array typecodes, default
+       {'weight':'d'}.
+    """
+    pass
+
+
+class ColumnarDiGraph(_ColumnarMixin, DiGraph):
+    """A directed graph with node and edge attributes in typed columns.
+
+    See ColumnarGraph for the schema arguments.
+    """
+    def reverse(self, copy=True):
+        H=DiGraph.reverse(self,copy)
+        if copy:
+            self._adopt(H)
+        return H
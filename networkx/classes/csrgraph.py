@@ -0,0 +1,526 @@
+"""
+Frozen compressed sparse row (CSR) graphs.
+
+A CSRGraph stores the structure of a Graph in three flat arrays instead
+of a dict-of-dicts: an offset array (one entry per node plus one), a
+neighbor array holding integer node indices and an optional weight
+column.  Node labels are kept in a list (index -> label) and a dict
+(label -> index).  The result uses a small fraction of the memory of the
+original graph and neighbor scans walk contiguous memory.
+
+CSR graphs are read-only; build a new one to reflect changes to the
+original graph.
+
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['CSRGraph', 'CSRDiGraph', 'to_csr']
+
+from array import array
+from bisect import bisect_left
+from networkx.exception import NetworkXError
+
+def _build_csr(adj, index, weight):
+    """Return (indptr, indices, weights) arrays for the dict-of-dicts adj.
+
+    Rows follow the order of the index mapping and the neighbors of
+    each row are sorted by index so that lookups can bisect.
+    """
+    indptr=array('l',[0])
+    indices=array('i')
+    if weight is None:
+        weights=None
+    else:
+        weights=array('d')
+    labels=[None]*len(index)
+    for n,i in index.iteritems():
+        labels[i]=n
+    for n in labels:
+        nbrs=adj[n]
+        if weights is None:
+            row=[index[nbr] for nbr in nbrs]
+            row.sort()
+            indices.extend(row)
+        else:
+            row=[(index[nbr],nbrs[nbr].get(weight,1)) for nbr in nbrs]
+            row.sort()
+            indices.extend([j for j,w in row])
+            weights.extend([w for j,w in row])
+        indptr.append(len(indices))
+    return indptr,indices,weights
+
+
+class CSRGraph(object):
+    """A frozen, array-backed undirected graph.
+
+    CSRGraph(G, weight=None) builds the representation from the
+    undirected graph G.  If weight is the name of an edge attribute
+    its values (default 1 for edges without it) are stored in a
+    weight column and reported in the edge data as {weight: value}.
+
+    The read methods neighbors_iter, degree_iter, edges_iter, has_edge,
+    selfloop_edges and __getitem__ (and their list versions) follow the
+    semantics of the corresponding Graph methods.  Node attributes are
+    not stored.  Weighted degrees and sizes need a weight column; they
+    raise NetworkXError for a graph built with weight=None.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_path([0,1,2])
+    >>> C=nx.CSRGraph(G)
+    >>> C.degree(1)
+    2
+    >>> C.has_edge(2,1)
+    True
+    """
+    # number of self-loops, counted on first use if None
+    _nselfloops=None
+
+    def __init__(self, data, weight=None):
+        if data.is_directed():
+            raise NetworkXError(\
+                "CSRGraph requires an undirected graph, use CSRDiGraph.")
+        self._init_nodes(data)
+        self.weight=weight
+        self._indptr,self._indices,self._weights=\
+            _build_csr(data.adj,self._index,weight)
+        self._nselfloops=len(data.nodes_with_selfloops())
+        self._nedges=(len(self._indices)+self._nselfloops)/2
+
+    def _init_nodes(self, data):
+        if data.is_multigraph():
+            raise NetworkXError("CSRGraph does not support multigraphs.")
+        self._labels=list(data.adj)
+        self._index=dict((n,i) for i,n in enumerate(self._labels))
+        self.graph=data.graph.copy()
+        self.name=data.name
+
+    def __str__(self):
+        return self.name
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __getitem__(self, n):
+        return dict(self._row_iter(self._indptr,self._indices,
+                                   self._weights,self._index[n]))
+
+    def _row_iter(self, indptr, indices, weights, i):
+        """Yield (nbr, datadict) for row i of a CSR structure."""
+        labels=self._labels
+        lo=indptr[i]
+        hi=indptr[i+1]
+        if weights is None:
+            for k in xrange(lo,hi):
+                yield (labels[indices[k]],{})
+        else:
+            weight=self.weight
+            for k in xrange(lo,hi):
+                yield (labels[indices[k]],{weight:weights[k]})
+
+    def _find(self, indptr, indices, i, j):
+        """Return the position of j in row i or -1 if it is absent."""
+        hi=indptr[i+1]
+        k=bisect_left(indices,j,indptr[i],hi)
+        if k<hi and indices[k]==j:
+            return k
+        return -1
+
+    def _check_weighted(self, weighted):
+        """Raise NetworkXError if weighted is True without weights."""
+        if weighted and self._weights is None:
+            raise NetworkXError(\
+                "%s has no weight column, build it with weight='weight'."\
+                %(self.__class__.__name__,))
+
+    def nodes_iter(self, data=False):
+
+        if data:
+            # node attributes are not stored
+            return ((n,{}) for n in self._labels)
+        return iter(self._labels)
+
+    def nodes(self, data=False):
+
+        if data:
+            return list(self.nodes_iter(data))
+        return list(self._labels)
+
+    def number_of_nodes(self):
+
+        return len(self._labels)
+
+    def order(self):
+
+        return len(self._labels)
+
+    def has_node(self, n):
+
+        return self.__contains__(n)
+
+    def has_edge(self, u, v):
+
+        index=self._index
+        try:
+            i=index[u]
+            j=index[v]
+        except (KeyError,TypeError):
+            return False
+        return self._find(self._indptr,self._indices,i,j)>=0
+
+    def get_edge_data(self, u, v, default=None):
+
+        index=self._index
+        try:
+            i=index[u]
+            j=index[v]
+        except (KeyError,TypeError):
+            return default
+        k=self._find(self._indptr,self._indices,i,j)
+        if k<0:
+            return default
+        if self._weights is None:
+            return {}
+        return {self.weight:self._weights[k]}
+
+    def neighbors_iter(self, n):
+
+        try:
+            i=self._index[n]
+        except KeyError:
+            raise NetworkXError("The node %s is not in the graph."%(n,))
+        labels=self._labels
+        indices=self._indices
+        return (labels[indices[k]]
+                for k in xrange(self._indptr[i],self._indptr[i+1]))
+
+    def neighbors(self, n):
+
+        return list(self.neighbors_iter(n))
+
+    def adjacency_iter(self):
+
+        for n in self._labels:
+            yield (n,self[n])
+
+    def nbunch_iter(self, nbunch=None):
+
+        if nbunch is None:   # include all nodes via iterator
+            return iter(self._labels)
+        if nbunch in self:   # if nbunch is a single node
+            return iter([nbunch])
+        index=self._index
+        def bunch_iter(nlist):
+            try:
+                for n in nlist:
+                    if n in index:
+                        yield n
+            except TypeError:
+                raise NetworkXError(
+                    "nbunch is not a node or a sequence of nodes.")
+        return bunch_iter(nbunch)
+
+    def edges_iter(self, nbunch=None, data=False):
+
+        labels=self._labels
+        indptr=self._indptr
+        indices=self._indices
+        weights=self._weights
+        weight=self.weight
+        if nbunch is None:
+            # rows are sorted so the edges to higher (or equal) indices
+            # form a contiguous tail of each row: no visited map needed
+            for i in xrange(len(labels)):
+                hi=indptr[i+1]
+                lo=bisect_left(indices,i,indptr[i],hi)
+                n=labels[i]
+                if not data:
+                    for k in xrange(lo,hi):
+                        yield (n,labels[indices[k]])
+                elif weights is None:
+                    for k in xrange(lo,hi):
+                        yield (n,labels[indices[k]],{})
+                else:
+                    for k in xrange(lo,hi):
+                        yield (n,labels[indices[k]],{weight:weights[k]})
+            return
+        index=self._index
+        seen=set()
+        for n in self.nbunch_iter(nbunch):
+            i=index[n]
+            for k in xrange(indptr[i],indptr[i+1]):
+                j=indices[k]
+                if j in seen:
+                    continue
+                if not data:
+                    yield (n,labels[j])
+                elif weights is None:
+                    yield (n,labels[j],{})
+                else:
+                    yield (n,labels[j],{weight:weights[k]})
+            seen.add(i)
+
+    def edges(self, nbunch=None, data=False):
+
+        return list(self.edges_iter(nbunch,data))
+
+    def degree_iter(self, nbunch=None, weighted=False):
+
+        index=self._index
+        indptr=self._indptr
+        indices=self._indices
+        weights=self._weights
+        self._check_weighted(weighted)
+        for n in self.nbunch_iter(nbunch):
+            i=index[n]
+            lo=indptr[i]
+            hi=indptr[i+1]
+            k=self._find(indptr,indices,i,i)
+            if weighted:
+                d=sum(weights[lo:hi])
+                if k>=0:
+                    d+=weights[k]
+            else:
+                d=hi-lo
+                if k>=0:
+                    d+=1
+            yield (n,d)
+
+    def degree(self, nbunch=None, with_labels=False, weighted=False):
+
+        if with_labels:           # return a dict
+            return dict(self.degree_iter(nbunch,weighted=weighted))
+        elif nbunch in self:      # return a single node
+            return self.degree_iter(nbunch,weighted=weighted).next()[1]
+        else:                     # return a list
+            return [d for (n,d) in self.degree_iter(nbunch,weighted=weighted)]
+
+    def number_of_edges(self, u=None, v=None):
+
+        if u is None: return self._nedges
+        if self.has_edge(u,v):
+            return 1
+        else:
+            return 0
+
+    def nodes_with_selfloops(self):
+
+        labels=self._labels
+        indptr=self._indptr
+        indices=self._indices
+        find=self._find
+        return [labels[i] for i in xrange(len(labels))
+                if find(indptr,indices,i,i)>=0]
+
+    def selfloop_edges(self, data=False):
+
+        if not data:
+            return [(n,n) for n in self.nodes_with_selfloops()]
+        return [(n,n,self.get_edge_data(n,n))
+                for n in self.nodes_with_selfloops()]
+
+    def number_of_selfloops(self):
+
+        if self._nselfloops is None:
+            self._nselfloops=len(self.nodes_with_selfloops())
+        return self._nselfloops
+
+    def size(self, weighted=False):
+
+        self._check_weighted(weighted)
+        if weighted:
+            return sum(self.degree(weighted=True))/2
+        return self._nedges
+
+    def is_multigraph(self):
+
+        return False
+
+    def is_directed(self):
+
+        return False
+
+
+class CSRDiGraph(CSRGraph):
+    """A frozen, array-backed directed graph.
+
+    CSRDiGraph(G, weight=None) builds the representation from the
+    directed graph G.  Successors and predecessors are both stored in
+    CSR form so that in- and out-neighbor scans are equally cheap.
+    """
+    def __init__(self, data, weight=None):
+        if not data.is_directed():
+            raise NetworkXError(\
+                "CSRDiGraph requires a directed graph, use CSRGraph.")
+        self._init_nodes(data)
+        self.weight=weight
+        self._indptr,self._indices,self._weights=\
+            _build_csr(data.succ,self._index,weight)
+        self._pred_indptr,self._pred_indices,self._pred_weights=\
+            _build_csr(data.pred,self._index,weight)
+        self._nedges=len(self._indices)
+        self._nselfloops=len(data.nodes_with_selfloops())
+
+    def has_successor(self, u, v):
+
+        return self.has_edge(u,v)
+
+    def has_predecessor(self, u, v):
+
+        return self.has_edge(v,u)
+
+    def successors_iter(self, n):
+
+        try:
+            i=self._index[n]
+        except KeyError:
+            raise NetworkXError("The node %s is not in the digraph."%(n,))
+        labels=self._labels
+        indices=self._indices
+        return (labels[indices[k]]
+                for k in xrange(self._indptr[i],self._indptr[i+1]))
+
+    def predecessors_iter(self, n):
+
+        try:
+            i=self._index[n]
+        except KeyError:
+            raise NetworkXError("The node %s is not in the digraph."%(n,))
+        labels=self._labels
+        indices=self._pred_indices
+        return (labels[indices[k]]
+                for k in xrange(self._pred_indptr[i],self._pred_indptr[i+1]))
+
+    def successors(self, n):
+
+        return list(self.successors_iter(n))
+
+    def predecessors(self, n):
+
+        return list(self.predecessors_iter(n))
+
+    # digraph definitions
+    neighbors = successors
+    neighbors_iter = successors_iter
+
+    def _edges_iter(self, indptr, indices, weights, nbunch, data, reverse):
+        labels=self._labels
+        index=self._index
+        weight=self.weight
+        for n in self.nbunch_iter(nbunch):
+            i=index[n]
+            for k in xrange(indptr[i],indptr[i+1]):
+                nbr=labels[indices[k]]
+                if reverse:
+                    e=(nbr,n)
+                else:
+                    e=(n,nbr)
+                if not data:
+                    yield e
+                elif weights is None:
+                    yield e+({},)
+                else:
+                    yield e+({weight:weights[k]},)
+
+    def edges_iter(self, nbunch=None, data=False):
+
+        return self._edges_iter(self._indptr,self._indices,self._weights,
+                                nbunch,data,False)
+
+    # alias out_edges to edges
+    out_edges_iter=edges_iter
+    out_edges=CSRGraph.edges
+
+    def in_edges_iter(self, nbunch=None, data=False):
+
+        return self._edges_iter(self._pred_indptr,self._pred_indices,
+                                self._pred_weights,nbunch,data,True)
+
+    def in_edges(self, nbunch=None, data=False):
+
+        return list(self.in_edges_iter(nbunch, data))
+
+    def _degree_iter(self, indptr, weights, nbunch, weighted):
+        index=self._index
+        self._check_weighted(weighted)
+        for n in self.nbunch_iter(nbunch):
+            i=index[n]
+            if weighted:
+                yield (n,sum(weights[indptr[i]:indptr[i+1]]))
+            else:
+                yield (n,indptr[i+1]-indptr[i])
+
+    def in_degree_iter(self, nbunch=None, weighted=False):
+
+        return self._degree_iter(self._pred_indptr,self._pred_weights,
+                                 nbunch,weighted)
+
+    def out_degree_iter(self, nbunch=None, weighted=False):
+
+        return self._degree_iter(self._indptr,self._weights,
+                                 nbunch,weighted)
+
+    def degree_iter(self, nbunch=None, weighted=False):
+
+        from itertools import izip
+        for (n,o),(n2,i) in izip(self.out_degree_iter(nbunch,weighted),
+                                 self.in_degree_iter(nbunch,weighted)):
+            yield (n,o+i)
+
+    def in_degree(self, nbunch=None, with_labels=False, weighted=False):
+
+        if with_labels:           # return a dict
+            return dict(self.in_degree_iter(nbunch,weighted=weighted))
+        elif nbunch in self:      # return a single node
+            return self.in_degree_iter(nbunch,weighted=weighted).next()[1]
+        else:                     # return a list
+            return [d
+                    for (n,d) in self.in_degree_iter(nbunch,weighted=weighted)]
+
+    def out_degree(self, nbunch=None, with_labels=False, weighted=False):
+
+        if with_labels:           # return a dict
+            return dict(self.out_degree_iter(nbunch,weighted=weighted))
+        elif nbunch in self:      # return a single node
+            return self.out_degree_iter(nbunch,weighted=weighted).next()[1]
+        else:                     # return a list
+            return [d for
+                    (n,d) in self.out_degree_iter(nbunch,weighted=weighted)]
+
+    def size(self, weighted=False):
+
+        self._check_weighted(weighted)
+        if weighted:
+            return sum(self._weights)
+        return self._nedges
+
+    def is_directed(self):
+
+        return True
+
+
+def to_csr(G, weight=None):
+    """Return a frozen CSR representation of the graph G.
+
+    A CSRDiGraph is returned for directed graphs and a CSRGraph
+    otherwise.  If weight names an edge attribute its values are kept
+    in a weight column.
+    """
+    if G.is_directed():
+        return CSRDiGraph(G,weight=weight)
+    return CSRGraph(G,weight=weight)
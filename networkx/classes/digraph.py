@@ -10,9 +10,10 @@ __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
 #    BSD license.
 #
 
-from networkx.classes.graph import Graph
+from networkx.classes.graph import Graph, _as_column, _check_columns
 from networkx.exception import NetworkXException, NetworkXError
 from copy import deepcopy
+from itertools import izip
 
 class DiGraph(Graph):
     
@@ -26,6 +27,10 @@ class DiGraph(Graph):
         self.adj = {}  # empty adjacency dictionary
         self.pred = {}  # predecessor
         self.succ = self.adj  # successor
+        # edge and self-loop counts, kept up to date by the methods
+        # that add and remove edges
+        self._nedges = 0
+        self._nselfloops = 0
 
         # load graph attributes (must be after convert)
         self.graph.update(attr)
@@ -33,6 +38,23 @@ class DiGraph(Graph):
         self.name=name
         self.edge=self.adj
 
+    def _own_edge(self, u, v, data=True):
+        """Prepare the rows of u and v (and the data of edge u-v if
+        data is True) for modification in a copy-on-write digraph."""
+        succ=self.succ
+        pred=self.pred
+        if u in succ:
+            self._own(succ,u)
+        if v in pred:
+            self._own(pred,v)
+        if data and u in succ and v in succ[u]:
+            datadict=succ[u][v]
+            if id(datadict) not in self._owned:
+                datadict=datadict.copy()
+                self._owned.add(id(datadict))
+                succ[u][v]=datadict
+                pred[v][u]=datadict
+
         
     def add_node(self, n, attr_dict=None, **attr):
         
@@ -48,19 +70,29 @@ class DiGraph(Graph):
         if n not in self.succ:
             self.succ[n] = {}
             self.pred[n] = {}
-            self.node[n] = attr_dict
+            self.node[n] = self.node_attr_dict_factory(attr_dict)
         else: # update attr even if node already exists            
+            if self._cow:
+                self._own(self.node,n)
             self.node[n].update(attr_dict)
+        if self._connectivity is not None:
+            self._connectivity._add_node(n)
 
     def add_nodes_from(self, nodes, **attr):
         
+        if self._connectivity is not None:
+            nodes=list(nodes)
         for n in nodes:
             if n not in self.succ:
                 self.succ[n] = {}
                 self.pred[n] = {}
-                self.node[n] = attr
+                self.node[n] = self.node_attr_dict_factory(attr)
             else: # update attr even if node already exists            
+                if self._cow:
+                    self._own(self.node,n)
                 self.node[n].update(attr)
+        if self._connectivity is not None:
+            self._connectivity._add_nodes(nodes)
 
 
     def remove_node(self, n):
@@ -70,20 +102,42 @@ class DiGraph(Graph):
             del self.node[n]
         except KeyError: # NetworkXError if n not in self
             raise NetworkXError("The node %s is not in the digraph."%(n,))
+        self._nedges -= len(nbrs)+len(self.pred[n])
+        if n in nbrs:
+            self._nedges += 1
+            self._nselfloops -= 1
+        if self._cow:
+            for u in nbrs:
+                self._own(self.pred,u)
+            for u in self.pred[n]:
+                self._own(self.succ,u)
         for u in nbrs:
             del self.pred[u][n] # remove all edges n-u in digraph
         del self.succ[n]          # remove node from succ
         for u in self.pred[n]:  
             del self.succ[u][n] # remove all edges n-u in digraph
         del self.pred[n]          # remove node from pred
+        if self._connectivity is not None:
+            self._connectivity._remove_node(n)
 
 
     def remove_nodes_from(self, nbunch):
         
+        if self._connectivity is not None:
+            nbunch=list(nbunch)
         for n in nbunch: 
             try:
                 succs=self.succ[n]
                 del self.node[n]
+                self._nedges -= len(succs)+len(self.pred[n])
+                if n in succs:
+                    self._nedges += 1
+                    self._nselfloops -= 1
+                if self._cow:
+                    for u in succs:
+                        self._own(self.pred,u)
+                    for u in self.pred[n]:
+                        self._own(self.succ,u)
                 for u in succs:  
                     del self.pred[u][n] # remove all edges n-u in digraph
                 del self.succ[n]          # now remove node
@@ -92,6 +146,8 @@ class DiGraph(Graph):
                 del self.pred[n]          # now remove node
             except KeyError:
                 pass # silent failure on remove
+        if self._connectivity is not None:
+            self._connectivity._remove_nodes(nbunch)
 
 
     def add_edge(self, u, v, attr_dict=None, **attr):  
@@ -105,20 +161,29 @@ class DiGraph(Graph):
             except AttributeError:
                 raise NetworkXError(\
                     "The attr_dict argument must be a dictionary.")
+        if self._cow:
+            self._own_edge(u,v)
         # add nodes            
         if u not in self.succ: 
             self.succ[u]={}
             self.pred[u]={}
-            self.node[u] = {}
+            self.node[u] = self.node_attr_dict_factory()
         if v not in self.succ: 
             self.succ[v]={}
             self.pred[v]={}
-            self.node[v] = {}
+            self.node[v] = self.node_attr_dict_factory()
         # add the edge
-        datadict=self.adj[u].get(v,{})
+        datadict=self.adj[u].get(v)
+        if datadict is None:
+            datadict=self.edge_attr_dict_factory()
+            self._nedges += 1
+            if u == v:
+                self._nselfloops += 1
         datadict.update(attr_dict)
         self.succ[u][v]=datadict
         self.pred[v][u]=datadict
+        if self._connectivity is not None:
+            self._connectivity._add_edge(u,v)
 
     def add_edges_from(self, ebunch, attr_dict=None, **attr):  
         
@@ -132,6 +197,8 @@ class DiGraph(Graph):
                 raise NetworkXError(\
                     "The attr_dict argument must be a dict.")
         # process ebunch
+        if self._connectivity is not None:
+            ebunch=list(ebunch)
         for e in ebunch:
             ne = len(e)
             if ne==3:
@@ -143,37 +210,155 @@ class DiGraph(Graph):
             else: 
                 raise NetworkXError(\
                     "Edge tuple %s must be a 2-tuple or 3-tuple."%(e,))
+            if self._cow:
+                self._own_edge(u,v)
             if u not in self.succ: 
                 self.succ[u] = {}
                 self.pred[u] = {}
-                self.node[u] = {}
+                self.node[u] = self.node_attr_dict_factory()
             if v not in self.succ: 
                 self.succ[v] = {}
                 self.pred[v] = {}
-                self.node[v] = {}
-            datadict=self.adj[u].get(v,{})
+                self.node[v] = self.node_attr_dict_factory()
+            datadict=self.adj[u].get(v)
+            if datadict is None:
+                datadict=self.edge_attr_dict_factory()
+                self._nedges += 1
+                if u == v:
+                    self._nselfloops += 1
             datadict.update(attr_dict) 
             datadict.update(dd)
             self.succ[u][v] = datadict
             self.pred[v][u] = datadict
+        if self._connectivity is not None:
+            self._connectivity._add_edges(ebunch)
+
+
+    def add_edges_from_columns(self, us, vs, weights=None, attr_dict=None,
+                               **attr):
+
+        # set up attribute dict
+        if attr_dict is None:
+            attr_dict=attr
+        else:
+            try:
+                attr_dict.update(attr)
+            except AttributeError:
+                raise NetworkXError(\
+                    "The attr_dict argument must be a dict.")
+        us=_as_column(us)
+        vs=_as_column(vs)
+        if weights is not None:
+            weights=_as_column(weights)
+        _check_columns(us,vs,weights)
+        if self.edge_attr_dict_factory is not dict:
+            # the loops below create plain dicts, add the edges one
+            # by one with data dicts from the factory
+            if weights is None:
+                ebunch=izip(us,vs)
+            else:
+                ebunch=((u,v,{'weight':w}) for u,v,w in izip(us,vs,weights))
+            self.add_edges_from(ebunch,attr_dict)
+            return
+        if self._cow:
+            for u,v in izip(us,vs):
+                self._own_edge(u,v)
+        succ=self.succ
+        pred=self.pred
+        node=self.node
+        # add all new nodes in one pass
+        new=set(us)
+        new.update(vs)
+        new.difference_update(succ)
+        new_node=self.node_attr_dict_factory
+        for n in new:
+            succ[n]={}
+            pred[n]={}
+            node[n]=new_node()
+        # add the edges, creating one data dict per new edge
+        nedges=0
+        nselfloops=0
+        if weights is not None and not attr_dict:
+            for u,v,w in izip(us,vs,weights):
+                nbrs=succ[u]
+                if v in nbrs:
+                    nbrs[v]['weight']=w
+                else:
+                    datadict={'weight':w}
+                    nbrs[v]=datadict
+                    pred[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+        elif weights is not None:
+            for u,v,w in izip(us,vs,weights):
+                datadict=succ[u].get(v)
+                if datadict is None:
+                    datadict=attr_dict.copy()
+                    succ[u][v]=datadict
+                    pred[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+                else:
+                    datadict.update(attr_dict)
+                datadict['weight']=w
+        elif attr_dict:
+            for u,v in izip(us,vs):
+                datadict=succ[u].get(v)
+                if datadict is None:
+                    datadict=attr_dict.copy()
+                    succ[u][v]=datadict
+                    pred[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+                else:
+                    datadict.update(attr_dict)
+        else:
+            for u,v in izip(us,vs):
+                nbrs=succ[u]
+                if v not in nbrs:
+                    datadict={}
+                    nbrs[v]=datadict
+                    pred[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+        self._nedges += nedges
+        self._nselfloops += nselfloops
+        if self._connectivity is not None:
+            self._connectivity._add_edges(izip(us,vs))
 
 
     def remove_edge(self, u, v):
         
+        if self._cow:
+            self._own_edge(u,v,data=False)
         try:
             del self.succ[u][v]   
             del self.pred[v][u]   
         except KeyError: 
             raise NetworkXError("The edge %s-%s not in graph."%(u,v))
+        self._nedges -= 1
+        if u == v:
+            self._nselfloops -= 1
+        if self._connectivity is not None:
+            self._connectivity._remove_edge(u,v)
 
 
     def remove_edges_from(self, ebunch): 
         
+        if self._connectivity is not None:
+            ebunch=list(ebunch)
         for e in ebunch:
             (u,v)=e[:2]  # ignore edge data
             if u in self.succ and v in self.succ[u]:
+                if self._cow:
+                    self._own_edge(u,v,data=False)
                 del self.succ[u][v]   
                 del self.pred[v][u]        
+                self._nedges -= 1
+                if u == v:
+                    self._nselfloops -= 1
+        if self._connectivity is not None:
+            self._connectivity._remove_edges(ebunch)
 
 
     def has_successor(self, u, v):
@@ -329,6 +514,21 @@ class DiGraph(Graph):
         self.pred.clear() 
         self.node.clear()
         self.graph.clear()
+        self._nedges = 0
+        self._nselfloops = 0
+        if self._connectivity is not None:
+            self._connectivity._clear()
+
+
+    def _count_edges(self):
+        """Return the numbers of edges and self-loops counted in succ."""
+        nedges=0
+        nselfloops=0
+        for n,nbrs in self.succ.iteritems():
+            nedges+=len(nbrs)
+            if n in nbrs:
+                nselfloops+=1
+        return nedges,nselfloops
 
 
     def is_multigraph(self):
@@ -340,9 +540,19 @@ class DiGraph(Graph):
         
         return True
 
-    def to_directed(self):
+    def to_directed(self, copy_on_write=False):
         
-        return deepcopy(self)
+        return self.copy(copy_on_write=copy_on_write)
+
+    def _shared_copy(self):
+        """Return a copy-on-write copy of the digraph in O(V) time.
+
+        See Graph._shared_copy().
+        """
+        H=Graph._shared_copy(self)
+        H.succ=H.adj
+        H.pred=self.pred.copy()
+        return H
 
     def to_undirected(self):
         
@@ -364,17 +574,26 @@ class DiGraph(Graph):
             H.pred=self.succ.copy()
             H.adj=self.pred.copy()
             H.succ=H.adj
+            H.edge=H.adj
             H.graph=self.graph.copy()
             H.node=self.node.copy()
+            H._nedges=self._nedges
+            H._nselfloops=self._nselfloops
+            # the rows are shared, copy them on write
+            self._share(H)
         else:
             self.pred,self.succ=self.succ,self.pred
             self.adj=self.succ
+            self.edge=self.adj
             H=self
         return H
 
 
-    def subgraph(self, nbunch, copy=True):
+    def subgraph(self, nbunch, copy=True, view=False):
         
+        if view:
+            from networkx.classes.views import SubDiGraphView
+            return SubDiGraphView(self,nbunch)
         bunch = self.nbunch_iter(nbunch)
         # create new graph and copy subgraph into it       
         H = self.__class__()
@@ -389,6 +608,7 @@ class DiGraph(Graph):
             H_succ[n]={}
             H_pred[n]={}
         # add edges
+        nedges=0
         for u in H_succ:
             Hnbrs=H_succ[u]
             for v,datadict in self_succ[u].iteritems():
@@ -396,7 +616,11 @@ class DiGraph(Graph):
                     # add both representations of edge: u-v and v-u
                     Hnbrs[v]=datadict
                     H_pred[v][u]=datadict
-        # copy node and attribute dictionaries
-        H.node=self.node.copy()
+                    nedges+=1
+        H._nedges=nedges
+        H._nselfloops=len(H.nodes_with_selfloops())
+        # copy node attribute dictionaries of the subgraph nodes only
+        self_node=self.node
+        H.node=dict((n,self_node[n]) for n in H_succ)
         H.graph=self.graph.copy()
         return H
@@ -15,7 +15,25 @@ __author__ = """Aric Hagberg (hagberg@lanl.gov)\nPieter Swart (swart@lanl.gov)\n
 
 __all__ = ['nodes', 'edges', 'degree', 'degree_histogram', 'neighbors',
            'number_of_nodes', 'number_of_edges', 'density',
-           'nodes_iter', 'edges_iter', 'is_directed','info']
+           'nodes_iter', 'edges_iter', 'is_directed','info',
+           'degree_array', 'in_degree_array', 'out_degree_array']
+
+from networkx.exception import NetworkXError
+from array import array
+from networkx.classes.csrgraph import CSRGraph
+
+# numpy is imported by _import_numpy() when first needed, which keeps
+# "import networkx" fast; None if numpy is not installed
+numpy=False
+
+def _import_numpy():
+    global numpy
+    if numpy is False:
+        try:
+            import numpy as np
+        except ImportError:
+            np=None
+        numpy=np
 
 def nodes(G):
     """Return a copy of the graph nodes in a list."""
@@ -83,6 +101,9 @@ def degree_histogram(G):
     Note: the bins are width one, hence len(list) can be large
     (Order(number_of_edges))
     """
+    _import_numpy()
+    if numpy is not None and len(G) > 0:
+        return numpy.bincount(degree_array(G)).tolist()
     degseq=G.degree()
     dmax=max(degseq)+1
     freq= [ 0 for d in xrange(dmax) ]
@@ -90,6 +111,155 @@ def degree_histogram(G):
         freq[d] += 1
     return freq
 
+def degree_array(G, nodelist=None, weighted=False):
+    """Return the degrees of the nodes of G as an array.
+
+    The entries follow the order of nodelist, or of G.nodes() if
+    nodelist is None.  If weighted=True the degree of a node is the sum
+    of the 'weight' attributes (default 1) of its edges, as in
+    G.degree(weighted=True).
+
+    A NumPy array is returned if NumPy is available and a list
+    otherwise.  G may also be a CSRGraph or CSRDiGraph, whose degrees
+    are computed from the offset arrays.
+    """
+    _import_numpy()
+    if G.is_directed():
+        return _add(out_degree_array(G,nodelist,weighted),
+                    in_degree_array(G,nodelist,weighted))
+    if isinstance(G,CSRGraph):
+        return _csr_degrees(G,G._indptr,G._indices,G._weights,
+                            nodelist,weighted,True)
+    nodes,rows=_rows(G.adj,nodelist)
+    deg=_row_degrees(rows,weighted)
+    if G.number_of_selfloops() > 0:
+        # a self-loop adds 2 to the degree but appears once in its row
+        for i,n in enumerate(nodes):
+            if n in rows[i]:
+                if weighted:
+                    deg[i]+=rows[i][n].get('weight',1)
+                else:
+                    deg[i]+=1
+    return deg
+
+def in_degree_array(G, nodelist=None, weighted=False):
+    """Return the in-degrees of the nodes of the digraph G as an array.
+
+    See degree_array() for the meaning of the arguments.
+    """
+    _import_numpy()
+    if not G.is_directed():
+        raise NetworkXError("in_degree_array() requires a directed graph.")
+    if isinstance(G,CSRGraph):
+        return _csr_degrees(G,G._pred_indptr,G._pred_indices,
+                            G._pred_weights,nodelist,weighted,False)
+    nodes,rows=_rows(G.pred,nodelist)
+    return _row_degrees(rows,weighted)
+
+def out_degree_array(G, nodelist=None, weighted=False):
+    """Return the out-degrees of the nodes of the digraph G as an array.
+
+    See degree_array() for the meaning of the arguments.
+    """
+    _import_numpy()
+    if not G.is_directed():
+        raise NetworkXError("out_degree_array() requires a directed graph.")
+    if isinstance(G,CSRGraph):
+        return _csr_degrees(G,G._indptr,G._indices,G._weights,
+                            nodelist,weighted,False)
+    nodes,rows=_rows(G.succ,nodelist)
+    return _row_degrees(rows,weighted)
+
+def _add(a, b):
+    """Elementwise sum of two degree arrays (or lists)."""
+    if numpy is not None:
+        return a+b
+    return [x+y for x,y in zip(a,b)]
+
+def _rows(adj, nodelist):
+    """Return the nodes and the matching adjacency rows of adj."""
+    if nodelist is None:
+        return adj.keys(),adj.values()
+    try:
+        return list(nodelist),[adj[n] for n in nodelist]
+    except KeyError, e:
+        raise NetworkXError("Node %s in nodelist is not in G."%(e.args[0],))
+
+def _row_degrees(rows, weighted):
+    """Return the row lengths, or the sums of the row weights."""
+    if not weighted:
+        if numpy is None:
+            return map(len,rows)
+        return numpy.array(map(len,rows),dtype=int)
+    if numpy is None:
+        return [sum([d.get('weight',1) for d in nbrs.itervalues()])
+                for nbrs in rows]
+    lengths=numpy.array(map(len,rows),dtype=int)
+    weights=numpy.fromiter((d.get('weight',1) for nbrs in rows
+                            for d in nbrs.itervalues()),
+                           dtype=float,count=lengths.sum())
+    return _bincount(numpy.repeat(numpy.arange(len(rows)),lengths),
+                     weights,len(rows))
+
+def _bincount(index, weights, n):
+    """Return numpy.bincount(index, weights) padded to length n."""
+    if weights is None:
+        deg=numpy.zeros(n,dtype=int)
+    else:
+        deg=numpy.zeros(n,dtype=float)
+    counts=numpy.bincount(index,weights)
+    deg[:len(counts)]=counts
+    return deg
+
+def _asnumpy(a):
+    """Return a numpy view of an array.array (or a numpy array as is)."""
+    if isinstance(a,array):
+        return numpy.frombuffer(a,dtype=a.typecode)
+    return numpy.asarray(a)
+
+def _csr_degrees(G, indptr, indices, weights, nodelist, weighted, loops):
+    """Return the degrees of a CSR structure.
+
+    If loops is True self-loops are counted twice (undirected graphs).
+    """
+    G._check_weighted(weighted)
+    if numpy is None:
+        # pure Python version built on the degree iterators
+        if G.is_directed() and indptr is G._indptr:
+            degree_iter=G.out_degree_iter
+        elif G.is_directed():
+            degree_iter=G.in_degree_iter
+        else:
+            degree_iter=G.degree_iter
+        if nodelist is None:
+            nodelist=G.nodes()
+        return [degree_iter(n,weighted=weighted).next()[1] for n in nodelist]
+    n=len(G)
+    indptr=_asnumpy(indptr)
+    lengths=numpy.diff(indptr)
+    indices=_asnumpy(indices)
+    rowindex=numpy.repeat(numpy.arange(n),lengths)
+    if weighted:
+        weights=_asnumpy(weights)
+        deg=_bincount(rowindex,weights,n)
+    else:
+        weights=None
+        deg=lengths.astype(int)
+    if loops:
+        selfloops=(indices==rowindex)
+        if selfloops.any():
+            if weights is None:
+                deg+=_bincount(rowindex[selfloops],None,n)
+            else:
+                deg+=_bincount(rowindex[selfloops],weights[selfloops],n)
+    if nodelist is not None:
+        try:
+            deg=deg[[G._index[v] for v in nodelist]]
+        except KeyError, e:
+            raise NetworkXError(\
+                "Node %s in nodelist is not in G."%(e.args[0],))
+    return deg
+
 def is_directed(G):
     """ Return True if graph is directed."""
     return G.is_directed()
@@ -106,14 +276,15 @@ def info(G, n=None):
         print ("Number of nodes:").ljust(width_left), G.number_of_nodes()
         print ("Number of edges:").ljust(width_left), G.number_of_edges()
         if len(G) > 0:
+            # the degree sums follow from the (cached) number of edges
             if G.is_directed():
                 print ("Average in degree:").ljust(width_left), \
-                    round( sum(G.in_degree())/float(len(G)), 4)
+                    round( G.number_of_edges()/float(len(G)), 4)
                 print ("Average out degree:").ljust(width_left), \
-                    round( sum(G.out_degree())/float(len(G)), 4)
+                    round( G.number_of_edges()/float(len(G)), 4)
             else:
                 print ("Average degree:").ljust(width_left), \
-                    round( sum(G.degree())/float(len(G)), 4)
+                    round( 2*G.number_of_edges()/float(len(G)), 4)
 
     else:
         try:
@@ -12,12 +12,51 @@ __docformat__ = "restructuredtext en"
 
 from networkx.exception import NetworkXException, NetworkXError
 from copy import deepcopy
+from itertools import izip
+
+def _as_column(seq):
+    """Return seq as a sequence that can be scanned more than once.
+
+    NumPy arrays are converted with tolist() so that nodes and weights
+    are plain Python objects rather than array scalars.
+    """
+    if hasattr(seq,'tolist'):
+        return seq.tolist()
+    if not hasattr(seq,'__len__'):
+        return list(seq)
+    return seq
+
+def _check_columns(us, vs, weights):
+    """Raise NetworkXError unless the edge columns have equal lengths."""
+    if len(us)!=len(vs):
+        raise NetworkXError(\
+            "The columns us and vs have different lengths %d and %d."\
+            %(len(us),len(vs)))
+    if weights is not None and len(weights)!=len(us):
+        raise NetworkXError(\
+            "The weights column has length %d, the edge columns %d."\
+            %(len(weights),len(us)))
 
 class Graph(object):
+    # True once the graph shares rows and attribute dicts with a
+    # copy-on-write copy, see copy()
+    _cow = False
+    # ConnectivityIndex kept up to date by the methods that change the
+    # graph, see networkx.algorithms.components
+    _connectivity = None
+    # callables returning a new node attribute dict and edge data dict,
+    # optionally filled from a mapping, see networkx.classes.columnar
+    node_attr_dict_factory = dict
+    edge_attr_dict_factory = dict
+
     def __init__(self, data=None, name='', **attr):
         self.graph = {}   # dictionary for graph attributes
         self.node = {}    # empty node dict (created before convert)
         self.adj = {}     # empty adjacency dict
+        # edge and self-loop counts, kept up to date by the methods
+        # that add and remove edges
+        self._nedges = 0
+        self._nselfloops = 0
         # load graph attributes (must be after convert)
         self.graph.update(attr)
         self.name = name
@@ -40,6 +79,44 @@ class Graph(object):
 
     def __getitem__(self, n):
         return self.adj[n]
+
+    def _share(self, H):
+        """Mark self and H as sharing rows and attribute dicts.
+
+        From now on each graph copies a row, node attribute dict or
+        edge data dict before changing it, unless it made that copy
+        itself.  The ids of these private copies are kept in _owned.
+        """
+        self._cow=True
+        self._owned=set()
+        H._cow=True
+        H._owned=set()
+
+    def _own(self, d, key):
+        """Return d[key] after replacing it with a private copy if it
+        may be shared with a copy-on-write copy."""
+        value=d[key]
+        if id(value) not in self._owned:
+            value=value.copy()
+            d[key]=value
+            self._owned.add(id(value))
+        return value
+
+    def _own_edge(self, u, v, data=True):
+        """Prepare the rows of u and v (and the data of edge u-v if
+        data is True) for modification in a copy-on-write graph."""
+        adj=self.adj
+        if u in adj:
+            self._own(adj,u)
+        if v in adj:
+            self._own(adj,v)
+        if data and u in adj and v in adj[u]:
+            datadict=adj[u][v]
+            if id(datadict) not in self._owned:
+                datadict=datadict.copy()
+                self._owned.add(id(datadict))
+                adj[u][v]=datadict
+                adj[v][u]=datadict
     
 
     def add_node(self, n, attr_dict=None, **attr):
@@ -54,18 +131,28 @@ class Graph(object):
                     "The attr_dict argument must be a dictionary.")
         if n not in self.adj:
             self.adj[n] = {}
-            self.node[n] = attr_dict
+            self.node[n] = self.node_attr_dict_factory(attr_dict)
         else: # update attr even if node already exists            
+            if self._cow:
+                self._own(self.node,n)
             self.node[n].update(attr_dict)
+        if self._connectivity is not None:
+            self._connectivity._add_node(n)
 
 
     def add_nodes_from(self, nodes, **attr):
+        if self._connectivity is not None:
+            nodes=list(nodes)
         for n in nodes:
             if n not in self.adj:
                 self.adj[n] = {}
-                self.node[n] = attr.copy()
+                self.node[n] = self.node_attr_dict_factory(attr)
             else:
+                if self._cow:
+                    self._own(self.node,n)
                 self.node[n].update(attr)
+        if self._connectivity is not None:
+            self._connectivity._add_nodes(nodes)
 
     def remove_node(self,n):
         
@@ -75,22 +162,41 @@ class Graph(object):
             del self.node[n]
         except KeyError: # NetworkXError if n not in self
             raise NetworkXError("The node %s is not in the graph."%(n,))
+        self._nedges -= len(nbrs)
+        if n in adj[n]:
+            self._nselfloops -= 1
+        if self._cow:
+            for u in nbrs:
+                self._own(adj,u)
         for u in nbrs:  
             del adj[u][n]   # remove all edges n-u in graph
         del adj[n]          # now remove node
+        if self._connectivity is not None:
+            self._connectivity._remove_node(n)
 
 
     def remove_nodes_from(self, nodes):
         
         adj = self.adj
+        if self._connectivity is not None:
+            nodes=list(nodes)
         for n in nodes:
             try: 
                 del self.node[n]
-                for u in adj[n].keys():   # keys() handles self-loops 
+                nbrs = adj[n].keys()      # keys() handles self-loops 
+                self._nedges -= len(nbrs)
+                if n in adj[n]:
+                    self._nselfloops -= 1
+                if self._cow:
+                    for u in nbrs:
+                        self._own(adj,u)
+                for u in nbrs:
                     del adj[u][n]         #(allows mutation of dict in loop)
                 del adj[n]
             except KeyError:
                 pass
+        if self._connectivity is not None:
+            self._connectivity._remove_nodes(nodes)
 
 
     def nodes_iter(self, data=False):
@@ -129,18 +235,27 @@ class Graph(object):
             except AttributeError:
                 raise NetworkXError(\
                     "The attr_dict argument must be a dictionary.")
+        if self._cow:
+            self._own_edge(u,v)
         # add nodes            
         if u not in self.adj: 
             self.adj[u] = {}
-            self.node[u] = {}
+            self.node[u] = self.node_attr_dict_factory()
         if v not in self.adj: 
             self.adj[v] = {}
-            self.node[v] = {}
+            self.node[v] = self.node_attr_dict_factory()
         # add the edge
-        datadict=self.adj[u].get(v,{})
+        datadict=self.adj[u].get(v)
+        if datadict is None:
+            datadict=self.edge_attr_dict_factory()
+            self._nedges += 1
+            if u == v:
+                self._nselfloops += 1
         datadict.update(attr_dict)
         self.adj[u][v] = datadict
         self.adj[v][u] = datadict
+        if self._connectivity is not None:
+            self._connectivity._add_edge(u,v)
 
 
     def add_edges_from(self, ebunch, attr_dict=None, **attr):  
@@ -155,6 +270,8 @@ class Graph(object):
                 raise NetworkXError(\
                     "The attr_dict argument must be a dictionary.")
         # process ebunch
+        if self._connectivity is not None:
+            ebunch=list(ebunch)
         for e in ebunch:
             ne=len(e)
             if ne==3:
@@ -165,42 +282,157 @@ class Graph(object):
             else: 
                 raise NetworkXError(\
                     "Edge tuple %s must be a 2-tuple or 3-tuple."%(e,))
+            if self._cow:
+                self._own_edge(u,v)
             if u not in self.adj: 
                 self.adj[u] = {}
-                self.node[u] = {}
+                self.node[u] = self.node_attr_dict_factory()
             if v not in self.adj: 
                 self.adj[v] = {}
-                self.node[v] = {}
-            datadict=self.adj[u].get(v,{})
+                self.node[v] = self.node_attr_dict_factory()
+            datadict=self.adj[u].get(v)
+            if datadict is None:
+                datadict=self.edge_attr_dict_factory()
+                self._nedges += 1
+                if u == v:
+                    self._nselfloops += 1
             datadict.update(attr_dict) 
             datadict.update(dd)
             self.adj[u][v] = datadict
             self.adj[v][u] = datadict
+        if self._connectivity is not None:
+            self._connectivity._add_edges(ebunch)
 
 
     def add_weighted_edges_from(self, ebunch, **attr):  
         
         self.add_edges_from(((u,v,{'weight':d}) for u,v,d in ebunch),**attr)
 
+    def add_edges_from_columns(self, us, vs, weights=None, attr_dict=None,
+                               **attr):
+
+        # set up attribute dict
+        if attr_dict is None:
+            attr_dict=attr
+        else:
+            try:
+                attr_dict.update(attr)
+            except AttributeError:
+                raise NetworkXError(\
+                    "The attr_dict argument must be a dictionary.")
+        us=_as_column(us)
+        vs=_as_column(vs)
+        if weights is not None:
+            weights=_as_column(weights)
+        _check_columns(us,vs,weights)
+        if self.edge_attr_dict_factory is not dict:
+            # the loops below create plain dicts, add the edges one
+            # by one with data dicts from the factory
+            if weights is None:
+                ebunch=izip(us,vs)
+            else:
+                ebunch=((u,v,{'weight':w}) for u,v,w in izip(us,vs,weights))
+            self.add_edges_from(ebunch,attr_dict)
+            return
+        if self._cow:
+            for u,v in izip(us,vs):
+                self._own_edge(u,v)
+        adj=self.adj
+        node=self.node
+        # add all new nodes in one pass
+        new=set(us)
+        new.update(vs)
+        new.difference_update(adj)
+        new_node=self.node_attr_dict_factory
+        for n in new:
+            adj[n]={}
+            node[n]=new_node()
+        # add the edges, creating one data dict per new edge
+        nedges=0
+        nselfloops=0
+        if weights is not None and not attr_dict:
+            for u,v,w in izip(us,vs,weights):
+                nbrs=adj[u]
+                if v in nbrs:
+                    nbrs[v]['weight']=w
+                else:
+                    datadict={'weight':w}
+                    nbrs[v]=datadict
+                    adj[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+        elif weights is not None:
+            for u,v,w in izip(us,vs,weights):
+                datadict=adj[u].get(v)
+                if datadict is None:
+                    datadict=attr_dict.copy()
+                    adj[u][v]=datadict
+                    adj[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+                else:
+                    datadict.update(attr_dict)
+                datadict['weight']=w
+        elif attr_dict:
+            for u,v in izip(us,vs):
+                datadict=adj[u].get(v)
+                if datadict is None:
+                    datadict=attr_dict.copy()
+                    adj[u][v]=datadict
+                    adj[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+                else:
+                    datadict.update(attr_dict)
+        else:
+            for u,v in izip(us,vs):
+                nbrs=adj[u]
+                if v not in nbrs:
+                    datadict={}
+                    nbrs[v]=datadict
+                    adj[v][u]=datadict
+                    nedges+=1
+                    if u == v: nselfloops+=1
+        self._nedges += nedges
+        self._nselfloops += nselfloops
+        if self._connectivity is not None:
+            self._connectivity._add_edges(izip(us,vs))
+
     def remove_edge(self, u, v): 
         
+        if self._cow:
+            self._own_edge(u,v,data=False)
         try:
             del self.adj[u][v]   
             if u != v:  # self-loop needs only one entry removed
                 del self.adj[v][u]   
+            else:
+                self._nselfloops -= 1
         except KeyError: 
             raise NetworkXError("The edge %s-%s is not in the graph"%(u,v))
+        self._nedges -= 1
+        if self._connectivity is not None:
+            self._connectivity._remove_edge(u,v)
 
 
 
     def remove_edges_from(self, ebunch): 
         
+        if self._connectivity is not None:
+            ebunch=list(ebunch)
         for e in ebunch:
             u,v = e[:2]  # ignore edge data if present
             if u in self.adj and v in self.adj[u]:
+                if self._cow:
+                    self._own_edge(u,v,data=False)
                 del self.adj[u][v]   
                 if u != v:  # self loop needs only one entry removed
                     del self.adj[v][u]   
+                else:
+                    self._nselfloops -= 1
+                self._nedges -= 1
+        if self._connectivity is not None:
+            self._connectivity._remove_edges(ebunch)
 
 
     def has_edge(self, u, v):
@@ -231,24 +463,52 @@ class Graph(object):
 
     def edges_iter(self, nbunch=None, data=False):
         
-        seen={}     # helper dict to keep track of multiply stored edges
-        if nbunch is None:
-            nodes_nbrs = self.adj.iteritems()
-        else:
-            nodes_nbrs=((n,self.adj[n]) for n in self.nbunch_iter(nbunch))
+        if nbunch is not None:
+            # follow the order of nbunch, reporting each edge from the
+            # first of its nodes in the bunch
+            adj=self.adj
+            seen=set()
+            for n in self.nbunch_iter(nbunch):
+                if n in seen:
+                    continue
+                if data:
+                    for nbr,d in adj[n].iteritems():
+                        if nbr not in seen:
+                            yield (n,nbr,d)
+                else:
+                    for nbr in adj[n]:
+                        if nbr not in seen:
+                            yield (n,nbr)
+                seen.add(n)
+            return
+        # Every edge is stored in the rows of both of its nodes.  Report
+        # it from the node with the smaller hash value, which needs no
+        # record of the nodes visited so far.  Only distinct nodes with
+        # equal hash values (rare) are tracked, in the set ties.
+        _hash=hash
+        ties=set()
         if data:
-            for n,nbrs in nodes_nbrs:
-                for nbr,data in nbrs.iteritems():
-                    if nbr not in seen:
-                        yield (n,nbr,data)
-                seen[n]=1
+            for n,nbrs in self.adj.iteritems():
+                hn=_hash(n)
+                for nbr,d in nbrs.iteritems():
+                    h=_hash(nbr)
+                    if h>=hn:
+                        if h!=hn or nbr==n:
+                            yield (n,nbr,d)
+                        elif (nbr,n) not in ties:
+                            ties.add((n,nbr))
+                            yield (n,nbr,d)
         else:
-            for n,nbrs in nodes_nbrs:
+            for n,nbrs in self.adj.iteritems():
+                hn=_hash(n)
                 for nbr in nbrs:
-                    if nbr not in seen:
-                        yield (n,nbr)
-                seen[n] = 1
-        del seen
+                    h=_hash(nbr)
+                    if h>=hn:
+                        if h!=hn or nbr==n:
+                            yield (n,nbr)
+                        elif (nbr,n) not in ties:
+                            ties.add((n,nbr))
+                            yield (n,nbr)
 
 
     def get_edge_data(self, u, v, default=None):
@@ -298,11 +558,36 @@ class Graph(object):
         self.adj.clear() 
         self.node.clear()
         self.graph.clear()
+        self._nedges = 0
+        self._nselfloops = 0
+        if self._connectivity is not None:
+            self._connectivity._clear()
 
-    def copy(self):
+    def copy(self, copy_on_write=False):
         
+        if copy_on_write:
+            return self._shared_copy()
         return deepcopy(self)
 
+    def _shared_copy(self):
+        """Return a copy-on-write copy of the graph in O(V) time.
+
+        The copy shares adjacency rows, node attribute dicts and edge
+        data dicts with self; either graph copies one of these the first
+        time it changes it.  Only the graph attribute dict is copied
+        (shallowly) up front.
+        """
+        H=self.__class__()
+        H.name=self.name
+        H.graph=self.graph.copy()
+        H.node=self.node.copy()
+        H.adj=self.adj.copy()
+        H.edge=H.adj
+        H._nedges=self._nedges
+        H._nselfloops=self._nselfloops
+        self._share(H)
+        return H
+
     def is_multigraph(self):
         
         return False
@@ -325,12 +610,15 @@ class Graph(object):
         G.node=deepcopy(self.node)
         return G
 
-    def to_undirected(self):
+    def to_undirected(self, copy_on_write=False):
         
-        return deepcopy(self)
+        return self.copy(copy_on_write=copy_on_write)
 
-    def subgraph(self, nbunch):
+    def subgraph(self, nbunch, view=False):
         
+        if view:
+            from networkx.classes.views import SubGraphView
+            return SubGraphView(self,nbunch)
         bunch =self.nbunch_iter(nbunch)
         # create new graph and copy subgraph into it       
         H = self.__class__()
@@ -339,7 +627,11 @@ class Graph(object):
         H_adj=H.adj
         self_adj=self.adj
         # add nodes and edges (undirected method)
+        nedges=0
         for n in bunch:
+            if n in H_adj:
+                # repeated in nbunch, its edges are already counted
+                continue
             Hnbrs={}
             H_adj[n]=Hnbrs
             for nbr,d in self_adj[n].iteritems():
@@ -347,8 +639,12 @@ class Graph(object):
                     # add both representations of edge: n-nbr and nbr-n
                     Hnbrs[nbr]=d
                     H_adj[nbr][n]=d
-        # copy node and attribute dictionaries
-        H.node=self.node.copy()
+                    nedges+=1
+        H._nedges=nedges
+        H._nselfloops=len(H.nodes_with_selfloops())
+        # copy node attribute dictionaries of the subgraph nodes only
+        self_node=self.node
+        H.node=dict((n,self_node[n]) for n in H_adj)
         H.graph=self.graph.copy()
         return H
 
@@ -369,14 +665,56 @@ class Graph(object):
 
     def number_of_selfloops(self):
         
-        return len(self.selfloop_edges())
+        return self._nselfloops
 
 
     def size(self, weighted=False):
         
-
+        if not weighted:
+            return self._nedges
         return sum(self.degree(weighted=weighted))/2
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_nedges' not in state:
+            # pickled by a version without the cached counts
+            self._nedges,self._nselfloops=self._count_edges()
+
+    def _count_edges(self):
+        """Return the numbers of edges and self-loops counted in adj."""
+        nentries=0
+        nselfloops=0
+        for n,nbrs in self.adj.iteritems():
+            nentries+=len(nbrs)
+            if n in nbrs:
+                nselfloops+=1
+        # each edge is in two rows, a self-loop in one
+        return (nentries+nselfloops)//2,nselfloops
+
+    def _check_counts(self):
+        """Verify the cached edge and self-loop counts against the
+        adjacency structure.
+
+        Return True or raise NetworkXError describing the mismatch.
+
+        >>> G=Graph()
+        >>> G.add_path([0,1,2,3])
+        >>> G.subgraph([0,1,2,0,1])._check_counts()
+        True
+        >>> from networkx.classes.digraph import DiGraph
+        >>> D=DiGraph(G)
+        >>> D.subgraph([0,1,2,0,1])._check_counts()
+        True
+        """
+        nedges=sum(self.degree())/2
+        nselfloops=len(self.selfloop_edges())
+        if (nedges,nselfloops)!=(self._nedges,self._nselfloops):
+            raise NetworkXError(\
+                "Cached counts (%d edges, %d self-loops) do not match "
+                "the graph (%d edges, %d self-loops)."%
+                (self._nedges,self._nselfloops,nedges,nselfloops))
+        return True
+
     def number_of_edges(self, u=None, v=None):
         
         if u is None: return self.size()
@@ -0,0 +1,320 @@
+"""
+Read-only subgraph views.
+
+A subgraph view shares the adjacency structure of its parent graph and
+filters it lazily by a node set and, optionally, an edge predicate.
+Creating a view costs O(len(nbunch)) time and memory no matter how
+large the parent graph is, and changes to the parent's edges show up
+in the view.  Edge and node attribute dicts are those of the parent.
+
+Use materialize() to turn a view into an ordinary Graph or DiGraph.
+
+>>> import networkx as nx
+>>> G=nx.Graph()
+>>> G.add_path([0,1,2,3])
+>>> H=G.subgraph([0,1,2],view=True)
+>>> sorted(H.edges())
+[(0, 1), (1, 2)]
+
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['SubGraphView', 'SubDiGraphView']
+
+from UserDict import DictMixin
+from copy import deepcopy
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.exception import NetworkXError
+
+
+class _ReadOnlyMapping(DictMixin):
+    """Base class for the read-only dict-like views below."""
+    def __setitem__(self, key, value):
+        raise NetworkXError("Subgraph views are read-only.")
+
+    def __delitem__(self, key):
+        raise NetworkXError("Subgraph views are read-only.")
+
+    def iterkeys(self):
+        return self.__iter__()
+
+    def keys(self):
+        return list(self.__iter__())
+
+    def __len__(self):
+        n=0
+        for key in self:
+            n+=1
+        return n
+
+    def copy(self):
+        return dict(self.iteritems())
+
+
+class _FilterAdjacency(_ReadOnlyMapping):
+    """View of an adjacency dict restricted to the nodes in nodes.
+
+    Rows are returned as _FilterRow views.  If reverse is True the
+    adjacency holds predecessors and the edge predicate is called
+    with the endpoints swapped.
+    """
+    def __init__(self, adj, nodes, edge_filter=None, reverse=False):
+        self._adj=adj
+        self._nodes=nodes
+        self._edge_filter=edge_filter
+        self._reverse=reverse
+
+    def __contains__(self, n):
+        try:
+            return n in self._nodes and n in self._adj
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        if n not in self._nodes:
+            raise KeyError(n)
+        return _FilterRow(n,self._adj[n],self._nodes,
+                          self._edge_filter,self._reverse)
+
+    def __iter__(self):
+        adj=self._adj
+        for n in self._nodes:
+            if n in adj:
+                yield n
+
+    def iteritems(self):
+        for n in self:
+            yield (n,self[n])
+
+
+class _FilterRow(_ReadOnlyMapping):
+    """View of the neighbors of n restricted to nodes and edge_filter."""
+    def __init__(self, n, row, nodes, edge_filter, reverse):
+        self._n=n
+        self._row=row
+        self._nodes=nodes
+        self._edge_filter=edge_filter
+        self._reverse=reverse
+
+    def _keep(self, nbr, d):
+        if nbr not in self._nodes:
+            return False
+        if self._edge_filter is None:
+            return True
+        if self._reverse:
+            return self._edge_filter(nbr,self._n,d)
+        return self._edge_filter(self._n,nbr,d)
+
+    def __contains__(self, nbr):
+        try:
+            self[nbr]
+        except (KeyError,TypeError):
+            return False
+        return True
+
+    def __getitem__(self, nbr):
+        d=self._row[nbr]
+        if not self._keep(nbr,d):
+            raise KeyError(nbr)
+        return d
+
+    def iteritems(self):
+        for nbr,d in self._row.iteritems():
+            if self._keep(nbr,d):
+                yield (nbr,d)
+
+    def __iter__(self):
+        for nbr,d in self.iteritems():
+            yield nbr
+
+
+class _FilterNodes(_ReadOnlyMapping):
+    """View of a node attribute dict restricted to the nodes of adj."""
+    def __init__(self, node, adj):
+        self._node=node
+        self._adjview=adj
+
+    def __contains__(self, n):
+        return n in self._adjview
+
+    def __getitem__(self, n):
+        if n not in self._adjview:
+            raise KeyError(n)
+        return self._node[n]
+
+    def __iter__(self):
+        return iter(self._adjview)
+
+    def iteritems(self):
+        node=self._node
+        for n in self._adjview:
+            yield (n,node[n])
+
+
+class _SubGraphViewMixin(object):
+    """Methods shared by the undirected and directed views."""
+    def _init_view(self, graph, nbunch):
+        self._nodes=set(graph.nbunch_iter(nbunch))
+        # graph whose class (and columnar stores, see
+        # networkx.classes.columnar) materialize() uses, the root graph
+        # for nested views
+        self._root=getattr(graph,'_root',graph)
+        self.graph=graph.graph
+        self.name="Subgraph of (%s)"%(graph.name)
+
+    def _readonly(self, *args, **kwds):
+        raise NetworkXError("Subgraph views are read-only.")
+
+    add_node=_readonly
+    add_nodes_from=_readonly
+    remove_node=_readonly
+    remove_nodes_from=_readonly
+    add_edge=_readonly
+    add_edges_from=_readonly
+    add_edges_from_columns=_readonly
+    remove_edge=_readonly
+    remove_edges_from=_readonly
+    clear=_readonly
+
+    def number_of_selfloops(self):
+        return len(self.selfloop_edges())
+
+    def copy(self, copy_on_write=False):
+        # materialize() shares attribute dicts with the parent graph,
+        # so always return an independent copy
+        return deepcopy(self.materialize())
+
+    def to_directed(self, copy_on_write=False):
+        return self.materialize().to_directed()
+
+    def to_undirected(self, copy_on_write=False):
+        return self.materialize().to_undirected()
+
+
+class SubGraphView(_SubGraphViewMixin, Graph):
+    """Read-only view of the subgraph of an undirected graph.
+
+    SubGraphView(G, nbunch, edge_filter=None) shows the nodes of nbunch
+    that are in G and the edges of G between them.  If edge_filter is
+    given only edges for which edge_filter(u, v, data) is True are
+    shown; the predicate should not depend on the order of u and v.
+
+    All read methods of Graph work on the view; methods that change the
+    graph raise NetworkXError.
+    """
+    def __init__(self, graph, nbunch, edge_filter=None):
+        self._init_view(graph,nbunch)
+        self.adj=_FilterAdjacency(graph.adj,self._nodes,edge_filter)
+        self.edge=self.adj
+        self.node=_FilterNodes(graph.node,self.adj)
+
+    def size(self, weighted=False):
+        return sum(self.degree(weighted=weighted))/2
+
+    def subgraph(self, nbunch, view=False):
+        H=SubGraphView(self,nbunch)
+        if view:
+            return H
+        return H.materialize()
+
+    def materialize(self):
+        """Return the viewed subgraph as a new graph.
+
+        Like subgraph() the new graph shares the edge and node
+        attribute dicts with the parent graph.
+        """
+        H=self._root.__class__()
+        if hasattr(self._root,'_adopt'):
+            # create the attributes in the columns of the root graph
+            self._root._adopt(H)
+        H.name=self.name
+        H_adj=H.adj
+        nedges=0
+        for n,nbrs in self.adj.iteritems():
+            Hnbrs={}
+            H_adj[n]=Hnbrs
+            for nbr,d in nbrs.iteritems():
+                if nbr in H_adj:
+                    Hnbrs[nbr]=d
+                    H_adj[nbr][n]=d
+                    nedges+=1
+        H._nedges=nedges
+        H._nselfloops=len(H.nodes_with_selfloops())
+        node=self.node
+        H.node=dict((n,node[n]) for n in H_adj)
+        H.graph=self.graph.copy()
+        return H
+
+
+class SubDiGraphView(_SubGraphViewMixin, DiGraph):
+    """Read-only view of the subgraph of a directed graph.
+
+    SubDiGraphView(G, nbunch, edge_filter=None) shows the nodes of
+    nbunch that are in G and the edges of G between them.  If
+    edge_filter is given only edges (u,v) for which
+    edge_filter(u, v, data) is True are shown.
+
+    All read methods of DiGraph work on the view; methods that change
+    the graph raise NetworkXError.
+    """
+    def __init__(self, graph, nbunch, edge_filter=None):
+        self._init_view(graph,nbunch)
+        self.succ=_FilterAdjacency(graph.succ,self._nodes,edge_filter)
+        self.pred=_FilterAdjacency(graph.pred,self._nodes,edge_filter,
+                                   reverse=True)
+        self.adj=self.succ
+        self.edge=self.adj
+        self.node=_FilterNodes(graph.node,self.adj)
+
+    def size(self, weighted=False):
+        if weighted:
+            return sum(self.out_degree(weighted=True))
+        return sum(len(nbrs) for nbrs in self.succ.itervalues())
+
+    def reverse(self, copy=True):
+        if not copy:
+            raise NetworkXError("Subgraph views are read-only.")
+        return self.materialize().reverse()
+
+    def subgraph(self, nbunch, copy=True, view=False):
+        H=SubDiGraphView(self,nbunch)
+        if view:
+            return H
+        return H.materialize()
+
+    def materialize(self):
+        """Return the viewed subgraph as a new digraph.
+
+        Like subgraph() the new digraph shares the edge and node
+        attribute dicts with the parent digraph.
+        """
+        H=self._root.__class__()
+        if hasattr(self._root,'_adopt'):
+            # create the attributes in the columns of the root graph
+            self._root._adopt(H)
+        H.name=self.name
+        H_succ=H.succ
+        H_pred=H.pred
+        for n in self.succ:
+            H_succ[n]={}
+            H_pred[n]={}
+        nedges=0
+        for u,nbrs in self.succ.iteritems():
+            Hnbrs=H_succ[u]
+            for v,d in nbrs.iteritems():
+                Hnbrs[v]=d
+                H_pred[v][u]=d
+                nedges+=1
+        H._nedges=nedges
+        H._nselfloops=len(H.nodes_with_selfloops())
+        node=self.node
+        H.node=dict((n,node[n]) for n in H_succ)
+        H.graph=self.graph.copy()
+        return H
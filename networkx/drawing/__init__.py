@@ -1,8 +1,19 @@
-try:
-    import pydot
-    import nx_pydot    
-    from nx_pydot import *
-except:
-    pass
+"""
+Drawing and graph layout.
 
+The interface to pydot is imported when one of its functions is first
+used, so that pydot (and pyparsing) are not loaded by import networkx.
+write_dot() streams DOT without pydot.
+"""
+import sys
+from networkx.utils import LazyModule
 
+_pydot=['read_dot', 'graphviz_layout', 'pydot_layout', 'to_pydot',
+        'from_pydot']
+_dot=['write_dot', 'generate_dot']
+
+__all__ = _dot+_pydot
+
+_attrs=dict((name,__name__+'.nx_pydot') for name in _pydot)
+_attrs.update((name,__name__+'.nx_dot') for name in _dot)
+sys.modules[__name__]=LazyModule(sys.modules[__name__],_attrs)
@@ -0,0 +1,140 @@
+"""
+Write graphs in the Graphviz DOT language without pydot.
+
+write_dot() streams the nodes and edges of a graph straight to the
+file, one statement per line, instead of building a pydot.Dot object
+and rendering it in memory.  The output has the same layout as
+to_pydot(G).to_string():
+
+    strict graph G {
+    a [color=red];
+    a -- b [weight=2];
+    }
+
+Identifiers (node names, attribute names and values) are written bare
+if they are DOT identifiers or numerals and quoted otherwise, with
+double quotes escaped and the backslashes before them, before a
+newline or at the end doubled.  Values of the form <...> are written as HTML
+labels.  The graph attributes and the node and edge defaults are taken
+from G.graph['graph'], G.graph['node'] and G.graph['edge'].
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['write_dot', 'generate_dot']
+
+import re
+
+from networkx.utils import is_string_like, _get_fh
+
+_id_re=re.compile(r'^([A-Za-z_\x80-\xff][A-Za-z0-9_\x80-\xff]*'
+                  r'|-?(\.[0-9]+|[0-9]+(\.[0-9]*)?))$')
+_backslashes_re=re.compile(r'(\\+)(?="|\r?\n|\Z)')
+_keywords=frozenset(['node','edge','graph','digraph','subgraph','strict'])
+
+def _quote(x):
+    r"""Return x as a DOT identifier, quoted if necessary.
+
+    >>> print _quote('a\\"b')
+    "a\\\"b"
+    >>> print _quote('a b\\\\\\')
+    "a b\\\\\\"
+    """
+    if isinstance(x,unicode):
+        s=x.encode('utf-8')
+    else:
+        s=str(x)
+    if _id_re.match(s) and s.lower() not in _keywords:
+        return s
+    if s.startswith('<') and s.endswith('>'):
+        return s
+    # double the backslashes before a quote, a newline or the end, so
+    # that they do not escape the quote, the \n or the closing quote
+    s=_backslashes_re.sub(lambda m: m.group(1)*2,s)
+    s=s.replace('"','\\"').replace('\r\n','\\n').replace('\n','\\n')
+    return '"%s"'%s
+
+def _attributes(d, quote):
+    """Return the attribute list [k=v, ...] of d, or '' if d is empty."""
+    if not d:
+        return ''
+    return ' [%s]'%', '.join(['%s=%s'%(quote(k),quote(v))
+                              for k,v in d.iteritems()])
+
+def generate_dot(G):
+    """Generate the lines of the DOT representation of G.
+
+    The lines have no trailing newline.  The graph is strict unless it
+    has self-loops or is a multigraph; the edges of a multigraph carry
+    their key as the attribute key.
+
+    >>> import networkx
+    >>> G=networkx.Graph()
+    >>> G.add_edge('a','b',label='x y')
+    >>> for line in generate_dot(G):
+    ...     print line
+    strict graph G {
+    a;
+    b;
+    a -- b [label="x y"];
+    }
+    """
+    quote=_quote
+    if G.is_directed():
+        graph_type='digraph'
+        edgeop=' -> '
+    else:
+        graph_type='graph'
+        edgeop=' -- '
+    multigraph=G.is_multigraph()
+    if G.number_of_selfloops()==0 and not multigraph:
+        yield 'strict %s G {'%graph_type
+    else:
+        yield '%s G {'%graph_type
+    for k,v in G.graph.get('graph',{}).iteritems():
+        yield '%s=%s;'%(quote(k),quote(v))
+    for name in ('node','edge'):
+        defaults=G.graph.get(name)
+        if defaults:
+            yield '%s%s;'%(name,_attributes(defaults,quote))
+    # quoted node names, each node is quoted once
+    names={}
+    for n,d in G.nodes_iter(data=True):
+        s=names[n]=quote(n)
+        yield '%s%s;'%(s,_attributes(d,quote))
+    if multigraph:
+        for u,v,key,d in G.edges_iter(data=True,keys=True):
+            d=dict(d)
+            d['key']=key
+            yield '%s%s%s%s;'%(names[u],edgeop,names[v],_attributes(d,quote))
+    else:
+        for u,v,d in G.edges_iter(data=True):
+            yield '%s%s%s%s;'%(names[u],edgeop,names[v],_attributes(d,quote))
+    yield '}'
+
+def write_dot(G, path):
+    """Write G in the DOT language to path.
+
+    Parameters
+    ----------
+    G : graph
+    path : file or string
+       File or filename to write.
+       Filenames ending in .gz or .bz2 will be compressed.
+
+    The lines are those of generate_dot(); pydot is not needed.
+    """
+    fh=_get_fh(path,'w')
+    write=fh.write
+    for line in generate_dot(G):
+        write(line)
+        write('\n')
+    if is_string_like(path):
+        fh.close()
+    else:
+        fh.flush() # might be a user filehandle so leave open (but flush)
@@ -13,21 +13,10 @@ __all__ = ['write_dot', 'read_dot', 'graphviz_layout', 'pydot_layout',
 import sys
 from networkx.utils import _get_fh
 import networkx
+# write_dot() streams DOT itself and does not need pydot
+from networkx.drawing.nx_dot import write_dot
 
 
-def write_dot(G,path):
-    
-    try:
-        import pydot
-    except ImportError:
-        raise ImportError, \
-          "write_dot() requires pydot http://dkbza.org/pydot.html/"
-    fh=_get_fh(path,'w')
-    P=to_pydot(G)
-    fh.write(P.to_string())
-    fh.flush() # might be a user filehandle so leave open (but flush)
-    return
-
 def read_dot(path):
     
     try:
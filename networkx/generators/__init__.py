@@ -0,0 +1,5 @@
+"""
+Graph generators.
+"""
+from random_graphs import *
+from degree_seq import *
@@ -0,0 +1,178 @@
+"""
+Random graphs with given degree sequences.
+
+configuration_model() connects the nodes by a random perfect matching
+of their degree stubs: node i appears deg[i] times in a list of stubs,
+the list is shuffled and consecutive stubs are joined.  Both steps are
+linear, and with NumPy installed they are vectorised.  Graph and
+DiGraph have no parallel edges, so repeated pairs are added once and
+the degrees of the result can be smaller than requested; self-loops
+are kept.  create_degree_sequence() draws a degree sequence from one
+of the sequence helpers of networkx.utils.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['configuration_model', 'configuration_model_edge_columns',
+           'directed_configuration_model',
+           'directed_configuration_model_edge_columns',
+           'create_degree_sequence']
+
+from array import array
+
+from networkx.exception import NetworkXError
+from networkx.utils import create_random_state, create_numpy_random_state,\
+     powerlaw_sequence
+from networkx.generators.random_graphs import _empty_graph
+
+def _degrees(deg_sequence):
+    """Return deg_sequence as a list of ints, checking the values."""
+    if hasattr(deg_sequence,'tolist'):
+        deg_sequence=deg_sequence.tolist()
+    degrees=[]
+    for d in deg_sequence:
+        if d<0 or int(d)!=d:
+            raise NetworkXError(\
+                "The degree %s is not a nonnegative integer."%(d,))
+        degrees.append(int(d))
+    return degrees
+
+def _stubs(degrees, shuffle, seed):
+    """Return the stub list of degrees, shuffled if shuffle is True.
+
+    The list is a NumPy array, or array('l') without NumPy.
+    """
+    try:
+        import numpy
+    except ImportError:
+        stubs=[]
+        for i,d in enumerate(degrees):
+            stubs.extend([i]*d)
+        if shuffle:
+            create_random_state(seed).shuffle(stubs)
+        return array('l',stubs)
+    stubs=numpy.repeat(numpy.arange(len(degrees),dtype=numpy.int64),degrees)
+    if shuffle:
+        create_numpy_random_state(seed).shuffle(stubs)
+    return stubs
+
+def configuration_model_edge_columns(deg_sequence, seed=None):
+    """Return the edges of a configuration model graph as columns (us, vs).
+
+    Node i has deg_sequence[i] stubs; the shuffled stubs are paired in
+    order, so the columns can hold repeated pairs and self-loops.  The
+    sum of the degrees must be even.  The columns are NumPy integer
+    arrays, or array('l') without NumPy.  seed is as for
+    networkx.utils.create_numpy_random_state(), or
+    create_random_state() without NumPy.
+
+    >>> us,vs=configuration_model_edge_columns([1,2,1],seed=1)
+    >>> len(us)
+    2
+    """
+    degrees=_degrees(deg_sequence)
+    if sum(degrees)%2:
+        raise NetworkXError("The sum of the degree sequence is odd.")
+    stubs=_stubs(degrees,True,seed)
+    return stubs[0::2],stubs[1::2]
+
+def configuration_model(deg_sequence, seed=None, create_using=None):
+    """Return a random graph with the given degree sequence.
+
+    Parameters
+    ----------
+    deg_sequence : list of ints
+       Degree of each node; the nodes are 0..len(deg_sequence)-1.  The
+       sum must be even, see create_degree_sequence().
+    seed : integer, random.Random instance or None
+       See configuration_model_edge_columns().
+    create_using : Graph, optional
+       Graph to fill, it is cleared first.
+
+    Parallel edges are merged, so nodes can end up with smaller
+    degrees than requested; self-loops are kept.
+
+    >>> G=configuration_model([1,2,1],seed=1)
+    >>> sorted(G.nodes())
+    [0, 1, 2]
+    """
+    G=_empty_graph(create_using)
+    if G.is_directed():
+        raise NetworkXError(\
+            "configuration_model requires an undirected graph, "
+            "use directed_configuration_model.")
+    G.name="configuration_model %d nodes"%(len(deg_sequence),)
+    us,vs=configuration_model_edge_columns(deg_sequence,seed)
+    G.add_nodes_from(xrange(len(deg_sequence)))
+    G.add_edges_from_columns(us,vs)
+    return G
+
+def directed_configuration_model_edge_columns(in_deg_sequence,
+                                              out_deg_sequence, seed=None):
+    """Return the edges of a directed configuration model graph as
+    columns (us, vs).
+
+    The out-stubs in node order are paired with the shuffled in-stubs.
+    The two sequences must have the same length and sum.  See
+    configuration_model_edge_columns() for the columns and seed.
+    """
+    in_degrees=_degrees(in_deg_sequence)
+    out_degrees=_degrees(out_deg_sequence)
+    if len(in_degrees)!=len(out_degrees):
+        raise NetworkXError(\
+            "The in- and out-degree sequences have different lengths.")
+    if sum(in_degrees)!=sum(out_degrees):
+        raise NetworkXError(\
+            "The in- and out-degree sequences have different sums.")
+    return _stubs(out_degrees,False,seed),_stubs(in_degrees,True,seed)
+
+def directed_configuration_model(in_deg_sequence, out_deg_sequence,
+                                 seed=None, create_using=None):
+    """Return a random directed graph with the given in- and out-degree
+    sequences.
+
+    The nodes are 0..n-1 for sequences of length n; see
+    configuration_model() for the other arguments.  Parallel edges are
+    merged and self-loops are kept.
+
+    >>> G=directed_configuration_model([1,0],[0,1],seed=1)
+    >>> G.edges()
+    [(1, 0)]
+    """
+    G=_empty_graph(create_using,True)
+    if not G.is_directed():
+        raise NetworkXError(\
+            "directed_configuration_model requires a directed graph.")
+    G.name="directed_configuration_model %d nodes"%(len(in_deg_sequence),)
+    us,vs=directed_configuration_model_edge_columns(in_deg_sequence,
+                                                    out_deg_sequence,seed)
+    G.add_nodes_from(xrange(len(in_deg_sequence)))
+    G.add_edges_from_columns(us,vs)
+    return G
+
+def create_degree_sequence(n, sfunction=powerlaw_sequence, max_tries=50,
+                           seed=None, **kwds):
+    """Return a degree sequence of length n with an even sum.
+
+    The sequence is drawn with sfunction(n, seed=..., **kwds), one of
+    the sequence helpers of networkx.utils such as powerlaw_sequence
+    (the default) or pareto_sequence, and rounded to integers.  The
+    draw is repeated until the sum is even, at most max_tries times.
+    seed is as for networkx.utils.create_random_state().
+
+    >>> seq=create_degree_sequence(10,exponent=2.5,seed=1)
+    >>> len(seq), sum(seq)%2
+    (10, 0)
+    """
+    rng=create_random_state(seed)
+    for i in xrange(max_tries):
+        seq=[int(round(x)) for x in sfunction(n,seed=rng,**kwds)]
+        if sum(seq)%2==0:
+            return seq
+    raise NetworkXError(\
+        "No degree sequence with an even sum after %d tries."%(max_tries,))
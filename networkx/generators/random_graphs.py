@@ -0,0 +1,271 @@
+"""
+Random graphs in O(n+m) time.
+
+fast_gnp_random_graph() draws the Erdos-Renyi graph G(n,p) by
+geometric skipping: the gaps between consecutive edges in a list of
+all node pairs are geometrically distributed, so one random number is
+drawn per edge rather than per pair.  expected_degree_graph() draws
+the Chung-Lu graph with given expected degrees the same way, with the
+nodes sorted by decreasing weight so that the edge probability only
+decreases along a row and rejection corrects for the difference.
+
+The edges are collected in integer columns and added to the graph with
+add_edges_from_columns().  The *_edge_columns() functions return the
+columns themselves (NumPy arrays or array('l')) for building other
+representations or writing them out without a dict-of-dicts graph.
+With NumPy installed the G(n,p) gaps are drawn vectorised, so the
+edges for a given seed depend on whether NumPy is installed.
+
+References: V. Batagelj and U. Brandes, Efficient generation of large
+random networks, Phys. Rev. E 71, 036113 (2005); J. C. Miller and
+A. Hagberg, Efficient generation of networks with given expected
+degrees, WAW 2011.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['fast_gnp_random_graph', 'gnp_random_edge_columns',
+           'expected_degree_graph', 'expected_degree_edge_columns']
+
+import math
+from array import array
+
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.exception import NetworkXError
+from networkx.utils import create_random_state, create_numpy_random_state
+
+# largest number of gaps drawn at once by the NumPy G(n,p) sampler
+_BATCH=1<<22
+
+def _empty_graph(create_using, directed=False):
+    """Return create_using cleared, or a new Graph or DiGraph."""
+    if create_using is None:
+        if directed:
+            return DiGraph()
+        return Graph()
+    create_using.clear()
+    return create_using
+
+def gnp_random_edge_columns(n, p, seed=None, directed=False):
+    """Return the edges of a G(n,p) random graph as columns (us, vs).
+
+    The nodes are 0..n-1.  Each of the n(n-1)/2 pairs u>v (n(n-1)
+    ordered pairs u!=v if directed) is an edge with probability p.
+    The columns are NumPy integer arrays, or array('l') without NumPy.
+    seed is as for networkx.utils.create_numpy_random_state(), or
+    create_random_state() without NumPy.
+
+    >>> us,vs=gnp_random_edge_columns(10,1.0)
+    >>> len(us)
+    45
+    """
+    if n<0:
+        raise NetworkXError("The number of nodes %d is negative."%(n,))
+    if directed:
+        npairs=n*(n-1)
+    else:
+        npairs=n*(n-1)//2
+    try:
+        import numpy
+    except ImportError:
+        return _gnp_columns(n,p,seed,directed)
+    if p<=0 or npairs==0:
+        k=numpy.zeros(0,dtype=numpy.int64)
+    elif p>=1:
+        k=numpy.arange(npairs,dtype=numpy.int64)
+    else:
+        rs=create_numpy_random_state(seed)
+        batch=int(min(npairs*p+6*math.sqrt(npairs*p)+16,_BATCH))
+        chunks=[]
+        last=-1
+        while True:
+            k=last+numpy.cumsum(rs.geometric(p,size=batch),dtype=numpy.int64)
+            if k[-1]>=npairs:
+                chunks.append(k[k<npairs])
+                break
+            chunks.append(k)
+            last=k[-1]
+        k=numpy.concatenate(chunks)
+    # decode the pair indices into rows u and columns v
+    if directed:
+        us=k//(n-1)
+        vs=k-us*(n-1)
+        # column u is left out of row u, it would be a self-loop
+        vs+=(vs>=us)
+    else:
+        # row u holds the pairs (u,0)..(u,u-1) from index u(u-1)/2 on
+        us=((1+numpy.sqrt(8*k+1))//2).astype(numpy.int64)
+        vs=k-us*(us-1)//2
+        # correct rounding errors of the square root
+        us-=(vs<0)
+        vs=k-us*(us-1)//2
+        us+=(vs>=us)
+        vs=k-us*(us-1)//2
+    return us,vs
+
+def _gnp_columns(n, p, seed, directed):
+    """Pure Python gnp_random_edge_columns()."""
+    us=array('l')
+    vs=array('l')
+    if p<=0 or n<2:
+        return us,vs
+    if p>=1:
+        for u in xrange(n):
+            if directed:
+                others=[v for v in xrange(n) if v!=u]
+            else:
+                others=range(u)
+            us.extend([u]*len(others))
+            vs.extend(others)
+        return us,vs
+    rand=create_random_state(seed).random
+    log=math.log
+    lp=log(1.0-p)
+    append_u=us.append
+    append_v=vs.append
+    # walk the rows u, w is the position in the row of length rowlen
+    if directed:
+        u=0
+        rowlen=n-1
+    else:
+        u=1
+        rowlen=1
+    w=-1
+    while True:
+        w+=1+int(log(1.0-rand())/lp)
+        while w>=rowlen:
+            w-=rowlen
+            u+=1
+            if u>=n:
+                return us,vs
+            if not directed:
+                rowlen=u
+        append_u(u)
+        if directed and w>=u:
+            append_v(w+1)
+        else:
+            append_v(w)
+
+def fast_gnp_random_graph(n, p, seed=None, directed=False, create_using=None):
+    """Return a G(n,p) random graph in O(n+m) time.
+
+    Parameters
+    ----------
+    n : int
+       Number of nodes, the nodes are 0..n-1.
+    p : float
+       Probability of each edge.
+    seed : integer, random.Random instance or None
+       See gnp_random_edge_columns().
+    directed : bool
+       If True return a DiGraph, each ordered pair u!=v being an edge
+       with probability p.
+    create_using : Graph or DiGraph, optional
+       Graph to fill, it is cleared first.  Its type decides whether
+       the edges are directed.
+
+    >>> G=fast_gnp_random_graph(100,0.1,seed=42)
+    >>> G.number_of_nodes()
+    100
+    """
+    G=_empty_graph(create_using,directed)
+    G.name="fast_gnp_random_graph(%s,%s)"%(n,p)
+    G.add_nodes_from(xrange(n))
+    us,vs=gnp_random_edge_columns(n,p,seed,G.is_directed())
+    G.add_edges_from_columns(us,vs)
+    return G
+
+def expected_degree_edge_columns(w, seed=None, selfloops=True):
+    """Return the edges of a Chung-Lu random graph as columns (us, vs).
+
+    Node i (the position in w) has expected degree w[i]: the edge
+    (u,v) is present with probability min(w[u]*w[v]/sum(w),1).  The
+    columns are array('l').  seed is as for
+    networkx.utils.create_random_state().
+
+    >>> us,vs=expected_degree_edge_columns([0,0,0])
+    >>> len(us)
+    0
+    """
+    w=list(w)
+    n=len(w)
+    us=array('l')
+    vs=array('l')
+    for x in w:
+        if x<0:
+            raise NetworkXError("The expected degree %s is negative."%(x,))
+    total=float(sum(w))
+    if n==0 or total==0:
+        return us,vs
+    rand=create_random_state(seed).random
+    log=math.log
+    # the nodes in order of decreasing weight
+    order=sorted(xrange(n),key=w.__getitem__,reverse=True)
+    seq=[w[i] for i in order]
+    append_u=us.append
+    append_v=vs.append
+    for i in xrange(n):
+        factor=seq[i]/total
+        if factor==0:
+            break
+        j=i
+        if not selfloops:
+            j+=1
+        if j>=n:
+            break
+        p=min(seq[j]*factor,1)
+        while j<n and p>0:
+            if p<1:
+                # skip the pairs before the next candidate, each would
+                # be an edge with probability at most p
+                j+=int(log(1.0-rand())/log(1.0-p))
+                if j>=n:
+                    break
+            q=min(seq[j]*factor,1)
+            if rand()<q/p:
+                append_u(order[i])
+                append_v(order[j])
+            j+=1
+            p=q
+    return us,vs
+
+def expected_degree_graph(w, seed=None, selfloops=True, create_using=None):
+    """Return a random graph with the given expected degrees.
+
+    Parameters
+    ----------
+    w : list
+       Expected degree of each node; the nodes are 0..len(w)-1.  A
+       sequence helper of networkx.utils such as powerlaw_sequence
+       gives heavy-tailed weights.
+    seed : integer, random.Random instance or None
+       See networkx.utils.create_random_state().
+    selfloops : bool
+       If False no self-loops are drawn.
+    create_using : Graph, optional
+       Graph to fill, it is cleared first.
+
+    This is the Chung-Lu model: the edge (u,v) is present with
+    probability min(w[u]*w[v]/sum(w),1), independently of the other
+    edges.  It runs in O(n log n + m) time.
+
+    >>> from networkx.utils import powerlaw_sequence
+    >>> w=powerlaw_sequence(100,2.5,seed=1)
+    >>> G=expected_degree_graph(w,seed=1)
+    >>> G.number_of_nodes()
+    100
+    """
+    G=_empty_graph(create_using)
+    if G.is_directed():
+        raise NetworkXError("expected_degree_graph requires an undirected graph.")
+    G.name="expected_degree_graph"
+    G.add_nodes_from(xrange(len(w)))
+    us,vs=expected_degree_edge_columns(w,seed,selfloops)
+    G.add_edges_from_columns(us,vs)
+    return G
@@ -1,4 +1,27 @@
 """
 A package for reading and writing graphs in various formats.
+
+The reader and writer modules are imported when one of their functions
+is first used.
 """
-from gpickle import *
+import sys
+from networkx.utils import LazyModule
+
+# functions of each module, loaded on first access
+_modules={'gpickle': ['read_gpickle', 'write_gpickle'],
+          'gbin': ['read_gbin', 'write_gbin', 'read_gbin_nodes',
+                   'read_gbin_edges'],
+          'csrmap': ['read_csrmap', 'write_csrmap', 'MappedCSRGraph',
+                     'MappedCSRDiGraph'],
+          'edgelist': ['read_edgelist', 'write_edgelist',
+                       'read_weighted_edgelist', 'write_weighted_edgelist'],
+          }
+
+__all__=[]
+_attrs={}
+for _module,_names in _modules.iteritems():
+    __all__.extend(_names)
+    for _name in _names:
+        _attrs[_name]=__name__+'.'+_module
+
+sys.modules[__name__]=LazyModule(sys.modules[__name__],_attrs)
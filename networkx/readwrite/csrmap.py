@@ -0,0 +1,354 @@
+"""
+Read-only graphs memory-mapped from a CSR file.
+
+write_csrmap() stores the compressed sparse row structure of a graph
+(see networkx.CSRGraph) as flat little-endian arrays in a file.
+read_csrmap() maps that file into memory and returns a MappedCSRGraph
+or MappedCSRDiGraph whose read methods work directly on the mapped
+buffers.  Loading does not depend on the size of the graph and all
+processes that map the same file share its pages through the
+operating system's page cache instead of holding private copies.
+
+Node labels are stored only if the nodes are not the integers
+0..n-1; they are unpickled on first use.  Node attributes are not
+stored.  The file must not be changed while it is mapped.
+
+Format
+------
+A 104 byte header: the magic string 'NXCSRMAP', the major and minor
+format version (unsigned bytes), flags (unsigned short: bit 0
+directed, bit 1 weighted, bit 2 labels stored), the number of nodes,
+the number of entries of the neighbor array and the number of edges
+(64 bit ints), then the byte offsets of the sections below (64 bit
+ints, 0 if absent) and 4 bytes of padding:
+
+  ============  ==========================================
+  section       contents
+  ============  ==========================================
+  indptr        n+1 64 bit ints, row offsets
+  indices       32 bit ints, neighbor indices, rows sorted
+  weights       64 bit floats, one per neighbor entry
+  pred_indptr   as indptr, for predecessors (directed)
+  pred_indices  as indices, for predecessors (directed)
+  pred_weights  as weights, for predecessors (directed)
+  labels        pickled list of node labels
+  graph         pickled (name, graph attributes, weight)
+  ============  ==========================================
+
+Sections start at multiples of 8 bytes.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['read_csrmap', 'write_csrmap', 'MappedCSRGraph', 'MappedCSRDiGraph']
+
+import mmap
+import struct
+import sys
+from array import array
+
+import cPickle as pickle
+
+from networkx.classes.csrgraph import CSRGraph, CSRDiGraph, _build_csr
+from networkx.exception import NetworkXError
+from networkx.utils import is_string_like
+
+try:
+    import numpy
+except ImportError:
+    numpy=None
+
+MAGIC='NXCSRMAP'
+VERSION=(1,0)
+DIRECTED,WEIGHTED,LABELS=1,2,4
+
+(INDPTR,INDICES,WEIGHTS,PRED_INDPTR,PRED_INDICES,PRED_WEIGHTS,
+ LABEL_TABLE,GRAPH)=range(8)
+
+_HEADER='<8sBBHqqq8q4x'
+
+def _aligned(offset):
+    return (offset+7) & ~7
+
+_TYPECODES={'q':'lq','i':'il','d':'d'}
+
+def _tostring(values, code):
+    """Return values packed as little-endian items of struct type code."""
+    size=struct.calcsize('<'+code)
+    for typecode in _TYPECODES[code]:
+        try:
+            a=array(typecode)
+        except ValueError: # Python 2 arrays have no 'q' type
+            continue
+        if a.itemsize!=size:
+            continue
+        a.extend(values)
+        if sys.byteorder=='big':
+            a.byteswap()
+        return a.tostring()
+    return struct.pack('<%d%s'%(len(values),code),*values)
+
+def _is_identity(labels):
+    """Return True if labels are the ints 0..n-1 in order.
+
+    Equal floats or bools (0.0, True) do not count, they would be read
+    back as ints.
+    """
+    for k,label in enumerate(labels):
+        if type(label) is not int or label!=k:
+            return False
+    return True
+
+def write_csrmap(G, path, weight=None):
+    """Write the structure of G to a file that read_csrmap() can map.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph, CSRGraph or CSRDiGraph
+    path : file or string
+       File or filename to write.  Compressed files cannot be mapped,
+       so the file is always written uncompressed.
+    weight : string, optional
+       Name of the edge attribute stored as weight column.  Ignored if
+       G is a CSRGraph, whose own weight column is written.
+    """
+    if isinstance(G,CSRGraph):
+        labels=G._labels
+        weight=G.weight
+        sections=[G._indptr,G._indices,G._weights]
+        if G.is_directed():
+            sections+=[G._pred_indptr,G._pred_indices,G._pred_weights]
+        nedges=G._nedges
+    else:
+        if G.is_multigraph():
+            raise NetworkXError("write_csrmap() does not support multigraphs.")
+        labels=list(G.adj)
+        n=len(labels)
+        if _is_identity(sorted(labels)):
+            labels=range(n)
+        index=dict((v,i) for i,v in enumerate(labels))
+        if G.is_directed():
+            sections=list(_build_csr(G.succ,index,weight))+\
+                     list(_build_csr(G.pred,index,weight))
+        else:
+            sections=list(_build_csr(G.adj,index,weight))
+        nedges=G.number_of_edges()
+    n=len(labels)
+    flags=0
+    if G.is_directed():
+        flags|=DIRECTED
+    if weight is not None:
+        flags|=WEIGHTED
+    chunks=[None]*8
+    for k,code in enumerate('qidqid'[:len(sections)]):
+        if sections[k] is not None:
+            chunks[k]=_tostring(sections[k],code)
+    if not _is_identity(labels):
+        flags|=LABELS
+        chunks[LABEL_TABLE]=pickle.dumps(list(labels),
+                                         pickle.HIGHEST_PROTOCOL)
+    chunks[GRAPH]=pickle.dumps((G.name,G.graph,weight),
+                               pickle.HIGHEST_PROTOCOL)
+    offsets=[0]*8
+    pos=_aligned(struct.calcsize(_HEADER))
+    for k,chunk in enumerate(chunks):
+        if chunk is not None:
+            offsets[k]=pos
+            pos=_aligned(pos+len(chunk))
+    if is_string_like(path):
+        fh=open(path,'wb')
+    else:
+        fh=path
+    nnz=len(sections[INDICES])
+    fh.write(struct.pack(_HEADER,MAGIC,VERSION[0],VERSION[1],flags,
+                         n,nnz,nedges,*offsets))
+    pos=struct.calcsize(_HEADER)
+    for k,chunk in enumerate(chunks):
+        if chunk is not None:
+            fh.write('\0'*(offsets[k]-pos))
+            fh.write(chunk)
+            pos=offsets[k]+len(chunk)
+    if is_string_like(path):
+        fh.close()
+    else:
+        fh.flush()
+
+def read_csrmap(path):
+    """Map the CSR file path into memory and return it as a graph.
+
+    Returns a MappedCSRDiGraph for directed graphs and a MappedCSRGraph
+    otherwise.
+
+    >>> import networkx as nx
+    >>> G=nx.Graph()
+    >>> G.add_path([0,1,2])
+    >>> nx.write_csrmap(G,'path.csr')          # doctest: +SKIP
+    >>> M=nx.read_csrmap('path.csr')           # doctest: +SKIP
+    >>> M.neighbors(1)                         # doctest: +SKIP
+    [0, 2]
+    """
+    fh=open(path,'rb')
+    try:
+        flags=_read_header(fh.read(struct.calcsize(_HEADER)))[0]
+    finally:
+        fh.close()
+    if flags & DIRECTED:
+        return MappedCSRDiGraph(path)
+    return MappedCSRGraph(path)
+
+def _read_header(data):
+    if len(data)!=struct.calcsize(_HEADER):
+        raise NetworkXError("Not a csrmap file.")
+    header=struct.unpack(_HEADER,data)
+    magic,major,minor,flags=header[:4]
+    if magic!=MAGIC:
+        raise NetworkXError("Not a csrmap file.")
+    if major!=VERSION[0]:
+        raise NetworkXError(\
+            "Unsupported csrmap format version %d.%d."%(major,minor))
+    return header[3:]
+
+
+class _MappedArray(object):
+    """Read-only sequence of little-endian items in a buffer.
+
+    Used to access the mapped sections when numpy is not available.
+    Supports len(), indexing and slicing (slices are tuples).
+    """
+    __slots__=('_buf','_code','_itemsize','_offset','_len')
+
+    def __init__(self, buf, code, offset, length):
+        self._buf=buf
+        self._code='<'+code
+        self._itemsize=struct.calcsize(self._code)
+        self._offset=offset
+        self._len=length
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, k):
+        if isinstance(k,slice):
+            start,stop,step=k.indices(self._len)
+            if step!=1:
+                return tuple([self[i] for i in xrange(start,stop,step)])
+            if stop<=start:
+                return ()
+            return struct.unpack_from('<%d%s'%(stop-start,self._code[1]),
+                                      self._buf,
+                                      self._offset+start*self._itemsize)
+        if k<0:
+            k+=self._len
+        if not 0<=k<self._len:
+            raise IndexError("index out of range")
+        return struct.unpack_from(self._code,self._buf,
+                                  self._offset+k*self._itemsize)[0]
+
+    def __iter__(self):
+        step=4096
+        for start in xrange(0,self._len,step):
+            for x in self[start:start+step]:
+                yield x
+
+
+class _IdentityIndex(object):
+    """Mapping of the nodes 0..n-1 to themselves."""
+    __slots__=('_n',)
+
+    def __init__(self, n):
+        self._n=n
+
+    def __contains__(self, n):
+        # like a dict, accept the values equal to an int (1.0, True)
+        try:
+            i=int(n)
+        except (TypeError,ValueError,OverflowError):
+            return False
+        return i==n and 0<=i<self._n
+
+    def __getitem__(self, n):
+        if n not in self:
+            raise KeyError(n)
+        return int(n)
+
+    def __len__(self):
+        return self._n
+
+
+class _MappedCSRMixin(object):
+    """Loading and label handling shared by the mapped graph classes."""
+    def __init__(self, path):
+        fh=open(path,'rb')
+        try:
+            self._map=mmap.mmap(fh.fileno(),0,access=mmap.ACCESS_READ)
+        finally:
+            fh.close()
+        self.path=path
+        header=_read_header(self._map[:struct.calcsize(_HEADER)])
+        flags,n,nnz,nedges=header[:4]
+        offsets=header[4:]
+        if bool(flags & DIRECTED)!=self.is_directed():
+            raise NetworkXError("%s cannot map a %s graph."%\
+                (self.__class__.__name__,
+                 ['undirected','directed'][flags & DIRECTED]))
+        self._offsets=offsets
+        self._nedges=nedges
+        self._indptr=self._section(INDPTR,'q',n+1)
+        self._indices=self._section(INDICES,'i',nnz)
+        self._weights=self._section(WEIGHTS,'d',nnz)
+        if self.is_directed():
+            self._pred_indptr=self._section(PRED_INDPTR,'q',n+1)
+            self._pred_indices=self._section(PRED_INDICES,'i',nnz)
+            self._pred_weights=self._section(PRED_WEIGHTS,'d',nnz)
+        if flags & LABELS:
+            self._label_cache=None
+        else:
+            self._label_cache=(xrange(n),_IdentityIndex(n))
+        self.name,self.graph,self.weight=pickle.loads(\
+            self._map[offsets[GRAPH]:])
+
+    def _section(self, k, code, length):
+        offset=self._offsets[k]
+        if offset==0:
+            return None
+        if numpy is not None:
+            return numpy.frombuffer(self._map,dtype='<'+code,
+                                    count=length,offset=offset)
+        return _MappedArray(self._map,code,offset,length)
+
+    def _load_labels(self):
+        if self._label_cache is None:
+            labels=pickle.loads(self._map[self._offsets[LABEL_TABLE]:])
+            index=dict((n,i) for i,n in enumerate(labels))
+            self._label_cache=(labels,index)
+        return self._label_cache
+
+    _labels=property(lambda self: self._load_labels()[0])
+    _index=property(lambda self: self._load_labels()[1])
+
+    def __reduce__(self):
+        # map the file again instead of pickling the arrays
+        return (self.__class__,(self.path,))
+
+
+class MappedCSRGraph(_MappedCSRMixin, CSRGraph):
+    """A read-only undirected graph over a memory-mapped CSR file.
+
+    MappedCSRGraph(path) maps a file written by write_csrmap().  It has
+    the read methods of CSRGraph.  Pickling it (e.g. to send it to a
+    worker process) only transfers the path; the receiver maps the
+    file again.
+    """
+
+
+class MappedCSRDiGraph(_MappedCSRMixin, CSRDiGraph):
+    """A read-only directed graph over a memory-mapped CSR file.
+
+    MappedCSRDiGraph(path) maps a file written by write_csrmap().  It
+    has the read methods of CSRDiGraph.
+    """
@@ -0,0 +1,272 @@
+"""
+Read and write graphs as edge lists.
+
+An edge list has one edge per line: the two nodes and, for weighted
+edge lists, the weight, separated by whitespace or a delimiter.
+Text after the comment character is ignored.
+
+    # source target weight
+    1 2 0.5
+    2 3 1.5
+
+Parsing is CPU bound, so the readers can split the input into chunks
+and parse them in a multiprocessing pool.  Uncompressed files are split
+into byte ranges that the worker processes read themselves; for .gz
+and .bz2 files (and open file handles) the main process reads the
+chunks and sends their text to the workers.  At most two chunks per
+worker are in flight, and input of a single chunk is parsed without a
+pool.  The parsed chunks are merged in file order with
+Graph.add_edges_from_columns().
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['read_edgelist', 'write_edgelist',
+           'read_weighted_edgelist', 'write_weighted_edgelist']
+
+import os
+from array import array
+from collections import deque
+from itertools import izip, islice, chain
+
+import networkx
+from networkx.exception import NetworkXError
+from networkx.utils import is_string_like,_get_fh
+
+def write_edgelist(G, path, comments="#", delimiter=' '):
+    """Write the edges of G, one per line, to path.
+
+    Parameters
+    ----------
+    G : graph
+    path : file or string
+       File or filename to write.
+       Filenames ending in .gz or .bz2 will be compressed.
+    comments : string
+       Character used to mark the header line.
+    delimiter : string
+       Separator of the nodes.
+    """
+    fh=_get_fh(path,mode='w')
+    fh.write("%s %s\n"%(comments,G.name))
+    for u,v in G.edges_iter():
+        fh.write("%s%s%s\n"%(u,delimiter,v))
+    if is_string_like(path):
+        fh.close()
+    else:
+        fh.flush()
+
+def write_weighted_edgelist(G, path, comments="#", delimiter=' ',
+                            weight='weight'):
+    """Write the edges of G with their weights, one per line, to path.
+
+    Edges without the weight attribute are written with weight 1.
+    See write_edgelist() for the other arguments.
+    """
+    fh=_get_fh(path,mode='w')
+    fh.write("%s %s\n"%(comments,G.name))
+    for u,v,d in G.edges_iter(data=True):
+        fh.write("%s%s%s%s%r\n"%(u,delimiter,v,delimiter,d.get(weight,1)))
+    if is_string_like(path):
+        fh.close()
+    else:
+        fh.flush()
+
+def read_edgelist(path, comments="#", delimiter=None, create_using=None,
+                  nodetype=None, processes=None, chunksize=1<<22):
+    """Read a graph from the edge list in path.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string
+       Character marking the start of a comment.
+    delimiter : string
+       Separator of the nodes, default any whitespace.
+    create_using : graph, optional
+       Graph (e.g. a DiGraph) to add the edges to; it is cleared first.
+       Default Graph().
+    nodetype : type, optional
+       Convert the node labels (strings) to this type, e.g. int.  With
+       processes > 1 it must be picklable (a builtin type or a module
+       level function).
+    processes : int, optional
+       Number of worker processes, default the number of CPUs.  With
+       processes=1 the file is parsed in this process.
+    chunksize : int
+       Approximate number of bytes per parsed chunk.
+
+    Lines with fewer than two fields are skipped; fields after the
+    second are ignored.
+
+    >>> import networkx as nx
+    >>> G=nx.read_edgelist('test.edgelist', nodetype=int) # doctest: +SKIP
+    """
+    return _read(path,comments,delimiter,create_using,nodetype,None,
+                 processes,chunksize)
+
+def read_weighted_edgelist(path, comments="#", delimiter=None,
+                           create_using=None, nodetype=None,
+                           weight='weight', processes=None,
+                           chunksize=1<<22):
+    """Read a graph from the weighted edge list in path.
+
+    The third field of each line is converted to a float and stored as
+    the edge attribute weight; lines without it get weight 1.  See
+    read_edgelist() for the other arguments.
+    """
+    return _read(path,comments,delimiter,create_using,nodetype,weight,
+                 processes,chunksize)
+
+def _read(path, comments, delimiter, create_using, nodetype, weight,
+          processes, chunksize):
+    if create_using is None:
+        G=networkx.Graph()
+    else:
+        G=create_using
+        G.clear()
+    options=(comments,delimiter,nodetype,weight is not None)
+    if processes is None:
+        try:
+            import multiprocessing
+            processes=multiprocessing.cpu_count()
+        except (ImportError,NotImplementedError):
+            processes=1
+    if is_string_like(path) and not path.endswith(('.gz','.bz2')):
+        size=os.path.getsize(path)
+        tasks=[(path,start,min(start+chunksize,size),options)
+               for start in xrange(0,size,chunksize)]
+        processes=min(processes,len(tasks))
+        parse=_parse_range
+    else:
+        tasks=((text,options) for text in _text_chunks(path,chunksize))
+        # read ahead to see whether there is more than one chunk
+        first=list(islice(tasks,2))
+        if len(first)<2:
+            processes=1
+        tasks=chain(first,tasks)
+        parse=_parse_text
+    if processes>1:
+        import multiprocessing
+        pool=multiprocessing.Pool(processes)
+        try:
+            for result in _imap_window(pool,parse,tasks,2*processes):
+                _merge(G,result,weight)
+            pool.close()
+        finally:
+            pool.terminate()
+    else:
+        for task in tasks:
+            _merge(G,parse(task),weight)
+    return G
+
+def _imap_window(pool, f, tasks, window):
+    """Yield f(task) for tasks in order, computed in pool.
+
+    Unlike pool.imap() at most window tasks are submitted and not yet
+    returned, so the text chunks are not all read into memory when
+    the workers or the merge fall behind.
+    """
+    pending=deque()
+    for task in tasks:
+        if len(pending)>=window:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(f,(task,)))
+    while pending:
+        yield pending.popleft().get()
+
+def _text_chunks(path, chunksize):
+    """Yield the text of path in chunks of whole lines."""
+    fh=_get_fh(path,'rb')
+    try:
+        while True:
+            text=fh.read(chunksize)
+            if not text:
+                break
+            if not text.endswith('\n'):
+                text+=fh.readline()
+            yield text
+    finally:
+        if is_string_like(path):
+            fh.close()
+
+def _parse_range(task):
+    """Parse the lines of a file starting in the byte range [start,end)."""
+    path,start,end,options=task
+    fh=open(path,'rb')
+    try:
+        if start>0:
+            # skip the line that started in the previous range
+            fh.seek(start-1)
+            fh.readline()
+        pos=fh.tell()
+        if pos>=end:
+            return _parse_text(('',options))
+        text=fh.read(end-pos)
+        if not text.endswith('\n'):
+            text+=fh.readline()
+    finally:
+        fh.close()
+    return _parse_text((text,options))
+
+def _parse_text(task):
+    """Parse edge list text into (us, vs, weights) columns.
+
+    Integer nodes and weights are returned as packed arrays, which are
+    much cheaper to send back from a worker process than lists.
+    """
+    text,(comments,delimiter,nodetype,weighted)=task
+    lines=text.splitlines()
+    if comments in text:
+        lines=[line.split(comments,1)[0] for line in lines]
+    rows=[s for s in (line.split(delimiter) for line in lines) if len(s)>=2]
+    us=[s[0] for s in rows]
+    vs=[s[1] for s in rows]
+    if nodetype is not None:
+        try:
+            us=map(nodetype,us)
+            vs=map(nodetype,vs)
+        except Exception, e:
+            raise NetworkXError("Failed to convert nodes to type %s: %s"\
+                                %(nodetype,e))
+    if weighted:
+        try:
+            weights=[float(s[2]) if len(s)>2 else 1.0 for s in rows]
+        except ValueError, e:
+            raise NetworkXError("Failed to convert weight to float: %s"%(e,))
+    if nodetype is int:
+        try:
+            us=_pack(array('l',us))
+            vs=_pack(array('l',vs))
+        except OverflowError: # longs, keep the lists
+            pass
+    if weighted:
+        weights=_pack(array('d',weights))
+    else:
+        weights=None
+    return us,vs,weights
+
+def _pack(a):
+    # arrays pickle as lists, so send their bytes
+    return (a.typecode,a.tostring())
+
+def _unpack(column):
+    if isinstance(column,tuple):
+        a=array(column[0])
+        a.fromstring(column[1])
+        return a
+    return column
+
+def _merge(G, result, weight):
+    us,vs,weights=map(_unpack,result)
+    if weights is not None and weight!='weight':
+        G.add_edges_from(izip(us,vs,({weight:w} for w in weights)))
+    else:
+        G.add_edges_from_columns(us,vs,weights=weights)
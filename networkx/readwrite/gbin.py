@@ -0,0 +1,298 @@
+"""
+Read and write graphs in a chunked, versioned binary format.
+
+Unlike gpickle, which pickles the whole graph object at once, the
+format stores a graph as a sequence of independent blocks, so that
+writing and reading need memory for one block at a time (plus the
+node index), parts of a file can be read without loading the rest,
+and files do not depend on the internals of the graph classes.
+
+Format
+------
+A file starts with an 8 byte header: the magic string 'NXGB', the
+major and minor format version (one unsigned byte each) and a
+little-endian unsigned short of flags (bit 0: directed).
+
+Blocks follow, each a little-endian (unsigned byte kind, unsigned int
+length) pair and `length` bytes of payload:
+
+  ========  ===================================================
+  kind      payload
+  ========  ===================================================
+  GRAPH     pickled (name, graph attribute dict)
+  NODEDATA  pickled {position: attribute dict} for the next NODES
+            block, only nodes with attributes are included
+  NODES     pickled list of node labels
+  EDGEDATA  pickled {position: data dict} for the next EDGES block,
+            only edges with data are included
+  EDGES     array of little-endian 32 bit ints u0,v0,u1,v1,...
+            indexing the nodes in the order of the NODES blocks
+  END       empty, last block of the file
+  ========  ===================================================
+
+All NODES blocks precede the EDGES blocks.  Readers skip blocks of
+unknown kind, so new kinds can be added with a minor version change.
+
+Files ending in .gz or .bz2 are compressed.
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['read_gbin', 'write_gbin', 'read_gbin_nodes', 'read_gbin_edges']
+
+import struct
+import sys
+from array import array
+
+import cPickle as pickle
+
+import networkx
+from networkx.exception import NetworkXError
+from networkx.utils import is_string_like,_get_fh
+
+MAGIC='NXGB'
+VERSION=(1,0)
+DIRECTED=1
+
+END,GRAPH,NODES,NODEDATA,EDGES,EDGEDATA=range(6)
+
+_HEADER='<4sBBH'
+_BLOCK='<BI'
+
+def _int_array(values=()):
+    """Return an array of 32 bit ints."""
+    for typecode in 'il':
+        if array(typecode).itemsize==4:
+            return array(typecode,values)
+    raise NetworkXError("No 32 bit integer array type on this platform.")
+
+def _write_block(fh, kind, payload):
+    fh.write(struct.pack(_BLOCK,kind,len(payload)))
+    fh.write(payload)
+
+def _write_pickle(fh, kind, obj):
+    _write_block(fh,kind,pickle.dumps(obj,pickle.HIGHEST_PROTOCOL))
+
+def write_gbin(G, path, chunksize=10000):
+    """Write graph G in the chunked binary format to path.
+
+    Nodes and edges are written in blocks of chunksize records, so
+    apart from the block being written only a dict mapping nodes to
+    their positions is held in memory.
+
+    Parameters
+    ----------
+    G : Graph or DiGraph
+    path : file or string
+       File or filename to write.
+       Filenames ending in .gz or .bz2 will be compressed.
+    chunksize : int
+       Number of nodes or edges per block.
+    """
+    fh=_get_fh(path,mode='wb')
+    flags=0
+    if G.is_directed():
+        flags|=DIRECTED
+    fh.write(struct.pack(_HEADER,MAGIC,VERSION[0],VERSION[1],flags))
+    _write_pickle(fh,GRAPH,(G.name,G.graph))
+    index={}
+    nodes=[]
+    nodedata={}
+    for n,d in G.nodes_iter(data=True):
+        index[n]=len(index)
+        if d:
+            nodedata[len(nodes)]=_plain(d)
+        nodes.append(n)
+        if len(nodes)==chunksize:
+            _write_nodes(fh,nodes,nodedata)
+            nodes=[]
+            nodedata={}
+    if nodes:
+        _write_nodes(fh,nodes,nodedata)
+    edges=_int_array()
+    edgedata={}
+    for u,v,d in G.edges_iter(data=True):
+        if d:
+            edgedata[len(edges)/2]=_plain(d)
+        edges.append(index[u])
+        edges.append(index[v])
+        if len(edges)==2*chunksize:
+            _write_edges(fh,edges,edgedata)
+            edges=_int_array()
+            edgedata={}
+    if edges:
+        _write_edges(fh,edges,edgedata)
+    _write_block(fh,END,'')
+    if is_string_like(path):
+        fh.close()
+    else:
+        fh.flush() # might be a user filehandle so leave open (but flush)
+
+def _plain(d):
+    # attribute mappings that are not dicts (e.g. the proxies of
+    # networkx.classes.columnar) are written as dicts
+    if type(d) is dict:
+        return d
+    return dict(d.iteritems())
+
+def _write_nodes(fh, nodes, nodedata):
+    if nodedata:
+        _write_pickle(fh,NODEDATA,nodedata)
+    _write_pickle(fh,NODES,nodes)
+
+def _write_edges(fh, edges, edgedata):
+    if edgedata:
+        _write_pickle(fh,EDGEDATA,edgedata)
+    if sys.byteorder=='big':
+        edges.byteswap()
+    _write_block(fh,EDGES,edges.tostring())
+
+def _read_exactly(fh, size):
+    data=fh.read(size)
+    if len(data)!=size:
+        raise NetworkXError("Unexpected end of gbin file.")
+    return data
+
+def _skip(fh, size):
+    """Skip size bytes of fh, by seeking if the file supports it."""
+    try:
+        fh.seek(size,1)
+    except (AttributeError,IOError):
+        while size>0:
+            size-=len(_read_exactly(fh,min(size,1<<20)))
+
+def _read_blocks(path, kinds):
+    """Yield (directed, kind, payload) for the blocks of the given kinds.
+
+    Blocks of other kinds are skipped without being loaded.  Stops at
+    the END block.
+    """
+    fh=_get_fh(path,'rb')
+    try:
+        header=_read_exactly(fh,struct.calcsize(_HEADER))
+        magic,major,minor,flags=struct.unpack(_HEADER,header)
+        if magic!=MAGIC:
+            raise NetworkXError("Not a gbin file.")
+        if major!=VERSION[0]:
+            raise NetworkXError(\
+                "Unsupported gbin format version %d.%d."%(major,minor))
+        directed=bool(flags & DIRECTED)
+        while True:
+            block=_read_exactly(fh,struct.calcsize(_BLOCK))
+            kind,size=struct.unpack(_BLOCK,block)
+            if kind==END:
+                break
+            if kind in kinds:
+                yield directed,kind,_read_exactly(fh,size)
+            else:
+                _skip(fh,size)
+    finally:
+        if is_string_like(path):
+            fh.close()
+
+def _decode_edges(payload):
+    edges=_int_array()
+    edges.fromstring(payload)
+    if sys.byteorder=='big':
+        edges.byteswap()
+    return edges
+
+def read_gbin(path):
+    """Read a graph written by write_gbin() from path.
+
+    Returns a Graph or a DiGraph depending on the file.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    """
+    G=None
+    labels=[]
+    data={}
+    for directed,kind,payload in _read_blocks(path,
+                                  (GRAPH,NODES,NODEDATA,EDGES,EDGEDATA)):
+        if G is None:
+            if directed:
+                G=networkx.DiGraph()
+            else:
+                G=networkx.Graph()
+        if kind==GRAPH:
+            G.name,G.graph=pickle.loads(payload)
+        elif kind==NODES:
+            nodes=pickle.loads(payload)
+            G.add_nodes_from(nodes)
+            for i,d in data.iteritems():
+                G.node[nodes[i]].update(d)
+            labels.extend(nodes)
+            data={}
+        elif kind==EDGES:
+            edges=_decode_edges(payload)
+            us=[labels[i] for i in edges[0::2]]
+            vs=[labels[i] for i in edges[1::2]]
+            G.add_edges_from_columns(us,vs)
+            for i,d in data.iteritems():
+                G.add_edge(us[i],vs[i],d)
+            data={}
+        else: # NODEDATA or EDGEDATA for the next block
+            data=pickle.loads(payload)
+    return G
+
+def read_gbin_nodes(path, data=False):
+    """Return an iterator over the nodes stored in the gbin file path.
+
+    Only the node blocks are read.  If data is True the iterator
+    yields (node, attribute dict) pairs.
+    """
+    kinds=(NODES,)
+    if data:
+        kinds=(NODES,NODEDATA)
+    nodedata={}
+    for directed,kind,payload in _read_blocks(path,kinds+(EDGES,)):
+        if kind==EDGES: # no more nodes
+            break
+        if kind==NODEDATA:
+            nodedata=pickle.loads(payload)
+            continue
+        nodes=pickle.loads(payload)
+        if data:
+            for i,n in enumerate(nodes):
+                yield (n,nodedata.get(i,{}))
+            nodedata={}
+        else:
+            for n in nodes:
+                yield n
+
+def read_gbin_edges(path, data=False):
+    """Return an iterator over the edges stored in the gbin file path.
+
+    Node attributes are skipped; the node labels are kept in memory
+    to decode the edges.  If data is True the iterator yields
+    (u, v, data dict) triples.
+    """
+    kinds=(NODES,EDGES)
+    if data:
+        kinds=(NODES,EDGES,EDGEDATA)
+    labels=[]
+    edgedata={}
+    for directed,kind,payload in _read_blocks(path,kinds):
+        if kind==NODES:
+            labels.extend(pickle.loads(payload))
+        elif kind==EDGEDATA:
+            edgedata=pickle.loads(payload)
+        else:
+            edges=_decode_edges(payload)
+            for i in xrange(len(edges)/2):
+                u=labels[edges[2*i]]
+                v=labels[edges[2*i+1]]
+                if data:
+                    yield (u,v,edgedata.get(i,{}))
+                else:
+                    yield (u,v)
+            edgedata={}
@@ -0,0 +1,190 @@
+"""
+Relabel the nodes of a graph with consecutive integers.
+
+Nodes may be any hashable object, but long string labels make every
+adjacency lookup hash and compare strings.  relabel_to_integers()
+copies a graph to one with the integer nodes first_label,
+first_label+1, ... in a single pass over the edges, and returns a
+NodeLabels table that converts nodes and results back to the original
+labels.
+
+>>> import networkx as nx
+>>> G=nx.Graph()
+>>> G.add_path(['spam','eggs','ham'])
+>>> H,labels=nx.relabel_to_integers(G,ordering='sorted')
+>>> sorted(H.edges())
+[(0, 1), (0, 2)]
+>>> d=nx.single_source_shortest_path_length(H,labels['ham'])
+>>> sorted(labels.decode_dict(d).items())
+[('eggs', 1), ('ham', 0), ('spam', 2)]
+"""
+__author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu)"""
+#    Copyright (C) 2004-2009 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['NodeLabels', 'integer_labels', 'relabel_to_integers']
+
+from itertools import izip
+from networkx.exception import NetworkXError
+from networkx.utils import is_string_like
+
+class NodeLabels(object):
+    """A reversible table between node labels and the integers
+    first_label, first_label+1, ... in the order of nodes.
+
+    labels[n] is the integer of label n and labels.label(i) the label
+    of integer i.
+    """
+    def __init__(self, nodes, first_label=0):
+        self.first_label=first_label
+        self.labels=list(nodes)
+        self.index=dict(izip(self.labels,
+                             xrange(first_label,first_label+len(self.labels))))
+        if len(self.index)!=len(self.labels):
+            raise NetworkXError("Node labels are not unique.")
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, n):
+        return n in self.index
+
+    def __getitem__(self, n):
+        """Return the integer of label n."""
+        try:
+            return self.index[n]
+        except KeyError:
+            raise NetworkXError("The node %s is not in the table."%(n,))
+
+    def label(self, i):
+        """Return the label of integer i."""
+        if i<self.first_label:
+            raise NetworkXError("No label for %s."%(i,))
+        try:
+            return self.labels[i-self.first_label]
+        except IndexError:
+            raise NetworkXError("No label for %s."%(i,))
+
+    def encode(self, nodes):
+        """Return a list of the integers of the labels in nodes."""
+        index=self.index
+        return [index[n] for n in nodes]
+
+    def decode(self, ints):
+        """Return a list of the labels of the integers in ints, e.g.
+        a path or a component."""
+        labels=self.labels
+        first=self.first_label
+        return [labels[i-first] for i in ints]
+
+    def decode_dict(self, d, values=False):
+        """Return a copy of d with integer keys replaced by labels.
+
+        If values is True the values (nodes or lists of nodes, such as
+        paths) are decoded too.
+        """
+        labels=self.labels
+        first=self.first_label
+        if not values:
+            return dict((labels[i-first],x) for i,x in d.iteritems())
+        result={}
+        for i,x in d.iteritems():
+            if isinstance(x,(list,tuple)):
+                x=[labels[j-first] for j in x]
+            else:
+                x=labels[x-first]
+            result[labels[i-first]]=x
+        return result
+
+def integer_labels(G, first_label=0, ordering='default'):
+    """Return a NodeLabels table for the nodes of G.
+
+    Parameters
+    ----------
+    G : graph
+    first_label : int
+       Integer of the first node.
+    ordering : string or sequence of nodes
+       'default' : the order of G.nodes_iter()
+       'sorted' : sorted node labels
+       'increasing degree', 'decreasing degree' : by degree (in plus
+          out degree for a DiGraph)
+       A sequence of all nodes of G (e.g. the order they were read or
+       added in) is used as given.
+    """
+    if ordering=='default':
+        nodes=G.nodes_iter()
+    elif ordering=='sorted':
+        nodes=sorted(G.nodes_iter())
+    elif ordering=='increasing degree':
+        dv=sorted((d,n) for n,d in G.degree_iter())
+        nodes=[n for d,n in dv]
+    elif ordering=='decreasing degree':
+        dv=sorted(((d,n) for n,d in G.degree_iter()),reverse=True)
+        nodes=[n for d,n in dv]
+    elif is_string_like(ordering):
+        raise NetworkXError("Unknown node ordering: %s"%(ordering,))
+    else:
+        nodes=list(ordering)
+        if len(nodes)!=len(G) or len(set(nodes))!=len(G) or \
+               [n for n in nodes if n not in G]:
+            raise NetworkXError("The ordering must contain each node once.")
+    return NodeLabels(nodes,first_label)
+
+def relabel_to_integers(G, first_label=0, ordering='default', labels=None):
+    """Return (H, labels), a copy H of G with integer nodes and the
+    NodeLabels table between the nodes of G and H.
+
+    Parameters
+    ----------
+    G : Graph or DiGraph
+    first_label, ordering :
+       See integer_labels().
+    labels : NodeLabels, optional
+       Table to use instead of a new one, e.g. to relabel several
+       graphs on the same nodes alike.
+
+    H is an instance of the class of G.  Like subgraph(), H shares the
+    node attribute and edge data dicts with G; the graph attributes are
+    copied.
+    """
+    if labels is None:
+        labels=integer_labels(G,first_label,ordering)
+    elif len(labels)!=len(G):
+        raise NetworkXError("The table must contain each node once.")
+    index=labels.index
+    H=G.__class__()
+    if hasattr(G,'_adopt'):
+        # H shares the attributes stored in the columns of G
+        G._adopt(H)
+    H.name=G.name
+    H.graph=G.graph.copy()
+    G_node=G.node
+    try:
+        H.node=dict((index[n],G_node[n]) for n in G_node)
+        if G.is_directed():
+            H_succ=H.succ
+            H_pred=H.pred
+            for n in labels.labels:
+                H_pred[index[n]]={}
+            for u,nbrs in G.succ.iteritems():
+                iu=index[u]
+                row={}
+                for v,d in nbrs.iteritems():
+                    iv=index[v]
+                    row[iv]=d
+                    H_pred[iv][iu]=d
+                H_succ[iu]=row
+        else:
+            H_adj=H.adj
+            for u,nbrs in G.adj.iteritems():
+                H_adj[index[u]]=dict((index[v],d) for v,d in nbrs.iteritems())
+    except KeyError, e:
+        raise NetworkXError("The node %s is not in the table."%(e.args[0],))
+    H._nedges=G.number_of_edges()
+    H._nselfloops=G.number_of_selfloops()
+    return H,labels
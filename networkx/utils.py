@@ -6,6 +6,10 @@ __author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult(dschult@colgate.edu)
 #    All rights reserved.
 #    BSD license.
 import random
+from array import array
+import sys
+import types
+from networkx.exception import NetworkXError
 
 ### some cookbook stuff
 
@@ -79,6 +83,56 @@ def _get_fh(path, mode='r'):
     return fh
 
 
+class LazyModule(types.ModuleType):
+    """A module whose attributes are imported on first access.
+
+    LazyModule(module, attrs) copies the namespace of module; attrs
+    maps further attribute names to the name of the module defining
+    them, or to a function returning the value.  The value is loaded on
+    first access and then stored in the module.  Packages replace
+    themselves in sys.modules with a LazyModule so that expensive
+    submodules are only imported when used.
+
+    >>> import types
+    >>> m=LazyModule(types.ModuleType('m'),{'sqrt':'math'})
+    >>> m.sqrt(4.0)
+    2.0
+    """
+    def __init__(self, module, attrs):
+        types.ModuleType.__init__(self,module.__name__,module.__doc__)
+        self.__dict__.update(module.__dict__)
+        # Python 2 clears the globals of a module object when it is
+        # deleted, so keep the original module alive
+        self._lazy_module=module
+        self._lazy_attrs=dict(attrs)
+
+    def __getattr__(self, name):
+        try:
+            loader=self.__dict__['_lazy_attrs'][name]
+        except KeyError:
+            if name=='__all__':
+                # for "from module import *", load everything
+                return [n for n in dir(self) if not n.startswith('_')]
+            raise AttributeError("'module' object has no attribute '%s'"\
+                                 %(name,))
+        if callable(loader):
+            value=loader()
+        else:
+            value=getattr(_import_module(loader),name)
+        setattr(self,name,value)
+        return value
+
+    def __dir__(self):
+        names=set(self.__dict__)
+        names.update(self._lazy_attrs)
+        return sorted(names)
+
+def _import_module(name):
+    """Import the module name (e.g. 'a.b.c') and return it."""
+    __import__(name)
+    return sys.modules[name]
+
+
 ##def iterable(obj):
 ##  """ Return True if obj is iterable with a well-defined len()"""
 ##    try:
@@ -89,68 +143,218 @@ def _get_fh(path, mode='r'):
 ##      return True
 
 
+# Random number streams.  Every sampling helper below takes a seed
+# argument: None uses the global state of the random module (or of
+# numpy.random), an integer seeds a private generator, and a
+# random.Random (or numpy RandomState) instance is used as it is.
+# Pass the same seed to get the same sequence again.
+
+def create_random_state(seed=None):
+    """Return a random.Random instance for seed.
+
+    seed=None returns the generator behind the functions of the random
+    module, an integer a new generator seeded with it and a
+    random.Random instance itself.
+
+    >>> rng=create_random_state(42)
+    >>> rng.random()==create_random_state(42).random()
+    True
+    """
+    if seed is None:
+        return random._inst
+    if isinstance(seed,random.Random):
+        return seed
+    if isinstance(seed,(int,long)):
+        return random.Random(seed)
+    raise NetworkXError("%r cannot be used to seed a random.Random instance."\
+                        %(seed,))
+
+def create_numpy_random_state(seed=None):
+    """Return a numpy.random.RandomState instance for seed.
+
+    Like create_random_state(): None returns the global state of
+    numpy.random, an integer a new RandomState seeded with it (using
+    all of its bits) and a RandomState instance itself.  A
+    random.Random instance seeds a new RandomState with 128 bits drawn
+    from it.
+    """
+    import numpy
+    if seed is None:
+        return numpy.random.mtrand._rand
+    if isinstance(seed,numpy.random.RandomState):
+        return seed
+    if isinstance(seed,random.Random):
+        seed=seed.getrandbits(128)
+    if isinstance(seed,(int,long)):
+        if seed<0:
+            raise NetworkXError("The seed %d is negative."%(seed,))
+        if seed<2**32:
+            return numpy.random.RandomState(seed)
+        # RandomState takes larger seeds as arrays of 32 bit words
+        words=[]
+        while seed:
+            words.append(seed&0xffffffff)
+            seed>>=32
+        return numpy.random.RandomState(words)
+    raise NetworkXError("%r cannot be used to seed a RandomState instance."\
+                        %(seed,))
+
+def spawn_seeds(seed, n):
+    """Return a list of n seeds for independent child random streams.
+
+    The child seeds are 128 bit integers hashed from the root seed and
+    the index of the child, so generators seeded with them (see
+    create_random_state()) give streams that are, for all practical
+    purposes, independent and non-overlapping.  A given seed always
+    spawns the same children, and a child seed can spawn children in
+    turn.  seed may be an integer, a random.Random instance (128 bits
+    are drawn from it for the root seed) or None (the root seed comes
+    from the operating system, so the children are not reproducible).
+
+    >>> spawn_seeds(7,3)==spawn_seeds(7,3)
+    True
+    >>> len(set(spawn_seeds(7,3)))
+    3
+    """
+    import hashlib
+    if seed is None:
+        seed=random.SystemRandom().getrandbits(128)
+    elif isinstance(seed,random.Random):
+        seed=seed.getrandbits(128)
+    elif not isinstance(seed,(int,long)):
+        raise NetworkXError("%r cannot be used as a root seed."%(seed,))
+    return [long(hashlib.sha1("%d:%d"%(seed,i)).hexdigest()[:32],16)
+            for i in xrange(n)]
+
+def _sequence_chunk(task):
+    """Draw a chunk of a sequence in a worker process."""
+    sequence,n,seed,args=task
+    return sequence(n,*args,**{'seed':seed})
+
+def parallel_sequence(sequence, n, seed=None, args=(), processes=None,
+                      chunksize=1<<20):
+    """Return a sample sequence of length n drawn in a process pool.
+
+    Parameters
+    ----------
+    sequence : function
+       A sequence helper of this module, e.g. powerlaw_sequence, or any
+       module level function called as sequence(n, *args, seed=seed).
+    n : int
+       Length of the sequence.
+    seed : integer, random.Random instance or None
+       Root seed, see spawn_seeds().
+    args : tuple
+       Further arguments for sequence.
+    processes : int, optional
+       Number of worker processes, default the number of CPUs.  With
+       processes=1 the chunks are drawn in this process.
+    chunksize : int
+       Number of samples per chunk.
+
+    Chunk i is drawn from the i-th child stream of seed, so the result
+    depends only on seed and chunksize and is the same for any number
+    of processes.  The chunks are joined into a list, or into a NumPy
+    array if sequence returns arrays.  Each chunk is drawn with its own
+    length as n, so the distribution should not depend on n
+    (uniform_sequence, whose range is [0,n), does).
+
+    >>> s=parallel_sequence(powerlaw_sequence,10,seed=1,args=(2.5,),
+    ...                     processes=2,chunksize=3)
+    >>> s==parallel_sequence(powerlaw_sequence,10,seed=1,args=(2.5,),
+    ...                      processes=1,chunksize=3)
+    True
+    """
+    if chunksize<1:
+        raise NetworkXError("chunksize must be positive.")
+    starts=range(0,n,chunksize)
+    seeds=spawn_seeds(seed,len(starts))
+    tasks=[(sequence,min(chunksize,n-start),s,tuple(args))
+           for start,s in zip(starts,seeds)]
+    if processes is None:
+        try:
+            import multiprocessing
+            processes=multiprocessing.cpu_count()
+        except (ImportError,NotImplementedError):
+            processes=1
+    if processes>1 and len(tasks)>1:
+        import multiprocessing
+        pool=multiprocessing.Pool(min(processes,len(tasks)))
+        try:
+            chunks=pool.map(_sequence_chunk,tasks)
+            pool.close()
+        finally:
+            pool.terminate()
+    else:
+        chunks=map(_sequence_chunk,tasks)
+    if not chunks:
+        return []
+    if isinstance(chunks[0],list):
+        seq=[]
+        for chunk in chunks:
+            seq.extend(chunk)
+        return seq
+    import numpy
+    return numpy.concatenate(chunks)
+
+
 # some helpers for choosing random sequences from distributions
-# uses scipy: www.scipy.org
+# uses numpy.random (as shipped with scipy): www.scipy.org
+# The samples are drawn from a RandomState, see
+# create_numpy_random_state(), so no global state is reseeded.
 
-def scipy_pareto_sequence(n,exponent=1.0):
+def scipy_pareto_sequence(n,exponent=1.0,seed=None):
     """
     Return sample sequence of length n from a Pareto distribution.
 
     """
     try: 
-        import scipy.stats as stats
+        import numpy
     except ImportError:
-        print "Import error: not able to import scipy"
+        print "Import error: not able to import numpy"
         return
-    random._inst = random.Random()
-    stats.seed(random.randint(1,2**30),random.randint(1,2**30))
-    return stats.pareto(exponent,size=n)
+    # numpy draws the Pareto distribution shifted to start at 0
+    return create_numpy_random_state(seed).pareto(exponent,size=n)+1
 
 
-def scipy_powerlaw_sequence(n,exponent=2.0):
+def scipy_powerlaw_sequence(n,exponent=2.0,seed=None):
     """
     Return sample sequence of length n from a power law distribution.
 
     """
     try: 
-        import scipy.stats as stats
+        import numpy
     except ImportError:
-        print "Import error: not able to import scipy"
+        print "Import error: not able to import numpy"
         return
-    random._inst = random.Random()
-    stats.seed(random.randint(1,2**30),random.randint(1,2**30))
-    return stats.pareto(exponent-1,size=n)
+    return create_numpy_random_state(seed).pareto(exponent-1,size=n)+1
 
 
-def scipy_poisson_sequence(n,mu=1.0):
+def scipy_poisson_sequence(n,mu=1.0,seed=None):
     """
     Return sample sequence of length n from a Poisson distribution.
 
     """
     try: 
-        import scipy.stats as stats
+        import numpy
     except ImportError:
-        print "Import error: not able to import scipy"
+        print "Import error: not able to import numpy"
         return
-    random._inst = random.Random()
-    stats.seed(random.randint(1,2**30),random.randint(1,2**30))
-    return stats.poisson(mu,size=n)
+    return create_numpy_random_state(seed).poisson(mu,size=n)
 
-def scipy_uniform_sequence(n):
+def scipy_uniform_sequence(n,seed=None):
     """
     Return sample sequence of length n from a uniform distribution.
 
     """
     try: 
-        import scipy.stats as stats
+        import numpy
     except ImportError:
-        print "Import error: not able to import scipy"
+        print "Import error: not able to import numpy"
         return
-    random._inst = random.Random()
-    stats.seed(random.randint(1,2**30),random.randint(1,2**30))
-    return stats.uniform(size=n)
+    return create_numpy_random_state(seed).uniform(size=n)
 
-def scipy_discrete_sequence(n,distribution=False):
+def scipy_discrete_sequence(n,distribution=False,seed=None):
     """
     Return sample sequence of length n from a given discrete distribution
 
@@ -158,55 +362,41 @@ def scipy_discrete_sequence(n,distribution=False):
 
     """
     try: 
-        import scipy.stats as stats
+        import numpy
     except ImportError:
-        print "Import error: not able to import scipy"
+        print "Import error: not able to import numpy"
         return
-    import bisect
     if not distribution:
         return "no distribution specified"
-    p=distribution
-    random._inst = random.Random()
-
-    # make CDF out of distribution to use for sample
-    cdf=[]
-    cdf.append(0.0)
-    psum=float(sum(p))
-    for i in range(0,len(p)):
-        cdf.append(cdf[i]+p[i]/psum)
-
-    # get a uniform random number
-    stats.seed(random.randint(1,2**30),random.randint(1,2**30))
-    inputseq=stats.uniform(size=n)
-
-    # choose from CDF
-    seq=[bisect.bisect_left(cdf,s)-1 for s in inputseq]
-    return seq
+    return AliasSampler(distribution).sample_array(n,seed=seed).tolist()
 
 
 # The same helpers for choosing random sequences from distributions
 # uses Python's random module
 # http://www.python.org/doc/current/lib/module-random.html
 
-def pareto_sequence(n,exponent=1.0):
+def pareto_sequence(n,exponent=1.0,seed=None):
     """
     Return sample sequence of length n from a Pareto distribution.
     """
-    return [random.paretovariate(exponent) for i in xrange(n)]
+    paretovariate=create_random_state(seed).paretovariate
+    return [paretovariate(exponent) for i in xrange(n)]
 
 
-def powerlaw_sequence(n,exponent=2.0):
+def powerlaw_sequence(n,exponent=2.0,seed=None):
     """
     Return sample sequence of length n from a power law distribution.
     """
-    return [random.paretovariate(exponent-1) for i in xrange(n)]
+    paretovariate=create_random_state(seed).paretovariate
+    return [paretovariate(exponent-1) for i in xrange(n)]
 
 
-def uniform_sequence(n):
+def uniform_sequence(n,seed=None):
     """
     Return sample sequence of length n from a uniform distribution.
     """
-    return [ random.uniform(0,n) for i in xrange(n)]
+    uniform=create_random_state(seed).uniform
+    return [ uniform(0,n) for i in xrange(n)]
 
 
 def cumulative_distribution(distribution):
@@ -220,7 +410,7 @@ def cumulative_distribution(distribution):
     return cdf        
 
 
-def discrete_sequence(n, distribution=None, cdistribution=None):
+def discrete_sequence(n, distribution=None, cdistribution=None, seed=None):
     """
     Return sample sequence of length n from a given discrete distribution
     or discrete cumulative distribution. 
@@ -231,24 +421,111 @@ def discrete_sequence(n, distribution=None, cdistribution=None):
     
     cdistribution = normalized discrete cumulative distribution
 
+    The samples are drawn with an AliasSampler, in O(1) time each.
     """
-    import bisect
-
     if cdistribution is not None:
-        cdf=cdistribution
-    elif distribution is not None:
-        cdf=cumulative_distribution(distribution)
-    else:
-        raise InputError, \
-                  "discrete_sequence: distribution or cdistribution missing"
-        
-
-    # get a uniform random number
-    inputseq=[random.random() for i in xrange(n)]
-
-    # choose from CDF
-    seq=[bisect.bisect_left(cdf,s)-1 for s in inputseq]
-    return seq
+        # the probabilities are the steps of the cumulative distribution
+        distribution=[cdistribution[i+1]-cdistribution[i]
+                      for i in xrange(len(cdistribution)-1)]
+    elif distribution is None:
+        raise NetworkXError(\
+                  "discrete_sequence: distribution or cdistribution missing")
+    return AliasSampler(distribution).sample(n,seed=seed)
+
+class AliasSampler(object):
+    """Draw integers 0..k-1 with probabilities proportional to the k
+    values of a histogram, in O(1) time per sample.
+
+    Walker's alias method (in Vose's formulation): the table built in
+    O(k) time has for each i a probability prob[i] and an alias
+    alias[i].  A sample picks i uniformly and returns i with
+    probability prob[i], otherwise alias[i].
+
+    sample() draws with the random module, sample_array() with NumPy
+    when it is installed; both take a seed, see create_random_state().
+
+    >>> s=AliasSampler([0,1,0,3])
+    >>> sorted(set(s.sample(100)))
+    [1, 3]
+    """
+    def __init__(self, distribution):
+        p=list(distribution)
+        k=len(p)
+        if k==0:
+            raise NetworkXError("The distribution is empty.")
+        for x in p:
+            if x<0:
+                raise NetworkXError(\
+                    "The distribution has a negative value %s."%(x,))
+        total=float(sum(p))
+        if total<=0:
+            raise NetworkXError("The distribution sums to zero.")
+        scaled=[x*k/total for x in p]
+        prob=array('d',[1.0])*k
+        alias=array('l',xrange(k))
+        small=[i for i in xrange(k) if scaled[i]<1.0]
+        large=[i for i in xrange(k) if scaled[i]>=1.0]
+        while small and large:
+            s=small.pop()
+            l=large.pop()
+            prob[s]=scaled[s]
+            alias[s]=l
+            scaled[l]=(scaled[l]+scaled[s])-1.0
+            if scaled[l]<1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # what is left has probability 1 up to rounding errors
+        self.k=k
+        self.prob=prob
+        self.alias=alias
+
+    def __len__(self):
+        return self.k
+
+    def sample(self, n=None, seed=None):
+        """Return a list of n samples, or one sample if n is None."""
+        rand=create_random_state(seed).random
+        k=self.k
+        prob=self.prob
+        alias=self.alias
+        if n is None:
+            u=rand()*k
+            i=int(u)
+            if u-i<prob[i]:
+                return i
+            return alias[i]
+        seq=[]
+        append=seq.append
+        for j in xrange(n):
+            # the fractional part of u is the second uniform draw
+            u=rand()*k
+            i=int(u)
+            if u-i<prob[i]:
+                append(i)
+            else:
+                append(alias[i])
+        return seq
+
+    def sample_array(self, n, seed=None):
+        """Return n samples as a NumPy integer array drawn with
+        numpy.random, or as an array('l') drawn with sample() if NumPy
+        is not installed.
+
+        seed is as for create_numpy_random_state(), or for
+        create_random_state() without NumPy.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return array('l',self.sample(n,seed))
+        if not hasattr(self,'_numpy_table'):
+            self._numpy_table=(numpy.frombuffer(self.prob,dtype=numpy.double),
+                               numpy.frombuffer(self.alias,dtype=numpy.int_))
+        prob,alias=self._numpy_table
+        rs=create_numpy_random_state(seed)
+        i=rs.randint(0,self.k,size=n)
+        return numpy.where(rs.random_sample(n)<prob[i],i,alias[i])
 
 class UnionFind:
     def __init__(self):
@@ -289,3 +566,155 @@ class UnionFind:
             if r != heaviest:
                 self.weights[heaviest] += self.weights[r]
                 self.parents[r] = heaviest
+
+
+class ArrayUnionFind(object):
+    """Union-find structure storing its forest in integer arrays.
+
+    Works like UnionFind, but each object is given an integer index on
+    first use and the parent and rank of index i are kept in
+    contiguous arrays.  Finds use iterative path halving and unions
+    use union by rank, so any sequence of operations runs in nearly
+    linear time.  Use union_edges() to merge many pairs in one call.
+
+    >>> uf=ArrayUnionFind()
+    >>> uf.union_edges([(1,2),(3,4),(2,5)])
+    3
+    >>> uf[5]==uf[1]
+    True
+    >>> sorted(map(sorted,uf.components()))
+    [[1, 2, 5], [3, 4]]
+    """
+    def __init__(self, objects=None):
+        """Create a new union-find structure holding the objects."""
+        self.index = {}        # object -> index
+        self.objects = []      # index -> object
+        self.parent = array('l')
+        self.rank = array('B') # ranks are at most log2(len(self))
+        if objects is not None:
+            for x in objects:
+                self._index(x)
+
+    def _index(self, object):
+        """Return the index of object, adding it as a singleton set."""
+        try:
+            return self.index[object]
+        except KeyError:
+            i = len(self.objects)
+            self.index[object] = i
+            self.objects.append(object)
+            self.parent.append(i)
+            self.rank.append(0)
+            return i
+
+    def _find(self, i):
+        """Return the index of the root of the set containing index i."""
+        parent = self.parent
+        while parent[i] != i:
+            # path halving: point i to its grandparent and move there
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _link(self, i, j):
+        """Merge the sets with roots i != j, return the new root."""
+        rank = self.rank
+        if rank[i] < rank[j]:
+            i, j = j, i
+        self.parent[j] = i
+        if rank[i] == rank[j]:
+            rank[i] += 1
+        return i
+
+    def __getitem__(self, object):
+        """Find and return the name of the set containing the object."""
+        return self.objects[self._find(self._index(object))]
+
+    def __iter__(self):
+        """Iterate through all items ever found or unioned by this structure."""
+        return iter(self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def union(self, *objects):
+        """Find the sets containing the objects and merge them all."""
+        roots = [self._find(self._index(x)) for x in objects]
+        if not roots:
+            return
+        root = roots[0]
+        for r in roots[1:]:
+            if r != root:
+                root = self._link(root, r)
+
+    def union_edges(self, edges):
+        """Merge the sets of u and v for each pair (u,v) in edges.
+
+        Returns the number of merges, i.e. of pairs whose objects were
+        in different sets.
+        """
+        merges = 0
+        for e in self.union_edges_iter(edges):
+            merges += 1
+        return merges
+
+    def union_edges_iter(self, edges):
+        """Merge the sets of u and v for each edge (u,v,...) in edges,
+        and yield the edges whose nodes were in different sets.
+
+        Kruskal's algorithm is this applied to edges sorted by weight.
+        """
+        index = self.index
+        objects = self.objects
+        parent = self.parent
+        rank = self.rank
+        for e in edges:
+            u = e[0]
+            v = e[1]
+            # adds and finds with path halving, inlined for speed
+            i = index.get(u)
+            if i is None:
+                i = len(objects)
+                index[u] = i
+                objects.append(u)
+                parent.append(i)
+                rank.append(0)
+            else:
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+            j = index.get(v)
+            if j is None:
+                j = len(objects)
+                index[v] = j
+                objects.append(v)
+                parent.append(j)
+                rank.append(0)
+            else:
+                while parent[j] != j:
+                    parent[j] = parent[parent[j]]
+                    j = parent[j]
+            if i == j:
+                continue
+            ri = rank[i]
+            rj = rank[j]
+            if ri < rj:
+                parent[i] = j
+            else:
+                parent[j] = i
+                if ri == rj:
+                    rank[i] = ri + 1
+            yield e
+
+    def components(self):
+        """Return the sets of the structure as a list of lists."""
+        objects = self.objects
+        find = self._find
+        groups = {}
+        for i in xrange(len(objects)):
+            root = find(i)
+            try:
+                groups[root].append(objects[i])
+            except KeyError:
+                groups[root] = [objects[i]]
+        return groups.values()